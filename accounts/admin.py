@@ -1,7 +1,7 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
 
-from .models import CustomUser
+from .models import CustomUser, UserRoleCount
 
 
 @admin.register(CustomUser)
@@ -95,3 +95,13 @@ class CustomUserAdmin(UserAdmin):
             obj.is_staff = form.cleaned_data.get("is_staff", obj.is_staff)
             obj.is_superuser = form.cleaned_data.get("is_superuser", obj.is_superuser)
             obj.save()
+
+
+@admin.register(UserRoleCount)
+class UserRoleCountAdmin(admin.ModelAdmin):
+    """
+    역할별 사용자 수 카운터를 조회하기 위한 관리자 클래스입니다.
+    """
+
+    list_display = ("role", "count", "updated_at")
+    readonly_fields = ("role", "count", "updated_at")
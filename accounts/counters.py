@@ -0,0 +1,50 @@
+from django.db import transaction
+from django.db.models import Count, F, Q
+
+from .models import CustomUser, UserRoleCount
+
+
+class UserRoleCounter:
+    """
+    역할별 사용자 수 카운터를 관리하는 클래스입니다.
+    - 조회 시 CustomUser 전체를 COUNT하지 않고 카운터 테이블의 행만 읽습니다.
+    - 카운터 행이 없으면 한 번의 집계로 다시 구성합니다.
+    """
+
+    role_filters = {
+        UserRoleCount.Role.STUDENT: Q(is_staff=False, is_superuser=False),
+        UserRoleCount.Role.TUTOR: Q(is_staff=True, is_superuser=False),
+    }
+
+    def get_counts(self):
+        """
+        역할별 사용자 수를 딕셔너리로 반환합니다.
+        """
+        counts = dict(UserRoleCount.objects.values_list("role", "count"))
+        if len(counts) < len(self.role_filters):
+            counts = self.reconcile()
+        return counts
+
+    def adjust(self, role, delta):
+        """
+        해당 역할의 사용자 수를 delta만큼 증감합니다.
+        - 카운터 행이 아직 없으면 다음 조회 시 재집계되므로 무시합니다.
+        """
+        if role is None or not delta:
+            return 0
+        return UserRoleCount.objects.filter(role=role).update(count=F("count") + delta)
+
+    @transaction.atomic
+    def reconcile(self):
+        """
+        CustomUser 테이블을 집계하여 카운터를 실제 값으로 보정합니다.
+        """
+        counts = CustomUser.objects.aggregate(
+            **{
+                role: Count("id", filter=role_filter)
+                for role, role_filter in self.role_filters.items()
+            }
+        )
+        for role, count in counts.items():
+            UserRoleCount.objects.update_or_create(role=role, defaults={"count": count})
+        return counts
@@ -0,0 +1,156 @@
+import csv
+import io
+import time
+
+from django.db import transaction
+from rest_framework.exceptions import ValidationError
+
+from .models import CustomUser
+
+
+class BulkEnrollmentService:
+    """
+    강사(tutor)와 학생(student)의 수강 관계를 대량으로 등록하는 클래스입니다.
+    - 사용자 역할은 청크 단위의 집합 쿼리로 한 번에 검증합니다.
+    - 관계 행은 중간 테이블에 bulk_create(ignore_conflicts=True)로 청크 단위 삽입합니다.
+    - 중간 테이블에 직접 삽입하므로 m2m_changed 시그널은 발생하지 않습니다.
+    """
+
+    chunk_size = 1000
+    max_reported_errors = 100
+
+    def __init__(self, chunk_size=None):
+        if chunk_size:
+            self.chunk_size = chunk_size
+        self.through = CustomUser.students.through
+
+    def parse_csv(self, stream):
+        """
+        tutor_id, student_id 헤더를 갖는 CSV 스트림을 (행 번호, 강사 ID, 학생 ID) 목록으로 변환합니다.
+        - 바이너리 스트림(업로드 파일 등)은 TextIOWrapper로 감싸 파일 전체를 메모리에 읽지 않고 행 단위로 디코딩합니다.
+        - 행 번호는 헤더를 제외하고 1부터 시작하며, JSON pairs의 행 번호와 같은 기준입니다.
+        UTF-8이 아닌 파일(예: CP949로 저장한 Excel CSV)이나 CSV 형식이 아니면 ValidationError를 발생시킵니다.
+        """
+        if isinstance(stream, bytes):
+            stream = io.BytesIO(stream)
+        elif isinstance(stream, str):
+            stream = io.StringIO(stream)
+
+        text_stream = stream
+        if not isinstance(stream, io.TextIOBase):
+            text_stream = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+        try:
+            return [
+                (row, record.get("tutor_id"), record.get("student_id"))
+                for row, record in enumerate(csv.DictReader(text_stream), start=1)
+            ]
+        except UnicodeDecodeError:
+            raise ValidationError({"file": "CSV 파일은 UTF-8로 인코딩되어야 합니다."})
+        except csv.Error as e:
+            raise ValidationError({"file": f"CSV 파일을 읽을 수 없습니다: {e}"})
+        finally:
+            # 래퍼가 정리될 때 원본 스트림(업로드 파일)을 닫지 않도록 분리합니다.
+            if text_stream is not stream:
+                text_stream.detach()
+
+    def parse_pairs(self, pairs):
+        """
+        [{"tutor_id": 1, "student_id": 2}, ...] 목록을 (행 번호, 강사 ID, 학생 ID) 목록으로 변환합니다.
+        - 행 번호는 1부터 시작하며, CSV의 행 번호와 같은 기준입니다.
+        """
+        return [
+            (row, pair.get("tutor_id"), pair.get("student_id"))
+            for row, pair in enumerate(pairs, start=1)
+        ]
+
+    def enroll(self, pairs, allowed_tutor_id=None):
+        """
+        (행 번호, 강사 ID, 학생 ID) 목록을 검증하고 수강 관계를 등록합니다.
+        - allowed_tutor_id가 주어지면 해당 강사에 대한 등록만 허용합니다.
+        - 등록 결과와 처리량을 딕셔너리로 반환합니다.
+        """
+        started_at = time.monotonic()
+        errors = []
+        valid_pairs = {}
+
+        parsed = []
+        for row, tutor_id, student_id in pairs:
+            try:
+                parsed.append((row, int(tutor_id), int(student_id)))
+            except (TypeError, ValueError):
+                errors.append(
+                    self._error(row, tutor_id, student_id, "잘못된 ID 형식입니다.")
+                )
+
+        tutor_ids, student_ids = self._get_valid_user_ids(parsed)
+        for row, tutor_id, student_id in parsed:
+            if allowed_tutor_id is not None and tutor_id != allowed_tutor_id:
+                reason = "본인에게만 학생을 등록할 수 있습니다."
+            elif tutor_id not in tutor_ids:
+                reason = "활성화된 강사가 아닙니다."
+            elif student_id not in student_ids:
+                reason = "활성화된 학생이 아닙니다."
+            else:
+                valid_pairs.setdefault((tutor_id, student_id), row)
+                continue
+            errors.append(self._error(row, tutor_id, student_id, reason))
+
+        created = 0
+        keys = list(valid_pairs)
+        for start in range(0, len(keys), self.chunk_size):
+            created += self._insert_chunk(keys[start : start + self.chunk_size])
+
+        elapsed = time.monotonic() - started_at
+        return {
+            "received": len(pairs),
+            "valid": len(valid_pairs),
+            "created": created,
+            "already_enrolled": len(valid_pairs) - created,
+            "invalid": len(errors),
+            "errors": errors[: self.max_reported_errors],
+            "elapsed_seconds": round(elapsed, 3),
+            "pairs_per_second": round(len(pairs) / elapsed) if elapsed else None,
+        }
+
+    def _get_valid_user_ids(self, parsed):
+        """
+        요청에 포함된 사용자 중 활성화된 강사와 학생의 ID 집합을 반환합니다.
+        """
+        user_ids = list(
+            {tutor_id for _, tutor_id, _ in parsed}
+            | {student_id for _, _, student_id in parsed}
+        )
+        tutor_ids, student_ids = set(), set()
+        for start in range(0, len(user_ids), self.chunk_size):
+            for user_id, is_staff in CustomUser.objects.filter(
+                id__in=user_ids[start : start + self.chunk_size], is_active=True
+            ).values_list("id", "is_staff"):
+                (tutor_ids if is_staff else student_ids).add(user_id)
+        return tutor_ids, student_ids
+
+    @transaction.atomic
+    def _insert_chunk(self, keys):
+        """
+        이미 등록된 관계를 제외한 뒤 한 청크의 관계를 삽입하고 새로 등록된 수를 반환합니다.
+        """
+        existing = set(
+            self.through.objects.filter(
+                from_customuser_id__in={tutor_id for tutor_id, _ in keys},
+                to_customuser_id__in={student_id for _, student_id in keys},
+            ).values_list("from_customuser_id", "to_customuser_id")
+        )
+        new_rows = [
+            self.through(from_customuser_id=tutor_id, to_customuser_id=student_id)
+            for tutor_id, student_id in keys
+            if (tutor_id, student_id) not in existing
+        ]
+        self.through.objects.bulk_create(new_rows, ignore_conflicts=True)
+        return len(new_rows)
+
+    def _error(self, row, tutor_id, student_id, reason):
+        return {
+            "row": row,
+            "tutor_id": tutor_id,
+            "student_id": student_id,
+            "reason": reason,
+        }
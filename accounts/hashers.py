@@ -0,0 +1,115 @@
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.apps import apps
+from django.conf import settings
+from django.contrib.auth import hashers
+from django.utils.module_loading import import_string
+
+
+class PasswordHashingPool:
+    """
+    비밀번호 해시 계산을 별도 프로세스 풀에서 수행하는 클래스입니다.
+    - PASSWORD_HASHING_PROCESSES가 0보다 크면 활성화됩니다.
+    - 해시 계산 동안 요청 스레드는 GIL을 놓고 대기하므로 I/O 위주의 다른 요청이 굶지 않습니다.
+    - 워커 프로세스 안에서는 다시 풀을 사용하지 않고 직접 계산합니다.
+    """
+
+    def __init__(self):
+        self._executor = None
+        self._lock = threading.Lock()
+        self.in_worker = False
+
+    @property
+    def enabled(self):
+        return (
+            not self.in_worker
+            and getattr(settings, "PASSWORD_HASHING_PROCESSES", 0) > 0
+        )
+
+    def get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=settings.PASSWORD_HASHING_PROCESSES,
+                    initializer=_init_worker,
+                )
+            return self._executor
+
+    def run(self, hasher_path, method, *args):
+        """
+        해시 클래스의 계산 메서드를 워커 프로세스에서 실행하고 결과를 반환합니다.
+        """
+        future = self.get_executor().submit(_run_inline, hasher_path, method, *args)
+        return future.result()
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+
+password_hashing_pool = PasswordHashingPool()
+
+
+def _init_worker():
+    password_hashing_pool.in_worker = True
+    if not apps.ready:
+        django.setup()
+
+
+def _run_inline(hasher_path, method, *args):
+    hasher = import_string(hasher_path)()
+    return getattr(hasher, f"{method}_inline")(*args)
+
+
+class TunedHasherMixin:
+    """
+    PASSWORD_HASHER_OPTIONS의 알고리즘별 파라미터를 적용하고,
+    프로세스 풀이 활성화되어 있으면 해시 계산을 풀로 넘기는 믹스인입니다.
+    - 알고리즘 이름은 그대로 유지하므로 기존 해시와 호환됩니다.
+    - 파라미터가 바뀌면 must_update가 True가 되어 로그인 시 자동으로 재해시됩니다.
+    """
+
+    def __init__(self):
+        options = getattr(settings, "PASSWORD_HASHER_OPTIONS", {})
+        for name, value in options.get(self.algorithm, {}).items():
+            setattr(self, name, value)
+
+    @property
+    def hasher_path(self):
+        return f"{type(self).__module__}.{type(self).__qualname__}"
+
+    def encode(self, password, salt, *args):
+        if password_hashing_pool.enabled:
+            return password_hashing_pool.run(
+                self.hasher_path, "encode", password, salt, *args
+            )
+        return self.encode_inline(password, salt, *args)
+
+    def verify(self, password, encoded):
+        if password_hashing_pool.enabled:
+            return password_hashing_pool.run(
+                self.hasher_path, "verify", password, encoded
+            )
+        return self.verify_inline(password, encoded)
+
+    def encode_inline(self, password, salt, *args):
+        return super().encode(password, salt, *args)
+
+    def verify_inline(self, password, encoded):
+        return super().verify(password, encoded)
+
+
+class PBKDF2PasswordHasher(TunedHasherMixin, hashers.PBKDF2PasswordHasher):
+    pass
+
+
+class ScryptPasswordHasher(TunedHasherMixin, hashers.ScryptPasswordHasher):
+    pass
+
+
+class Argon2PasswordHasher(TunedHasherMixin, hashers.Argon2PasswordHasher):
+    pass
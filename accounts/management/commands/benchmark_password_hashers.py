@@ -0,0 +1,44 @@
+import os
+import time
+
+from django.conf import settings
+from django.contrib.auth.hashers import get_hashers
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    """
+    설정된 비밀번호 해시 알고리즘의 코어당 초당 해시 수를 측정합니다.
+    """
+
+    help = "PASSWORD_HASHERS에 설정된 알고리즘별 코어당 초당 해시 수를 측정합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--iterations", type=int, default=10, help="알고리즘별 해시 반복 횟수"
+        )
+
+    def handle(self, *args, **options):
+        iterations = options["iterations"]
+        cpu_count = os.cpu_count() or 1
+        self.stdout.write(
+            f"CPU 코어 {cpu_count}개, 프로세스 풀 {settings.PASSWORD_HASHING_PROCESSES}개"
+        )
+
+        for hasher in get_hashers():
+            encode = getattr(hasher, "encode_inline", hasher.encode)
+            try:
+                started_at = time.perf_counter()
+                for _ in range(iterations):
+                    encode("benchmark-password", hasher.salt())
+                elapsed = time.perf_counter() - started_at
+            except ValueError as e:  # 선택 의존성(argon2-cffi 등)이 없는 경우
+                self.stdout.write(f"{hasher.algorithm}: 건너뜀 ({e})")
+                continue
+
+            per_core = iterations / elapsed
+            self.stdout.write(
+                f"{hasher.algorithm}: 코어당 {per_core:.1f}회/초, "
+                f"해시당 {elapsed / iterations * 1000:.1f}ms, "
+                f"전체 코어 예상 {per_core * cpu_count:.1f}회/초"
+            )
@@ -0,0 +1,50 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.exceptions import ValidationError
+
+from accounts.enrollments import BulkEnrollmentService
+
+
+class Command(BaseCommand):
+    """
+    CSV 파일의 (강사, 학생) 쌍으로 수강 관계를 대량 등록합니다.
+    """
+
+    help = "tutor_id, student_id 헤더를 갖는 CSV 파일로 강사-학생 수강 관계를 대량 등록합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("csv_path", help="등록할 CSV 파일 경로 ('-'이면 표준 입력)")
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=BulkEnrollmentService.chunk_size,
+            help="한 번에 검증하고 삽입할 쌍의 수",
+        )
+
+    def handle(self, *args, **options):
+        service = BulkEnrollmentService(chunk_size=options["chunk_size"])
+        csv_path = options["csv_path"]
+        try:
+            if csv_path == "-":
+                pairs = service.parse_csv(sys.stdin)
+            else:
+                with open(csv_path, newline="", encoding="utf-8-sig") as stream:
+                    pairs = service.parse_csv(stream)
+        except OSError as e:
+            raise CommandError(f"CSV 파일을 읽을 수 없습니다: {e}")
+        except ValidationError as e:
+            raise CommandError(e.detail["file"])
+
+        result = service.enroll(pairs)
+        for error in result["errors"]:
+            self.stderr.write(
+                f"{error['row']}행 ({error['tutor_id']}, {error['student_id']}): {error['reason']}"
+            )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{result['received']}건 중 {result['created']}건 등록, "
+                f"{result['already_enrolled']}건 기존 등록, {result['invalid']}건 오류 "
+                f"({result['elapsed_seconds']}초, {result['pairs_per_second']}건/초)"
+            )
+        )
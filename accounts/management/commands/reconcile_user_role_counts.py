@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from accounts.counters import UserRoleCounter
+
+
+class Command(BaseCommand):
+    """
+    역할별 사용자 수 카운터를 CustomUser 테이블 기준으로 보정합니다.
+    """
+
+    help = "역할별 사용자 수 카운터(UserRoleCount)를 실제 사용자 수로 보정합니다."
+
+    def handle(self, *args, **options):
+        counts = UserRoleCounter().reconcile()
+        summary = ", ".join(f"{role}={count}" for role, count in counts.items())
+        self.stdout.write(
+            self.style.SUCCESS(f"역할별 사용자 수를 보정했습니다. ({summary})")
+        )
@@ -0,0 +1,22 @@
+# Generated by Django 5.1.1 on 2026-10-19 12:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0006_remove_customuser_profile_image'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserRoleCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('role', models.CharField(choices=[('student', '학생'), ('tutor', '강사')], max_length=20, unique=True, verbose_name='역할')),
+                ('count', models.IntegerField(default=0, verbose_name='사용자 수')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='갱신 일자')),
+            ],
+        ),
+    ]
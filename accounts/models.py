@@ -22,6 +22,13 @@ class CustomUserManager(UserManager):
         user.save(using=self._db)
         return user
 
+    def get_by_natural_key(self, username):
+        """
+        로그인 시 사용자를 조회합니다.
+        - 토큰 발급에 필요한 프로필 이미지를 함께 조회하여 추가 쿼리를 방지합니다.
+        """
+        return self.select_related("image").get(**{self.model.USERNAME_FIELD: username})
+
     def create_user(self, email, password, nickname, **extra_fields):
         """
         학생(student)를 생성합니다.
@@ -95,10 +102,68 @@ class CustomUser(AbstractUser):
 
     objects = CustomUserManager()
 
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # 학생/강사 목록 조회(is_staff, is_active 필터 + created_at 역순 정렬)용 부분 인덱스
+            models.Index(
+                fields=["-created_at"],
+                condition=models.Q(is_staff=False, is_active=True),
+                name="user_active_student_idx",
+            ),
+            models.Index(
+                fields=["-created_at"],
+                condition=models.Q(is_staff=True, is_active=True),
+                name="user_active_staff_idx",
+            ),
+        ]
+
     def __str__(self):
         return self.email
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        DB에서 불러온 시점의 역할을 기록합니다.
+        - 역할 변경 시 역할별 사용자 수 카운터를 증감하는 데 사용됩니다.
+        - 역할 필드가 지연 로딩(only, defer)된 경우 추가 쿼리를 피하기 위해 기록하지 않습니다.
+        """
+        instance = super().from_db(db, field_names, values)
+        if "is_staff" in instance.__dict__ and "is_superuser" in instance.__dict__:
+            instance._loaded_role = instance.get_role()
+        return instance
+
+    def get_role(self):
+        """
+        역할별 사용자 수 집계에 사용할 역할을 반환합니다.
+        - 관리자(superuser)는 집계 대상이 아니므로 None을 반환합니다.
+        """
+        if self.is_superuser:
+            return None
+        return UserRoleCount.Role.TUTOR if self.is_staff else UserRoleCount.Role.STUDENT
+
     def get_image_url(self):
         if hasattr(self, "image") and hasattr(self.image, "url"):
             return self.image.url
         return "https://paullab.co.kr/images/weniv-licat.png"
+
+
+class UserRoleCount(models.Model):
+    """
+    역할별 사용자 수를 저장하는 카운터 모델입니다.
+    - CustomUser의 post_save/post_delete 시그널로 증감됩니다.
+    - 시그널을 거치지 않는 변경(queryset.update, bulk_create 등)은
+      reconcile_user_role_counts 명령으로 주기적으로 보정합니다.
+    """
+
+    class Role(models.TextChoices):
+        STUDENT = "student", "학생"
+        TUTOR = "tutor", "강사"
+
+    role = models.CharField(
+        max_length=20, choices=Role.choices, unique=True, verbose_name="역할"
+    )
+    count = models.IntegerField(default=0, verbose_name="사용자 수")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="갱신 일자")
+
+    def __str__(self):
+        return f"{self.get_role_display()}: {self.count}"
@@ -2,8 +2,10 @@ from django.contrib.auth.hashers import check_password
 from materials.models import Image
 from materials.serializers import ImageSerializer
 from rest_framework import serializers
+from weaverse.fieldsets import QueryPlan, SparseFieldsetSerializerMixin
 
-from .models import CustomUser
+from .counters import UserRoleCounter
+from .models import CustomUser, UserRoleCount
 
 
 class UserRegistrationSerializer(serializers.ModelSerializer):
@@ -32,6 +34,15 @@ class PasswordResetSerializer(serializers.Serializer):
     new_password = serializers.CharField(write_only=True, required=True)
     confirm_new_password = serializers.CharField(write_only=True, required=True)
 
+    def get_user(self):
+        """
+        요청 사용자를 DB에서 조회합니다.
+        - JWT 인증 사용자는 캐시한 클레임으로만 구성되어 비밀번호 해시가 없습니다.
+        """
+        if not hasattr(self, "_user"):
+            self._user = CustomUser.objects.get(pk=self.context["request"].user.pk)
+        return self._user
+
     def validate_new_password(self, value):
         """
         새로운 비밀번호의 복잡성을 검증합니다.
@@ -67,7 +78,7 @@ class PasswordResetSerializer(serializers.Serializer):
         ):
             raise serializers.ValidationError("새 비밀번호가 일치하지 않습니다.")
 
-        user = self.context["request"].user
+        user = self.get_user()
         if user.check_password(new_password):
             raise serializers.ValidationError(
                 "이전과 동일한 비밀번호를 사용할 수 없습니다."
@@ -78,7 +89,7 @@ class PasswordResetSerializer(serializers.Serializer):
         """
         현재 비밀번호가 맞는지 검증하고 그 값을 반환합니다.
         """
-        user = self.context["request"].user
+        user = self.get_user()
         if not user.check_password(value):
             raise serializers.ValidationError("기존 비밀번호가 올바르지 않습니다.")
         return value
@@ -88,7 +99,7 @@ class PasswordResetSerializer(serializers.Serializer):
         비밀번호를 재설정합니다.
         - 어떠한 데이터도 직렬화하여 반환하지 않는 대신 업데이트된 사용자 객체를 반환합니다.
         """
-        user = self.context["request"].user
+        user = self.get_user()
         new_password = self.validated_data["new_password"]
 
         user.set_password(new_password)
@@ -118,7 +129,9 @@ class TutorListSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "email", "nickname", "created_at"]
 
 
-class CustomUserDetailSerializer(serializers.ModelSerializer):
+class CustomUserDetailSerializer(
+    SparseFieldsetSerializerMixin, serializers.ModelSerializer
+):
     """
     커스텀 사용자의 시리얼라이저입니다.
     """
@@ -131,6 +144,8 @@ class CustomUserDetailSerializer(serializers.ModelSerializer):
 
     profile_image = ImageSerializer(required=False)
 
+    user_role_counter = UserRoleCounter()
+
     class Meta:
         model = CustomUser
         fields = [
@@ -167,6 +182,9 @@ class CustomUserDetailSerializer(serializers.ModelSerializer):
             "password": {"write_only": True},
             "confirm_password": {"write_only": True},
         }  # 보안 강화
+        field_query_plans = {
+            "students": QueryPlan(prefetch_related=["students"]),
+        }
 
     def get_user_type(self, obj):
         """
@@ -178,13 +196,21 @@ class CustomUserDetailSerializer(serializers.ModelSerializer):
             else ("tutor" if not obj.is_superuser else "superuser")
         )
 
+    def get_role_counts(self):
+        """
+        역할별 사용자 수를 카운터 테이블에서 한 번만 조회하여 재사용합니다.
+        """
+        if not hasattr(self, "_role_counts"):
+            self._role_counts = self.user_role_counter.get_counts()
+        return self._role_counts
+
     def get_student_count(self, obj):
         """
         학생 수를 반환합니다.
         - 관리자(superuser)나 강사(tutor)의 경우에만 제공됩니다.
         """
         if obj.is_staff or obj.is_superuser:
-            return CustomUser.objects.filter(is_staff=False, is_superuser=False).count()
+            return self.get_role_counts().get(UserRoleCount.Role.STUDENT, 0)
         return None
 
     def get_tutor_count(self, obj):
@@ -193,7 +219,7 @@ class CustomUserDetailSerializer(serializers.ModelSerializer):
         - 관리자(superuser)의 경우에만 제공됩니다.
         """
         if obj.is_superuser:
-            return CustomUser.objects.filter(is_staff=True, is_superuser=False).count()
+            return self.get_role_counts().get(UserRoleCount.Role.TUTOR, 0)
         return None
 
     def validate_nickname(self, value):
@@ -221,6 +247,7 @@ class CustomUserDetailSerializer(serializers.ModelSerializer):
             .exists()
         ):
             raise serializers.ValidationError({"email": "사용할 수 없는 이메일입니다."})
+        return value
 
     def validate_password(self, value):
         """
@@ -348,3 +375,24 @@ class CustomUserDetailSerializer(serializers.ModelSerializer):
             representation.pop("tutor", None)
 
         return representation
+
+
+class BulkEnrollmentSerializer(serializers.Serializer):
+    """
+    강사-학생 대량 등록 요청을 위한 시리얼라이저입니다.
+    - pairs: [{"tutor_id": 1, "student_id": 2}, ...] 형식의 목록
+    - file: tutor_id, student_id 헤더를 갖는 CSV 파일
+    - 각 쌍의 역할 검증은 BulkEnrollmentService가 집합 쿼리로 수행합니다.
+    """
+
+    pairs = serializers.ListField(
+        child=serializers.DictField(), required=False, allow_empty=False
+    )
+    file = serializers.FileField(required=False)
+
+    def validate(self, data):
+        if bool(data.get("pairs")) == bool(data.get("file")):
+            raise serializers.ValidationError(
+                "pairs 또는 file 중 하나만 입력해야 합니다."
+            )
+        return data
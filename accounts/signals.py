@@ -0,0 +1,42 @@
+from django.contrib.auth.hashers import get_hashers, get_hashers_by_algorithm
+from django.core.signals import setting_changed
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .counters import UserRoleCounter
+from .models import CustomUser
+
+user_role_counter = UserRoleCounter()
+
+
+@receiver(post_save, sender=CustomUser)
+def update_role_count_on_save(sender, instance, created, **kwargs):
+    """
+    사용자가 생성되거나 역할이 바뀌면 역할별 사용자 수를 증감합니다.
+    - DB에서 불러오지 않은 인스턴스의 수정은 이전 역할을 알 수 없으므로 보정 명령에 맡깁니다.
+    """
+    role = instance.get_role()
+    if created:
+        user_role_counter.adjust(role, 1)
+    elif hasattr(instance, "_loaded_role") and instance._loaded_role != role:
+        user_role_counter.adjust(instance._loaded_role, -1)
+        user_role_counter.adjust(role, 1)
+    instance._loaded_role = role
+
+
+@receiver(post_delete, sender=CustomUser)
+def update_role_count_on_delete(sender, instance, **kwargs):
+    """
+    사용자가 삭제되면 역할별 사용자 수를 감소시킵니다.
+    """
+    user_role_counter.adjust(getattr(instance, "_loaded_role", instance.get_role()), -1)
+
+
+@receiver(setting_changed)
+def reset_hashers_on_options_change(setting, **kwargs):
+    """
+    해시 파라미터 설정이 바뀌면 캐시된 해시 클래스 인스턴스를 다시 생성하도록 합니다.
+    """
+    if setting == "PASSWORD_HASHER_OPTIONS":
+        get_hashers.cache_clear()
+        get_hashers_by_algorithm.cache_clear()
@@ -0,0 +1,86 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from accounts.counters import UserRoleCounter
+from accounts.models import UserRoleCount
+from accounts.serializers import CustomUserDetailSerializer
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+class TestUserRoleCounter:
+    @pytest.fixture
+    def counter(self):
+        counter = UserRoleCounter()
+        counter.reconcile()
+        return counter
+
+    @pytest.fixture
+    def admin(self):
+        return User.objects.create_superuser(
+            email="admin@example.com", password="Pass1!", nickname="admin"
+        )
+
+    # Given: 카운터가 초기화된 상태에서
+    # When: 학생과 강사를 생성하면
+    # Then: 시그널로 역할별 사용자 수가 증가해야 합니다.
+    def test_create_user_increments_count(self, counter):
+        User.objects.create_user(
+            email="student@example.com", password="Pass1!", nickname="student"
+        )
+        User.objects.create_staff(
+            email="tutor@example.com", password="Pass1!", nickname="tutor"
+        )
+        assert counter.get_counts() == {"student": 1, "tutor": 1}
+
+    # Given: 학생 사용자가 있을 때
+    # When: 강사로 역할을 변경하거나 삭제하면
+    # Then: 이전 역할과 새 역할의 사용자 수가 함께 갱신되어야 합니다.
+    def test_role_change_and_delete(self, counter):
+        User.objects.create_user(
+            email="student@example.com", password="Pass1!", nickname="student"
+        )
+        user = User.objects.get(email="student@example.com")
+        user.is_staff = True
+        user.save()
+        assert counter.get_counts() == {"student": 0, "tutor": 1}
+
+        user.delete()
+        assert counter.get_counts() == {"student": 0, "tutor": 0}
+
+    # Given: 시그널을 거치지 않고 사용자가 변경되었을 때
+    # When: 보정 명령을 실행하면
+    # Then: 카운터가 실제 사용자 수로 보정되어야 합니다.
+    def test_reconcile_command(self, counter):
+        User.objects.create_user(
+            email="student@example.com", password="Pass1!", nickname="student"
+        )
+        User.objects.update(is_staff=True)
+        assert counter.get_counts() == {"student": 1, "tutor": 0}
+
+        call_command("reconcile_user_role_counts", stdout=None)
+        assert counter.get_counts() == {"student": 0, "tutor": 1}
+
+    # Given: 카운터 행이 없을 때
+    # When: 역할별 사용자 수를 조회하면
+    # Then: 재집계하여 카운터 행을 생성해야 합니다.
+    def test_get_counts_without_rows(self, admin):
+        UserRoleCount.objects.all().delete()
+        assert UserRoleCounter().get_counts() == {"student": 0, "tutor": 0}
+        assert UserRoleCount.objects.count() == 2
+
+    # Given: 관리자 사용자가 있을 때
+    # When: CustomUserDetailSerializer로 직렬화하면
+    # Then: 사용자 테이블을 COUNT하지 않고 카운터를 한 번만 조회해야 합니다.
+    def test_serializer_reads_counter_once(self, counter, admin):
+        with CaptureQueriesContext(connection) as context:
+            data = CustomUserDetailSerializer(admin).data
+        assert data["student_count"] == 0
+        assert data["tutor_count"] == 0
+        queries = [query["sql"] for query in context.captured_queries]
+        assert sum("accounts_userrolecount" in sql for sql in queries) == 1
+        assert not any("COUNT(" in sql for sql in queries)
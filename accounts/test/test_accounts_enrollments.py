@@ -0,0 +1,60 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+
+from accounts.enrollments import BulkEnrollmentService
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+class TestBulkEnrollmentService:
+    @pytest.fixture
+    def tutor(self):
+        return User.objects.create_staff(
+            email="tutor@example.com", password="Pass1!", nickname="tutor"
+        )
+
+    @pytest.fixture
+    def students(self):
+        return [
+            User.objects.create_user(
+                email=f"student{i}@example.com", password="Pass1!", nickname=f"s{i}"
+            )
+            for i in range(5)
+        ]
+
+    # Given: 청크 크기보다 많은 쌍이 주어졌을 때
+    # When: 대량 등록을 수행하면
+    # Then: 사용자 수와 무관하게 청크당 일정한 쿼리로 등록되어야 합니다.
+    def test_enroll_in_chunks(self, tutor, students, django_assert_max_num_queries):
+        service = BulkEnrollmentService(chunk_size=2)
+        pairs = [(i, tutor.id, s.id) for i, s in enumerate(students)]
+        # 사용자 검증 3청크 + 삽입 3청크 x (기존 관계 조회, 삽입, savepoint 2)
+        with django_assert_max_num_queries(15):
+            result = service.enroll(pairs + pairs)
+        assert result["received"] == 10
+        assert result["valid"] == 5
+        assert result["created"] == 5
+        assert tutor.students.count() == 5
+
+    # Given: 비활성화된 학생이 포함되어 있을 때
+    # When: 대량 등록을 수행하면
+    # Then: 해당 쌍은 오류로 보고되어야 합니다.
+    def test_enroll_inactive_student(self, tutor, students):
+        students[0].is_active = False
+        students[0].save()
+        result = BulkEnrollmentService().enroll([(2, tutor.id, students[0].id)])
+        assert result["created"] == 0
+        assert result["errors"][0]["row"] == 2
+
+    # Given: CSV 파일이 주어졌을 때
+    # When: enroll_students 명령을 실행하면
+    # Then: 수강 관계가 등록되어야 합니다.
+    def test_enroll_students_command(self, tmp_path, tutor, students):
+        csv_path = tmp_path / "pairs.csv"
+        csv_path.write_text(
+            "tutor_id,student_id\n" + "".join(f"{tutor.id},{s.id}\n" for s in students)
+        )
+        call_command("enroll_students", str(csv_path), stdout=None)
+        assert tutor.students.count() == 5
@@ -0,0 +1,74 @@
+import pytest
+from django.conf import settings as django_settings
+from django.contrib.auth import authenticate, get_user_model
+from django.contrib.auth.hashers import check_password, get_hasher, make_password
+from django.core.management import call_command
+
+from accounts.hashers import password_hashing_pool
+
+User = get_user_model()
+
+
+@pytest.fixture
+def scrypt_profile(settings):
+    settings.PASSWORD_HASHERS = django_settings.PASSWORD_HASHER_PROFILES["scrypt"]
+    settings.PASSWORD_HASHER_OPTIONS = {"scrypt": {"work_factor": 2**10}}
+
+
+# Given: 설정된 scrypt 파라미터가 있을 때
+# When: scrypt 해시 클래스를 사용하면
+# Then: 설정된 파라미터로 해시해야 합니다.
+def test_hasher_uses_configured_options(scrypt_profile):
+    encoded = make_password("Pass1!")
+    assert encoded.startswith(f"scrypt${2**10}$")
+    assert check_password("Pass1!", encoded)
+
+
+# Given: PBKDF2로 해시된 비밀번호를 가진 사용자가 있을 때
+# When: scrypt 프로필로 변경한 뒤 로그인하면
+# Then: 비밀번호가 scrypt로 재해시되어야 합니다.
+@pytest.mark.django_db
+def test_rehash_on_login(settings):
+    user = User.objects.create_user(
+        email="user@example.com", password="Pass1!", nickname="user"
+    )
+    assert user.password.startswith("pbkdf2_sha256$")
+
+    settings.PASSWORD_HASHERS = django_settings.PASSWORD_HASHER_PROFILES["scrypt"]
+    settings.PASSWORD_HASHER_OPTIONS = {"scrypt": {"work_factor": 2**10}}
+    assert authenticate(email="user@example.com", password="Pass1!") is not None
+    user.refresh_from_db()
+    assert user.password.startswith("scrypt$")
+
+
+# Given: scrypt 파라미터가 변경되었을 때
+# When: 기존 해시를 검사하면
+# Then: 재해시가 필요하다고 판단해야 합니다.
+def test_must_update_when_options_change(settings, scrypt_profile):
+    encoded = make_password("Pass1!")
+    settings.PASSWORD_HASHER_OPTIONS = {"scrypt": {"work_factor": 2**11}}
+    assert get_hasher("scrypt").must_update(encoded)
+
+
+# Given: 프로세스 풀이 활성화되었을 때
+# When: 비밀번호를 해시하고 검증하면
+# Then: 워커 프로세스에서 계산된 결과가 동일하게 검증되어야 합니다.
+def test_process_pool_offload(settings, scrypt_profile):
+    settings.PASSWORD_HASHING_PROCESSES = 1
+    try:
+        encoded = make_password("Pass1!")
+        assert password_hashing_pool._executor is not None
+        assert check_password("Pass1!", encoded)
+        assert not check_password("Wrong1!", encoded)
+    finally:
+        password_hashing_pool.shutdown()
+
+
+# Given: 해시 알고리즘이 설정되어 있을 때
+# When: 벤치마크 명령을 실행하면
+# Then: 알고리즘별 측정 결과를 출력해야 합니다.
+def test_benchmark_command(scrypt_profile, capsys):
+    call_command("benchmark_password_hashers", iterations=1)
+    output = capsys.readouterr().out
+    assert "scrypt: 코어당" in output
+    assert "argon2" in output
@@ -0,0 +1,56 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+
+from accounts.views import StudentListView, TutorListView
+
+User = get_user_model()
+
+pytestmark = [
+    pytest.mark.django_db,
+    pytest.mark.skipif(
+        connection.vendor != "postgresql",
+        reason="EXPLAIN 실행 계획 검증은 PostgreSQL에서만 수행합니다.",
+    ),
+]
+
+
+def explain_list_query(view_class):
+    """
+    목록 뷰가 실행하는 첫 페이지 쿼리의 실행 계획을 반환합니다.
+    - 테스트 데이터가 적으면 순차 스캔이 선택되므로 트랜잭션 안에서 순차 스캔을 비활성화합니다.
+    """
+    queryset = view_class.queryset.order_by(*view_class.ordering)
+    page_size = view_class.pagination_class.page_size
+    with connection.cursor() as cursor:
+        cursor.execute("SET LOCAL enable_seqscan = off")
+    return queryset[:page_size].explain()
+
+
+@pytest.fixture
+def users():
+    for i in range(5):
+        User.objects.create_user(
+            email=f"student{i}@example.com", password="Pass1!", nickname=f"s{i}"
+        )
+        User.objects.create_staff(
+            email=f"tutor{i}@example.com", password="Pass1!", nickname=f"t{i}"
+        )
+
+
+# Given: 학생과 강사가 있을 때
+# When: 학생 목록 쿼리의 실행 계획을 조회하면
+# Then: 활성 학생 부분 인덱스를 사용해야 합니다.
+def test_student_list_uses_partial_index(users):
+    plan = explain_list_query(StudentListView)
+    assert "user_active_student_idx" in plan
+    assert "Sort" not in plan
+
+
+# Given: 학생과 강사가 있을 때
+# When: 강사 목록 쿼리의 실행 계획을 조회하면
+# Then: 활성 강사 부분 인덱스를 사용해야 합니다.
+def test_tutor_list_uses_partial_index(users):
+    plan = explain_list_query(TutorListView)
+    assert "user_active_staff_idx" in plan
+    assert "Sort" not in plan
@@ -1,4 +1,5 @@
 import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient
@@ -272,3 +273,115 @@ class TestTutorRetrieveUpdateDestroyView:
         url = reverse("accounts:tutor-detail", kwargs={"pk": tutor1.pk})
         response = api_client.get(url)
         assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.django_db
+class TestStudentBulkEnrollmentView:
+    @pytest.fixture
+    def users(self, create_user):
+        tutor = create_user("tutor@example.com", "password", "tutor", is_staff=True)
+        other_tutor = create_user(
+            "tutor2@example.com", "password", "tutor2", is_staff=True
+        )
+        students = [
+            create_user(f"student{i}@example.com", "password", f"student{i}")
+            for i in range(3)
+        ]
+        return tutor, other_tutor, students
+
+    # Given: 강사와 학생들이 있을 때
+    # When: 강사가 본인과 학생들의 쌍을 JSON으로 등록하면
+    # Then: 중복을 제외한 수강 관계가 생성되어야 합니다.
+    def test_bulk_enrollment_json(self, api_client, users):
+        tutor, _, students = users
+        tutor.students.add(students[0])
+        api_client.force_authenticate(user=tutor)
+        url = reverse("accounts:student-bulk-enrollment")
+        pairs = [{"tutor_id": tutor.id, "student_id": s.id} for s in students]
+        response = api_client.post(url, {"pairs": pairs}, format="json")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["created"] == 2
+        assert response.data["already_enrolled"] == 1
+        assert tutor.students.count() == 3
+
+    # Given: 강사와 학생들이 있을 때
+    # When: 강사가 다른 강사나 학생이 아닌 사용자를 포함해 등록하면
+    # Then: 유효하지 않은 쌍은 오류로 보고되어야 합니다.
+    def test_bulk_enrollment_invalid_pairs(self, api_client, users):
+        tutor, other_tutor, students = users
+        api_client.force_authenticate(user=tutor)
+        url = reverse("accounts:student-bulk-enrollment")
+        pairs = [
+            {"tutor_id": other_tutor.id, "student_id": students[0].id},
+            {"tutor_id": tutor.id, "student_id": other_tutor.id},
+            {"tutor_id": tutor.id, "student_id": "abc"},
+        ]
+        response = api_client.post(url, {"pairs": pairs}, format="json")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["created"] == 0
+        assert response.data["invalid"] == 3
+        assert sorted(error["row"] for error in response.data["errors"]) == [1, 2, 3]
+
+    # Given: 관리자가 있을 때
+    # When: CSV 파일로 여러 강사의 수강 관계를 등록하면
+    # Then: CSV의 모든 쌍이 등록되어야 합니다.
+    def test_bulk_enrollment_csv_by_admin(self, api_client, create_user, users):
+        tutor, other_tutor, students = users
+        admin = create_user(
+            "admin@example.com", "password", "admin", is_staff=True, is_superuser=True
+        )
+        api_client.force_authenticate(user=admin)
+        url = reverse("accounts:student-bulk-enrollment")
+        content = "tutor_id,student_id\n" + "".join(
+            f"{t.id},{s.id}\n" for t in (tutor, other_tutor) for s in students
+        )
+        upload = SimpleUploadedFile("pairs.csv", content.encode(), "text/csv")
+        response = api_client.post(url, {"file": upload}, format="multipart")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["created"] == 6
+        assert other_tutor.students.count() == 3
+
+    # Given: 강사가 있을 때
+    # When: 유효하지 않은 쌍이 포함된 CSV 파일로 등록하면
+    # Then: JSON pairs와 같이 헤더를 제외한 1부터 시작하는 행 번호로 오류를 보고해야 합니다.
+    def test_bulk_enrollment_csv_row_numbers(self, api_client, users):
+        tutor, other_tutor, students = users
+        api_client.force_authenticate(user=tutor)
+        url = reverse("accounts:student-bulk-enrollment")
+        content = (
+            "\ufefftutor_id,student_id\n"
+            f"{tutor.id},{students[0].id}\n"
+            f"{other_tutor.id},{students[1].id}\n"
+        )
+        upload = SimpleUploadedFile("pairs.csv", content.encode(), "text/csv")
+        response = api_client.post(url, {"file": upload}, format="multipart")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["created"] == 1
+        assert [error["row"] for error in response.data["errors"]] == [2]
+
+    # Given: 관리자가 있을 때
+    # When: UTF-8이 아닌(CP949) CSV 파일로 등록하면
+    # Then: 400 응답과 인코딩 오류 메시지를 반환해야 합니다.
+    def test_bulk_enrollment_csv_invalid_encoding(self, api_client, create_user, users):
+        tutor, other_tutor, students = users
+        admin = create_user(
+            "admin@example.com", "password", "admin", is_staff=True, is_superuser=True
+        )
+        api_client.force_authenticate(user=admin)
+        url = reverse("accounts:student-bulk-enrollment")
+        content = f"tutor_id,student_id,메모\n{tutor.id},{students[0].id},수강생\n"
+        upload = SimpleUploadedFile("pairs.csv", content.encode("cp949"), "text/csv")
+        response = api_client.post(url, {"file": upload}, format="multipart")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "file" in response.data
+        assert tutor.students.count() == 0
+
+    # Given: 학생 사용자일 때
+    # When: 대량 등록 요청을 보내면
+    # Then: 권한 오류가 발생해야 합니다.
+    def test_bulk_enrollment_student_forbidden(self, api_client, users):
+        _, _, students = users
+        api_client.force_authenticate(user=students[0])
+        url = reverse("accounts:student-bulk-enrollment")
+        response = api_client.post(url, {"pairs": [{}]}, format="json")
+        assert response.status_code == status.HTTP_403_FORBIDDEN
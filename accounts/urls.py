@@ -2,6 +2,7 @@ from django.urls import path
 
 from .views import (
     PasswordResetView,
+    StudentBulkEnrollmentView,
     StudentListView,
     StudentRetrieveUpdateDestroyView,
     TutorListView,
@@ -20,6 +21,11 @@ urlpatterns = [
         StudentRetrieveUpdateDestroyView.as_view(),
         name="student-detail",
     ),
+    path(
+        "students/enrollments/",
+        StudentBulkEnrollmentView.as_view(),
+        name="student-bulk-enrollment",
+    ),
     path("tutors/", TutorListView.as_view(), name="tutor-list"),
     path(
         "tutors/<int:pk>/",
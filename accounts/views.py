@@ -4,11 +4,16 @@ from django.shortcuts import get_object_or_404
 from rest_framework import filters, generics, mixins, status
 from rest_framework.exceptions import PermissionDenied, ValidationError
 from rest_framework.pagination import PageNumberPagination
+from rest_framework.parsers import MultiPartParser
 from rest_framework.response import Response
+from weaverse.fieldsets import SparseFieldsetViewMixin
+from weaverse.parsers import OrJSONParser
 
+from .enrollments import BulkEnrollmentService
 from .models import CustomUser
 from .permissions import IsAuthenticatedAndActive, IsSuperUser, IsTutor
 from .serializers import (
+    BulkEnrollmentSerializer,
     CustomUserDetailSerializer,
     PasswordResetSerializer,
     StudentListSerializer,
@@ -151,6 +156,7 @@ class StudentListView(mixins.ListModelMixin, generics.GenericAPIView):
 
 
 class StudentRetrieveUpdateDestroyView(
+    SparseFieldsetViewMixin,
     generics.mixins.RetrieveModelMixin,
     generics.mixins.UpdateModelMixin,
     generics.mixins.DestroyModelMixin,
@@ -158,7 +164,7 @@ class StudentRetrieveUpdateDestroyView(
 ):
     """
     학생이 학생 정보를 조회, 수정, 삭제합니다.
-    - GET: 학생 상세 조회
+    - GET: 학생 상세 조회 (?fields=, ?exclude=로 응답 필드 선택)
     - PUT: 학생 정보 수정
     - DELETE: 학생 삭제(소프트 삭제)
     """
@@ -279,6 +285,7 @@ class TutorListView(
 
 
 class TutorRetrieveUpdateDestroyView(
+    SparseFieldsetViewMixin,
     generics.mixins.RetrieveModelMixin,
     generics.mixins.UpdateModelMixin,
     generics.mixins.DestroyModelMixin,
@@ -286,7 +293,7 @@ class TutorRetrieveUpdateDestroyView(
 ):
     """
     관리자나 강사가 강사 정보를 조회, 수정, 삭제합니다.
-    - GET: 강사 상세 조회
+    - GET: 강사 상세 조회 (?fields=, ?exclude=로 응답 필드 선택)
     - PUT: 강사 정보 수정
     - DELETE: 강사 삭제 (소프트 삭제)
     """
@@ -358,3 +365,33 @@ class TutorRetrieveUpdateDestroyView(
         if not request.user.is_superuser and request.user.pk != obj.pk:
             raise PermissionDenied("해당 강사의 정보에 접근할 권한이 없습니다.")
         super().check_object_permissions(request, obj)
+
+
+class StudentBulkEnrollmentView(generics.GenericAPIView):
+    """
+    강사와 학생의 수강 관계를 대량으로 등록합니다.
+    - POST: JSON(pairs) 또는 CSV 파일(file)로 받은 (강사, 학생) 쌍 등록
+    - 관리자는 모든 강사에게, 강사는 본인에게만 학생을 등록할 수 있습니다.
+    - 유효하지 않은 쌍은 건너뛰고 등록 결과와 처리량을 반환합니다.
+    """
+
+    serializer_class = BulkEnrollmentSerializer
+    permission_classes = [IsTutor | IsSuperUser]
+    parser_classes = [OrJSONParser, MultiPartParser]
+
+    enrollment_service = BulkEnrollmentService()
+
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        if "file" in serializer.validated_data:
+            pairs = self.enrollment_service.parse_csv(serializer.validated_data["file"])
+        else:
+            pairs = self.enrollment_service.parse_pairs(
+                serializer.validated_data["pairs"]
+            )
+
+        allowed_tutor_id = None if request.user.is_superuser else request.user.id
+        result = self.enrollment_service.enroll(pairs, allowed_tutor_id)
+        return Response(result, status=status.HTTP_200_OK)
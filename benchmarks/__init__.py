@@ -0,0 +1,10 @@
+"""
+대용량 데이터 기준의 엔드포인트 성능 측정 도구입니다.
+
+    python -m benchmarks --scale 0.01 --output results.json
+    python -m benchmarks --scale 0.01 --keepdb --compare results.json
+
+- 전용 데이터베이스(sqlite: benchmarks.sqlite3, PostgreSQL: test_<DB 이름>)에 데이터를 생성합니다.
+- 주요 엔드포인트를 Django 테스트 클라이언트로 호출하여 p50/p95 응답 시간과 쿼리 수를 JSON으로 기록합니다.
+- 주제 500개 코스의 상세 응답을 표준 JSONRenderer와 OrJSONRenderer로 렌더링하는 시간을 비교합니다.
+"""
@@ -0,0 +1,129 @@
+import argparse
+import json
+import os
+import sys
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="대용량 데이터를 생성하고 주요 엔드포인트의 응답 시간과 쿼리 수를 측정합니다.",
+    )
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="데이터 규모 배율 (1.0: 코스 1만 개, 사용자 100만 명, 동영상 이벤트 1천만 건)",
+    )
+    parser.add_argument(
+        "--iterations", type=int, default=50, help="시나리오별 측정 횟수"
+    )
+    parser.add_argument(
+        "--warmup", type=int, default=5, help="결과에서 제외할 호출 횟수"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="데이터 생성 시드")
+    parser.add_argument(
+        "--output", default="benchmark-results.json", help="결과 JSON 파일 경로"
+    )
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 파일 경로")
+    parser.add_argument(
+        "--render-topics",
+        type=int,
+        default=500,
+        help="JSON 렌더러 비교에 사용할 코스의 주제 수 (0이면 측정하지 않음)",
+    )
+    parser.add_argument(
+        "--connection-requests",
+        type=int,
+        default=200,
+        help="연결 재사용 방식 비교에 사용할 코스 목록 요청 수 (0이면 측정하지 않음)",
+    )
+    parser.add_argument(
+        "--keepdb",
+        action="store_true",
+        help="측정 후 데이터베이스를 유지하고, 다음 실행에서 데이터 생성을 건너뜁니다.",
+    )
+    return parser.parse_args(argv)
+
+
+def setup_database(keepdb):
+    """
+    운영 데이터베이스와 분리된 벤치마크 전용 데이터베이스를 생성합니다.
+    - sqlite는 메모리 대신 benchmarks.sqlite3 파일을 사용하여 --keepdb로 재사용할 수 있게 합니다.
+    """
+    from django.conf import settings
+    from django.db import connection
+
+    test_settings = connection.settings_dict.setdefault("TEST", {})
+    if connection.vendor == "sqlite" and not test_settings.get("NAME"):
+        test_settings["NAME"] = str(settings.BASE_DIR / "benchmarks.sqlite3")
+    old_name = connection.settings_dict["NAME"]
+    connection.creation.create_test_db(verbosity=0, autoclobber=True, keepdb=keepdb)
+    return old_name
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "weaverse.settings")
+
+    import django
+
+    django.setup()
+
+    from django.contrib.auth import get_user_model
+    from django.db import connection
+    from django.test.utils import setup_test_environment
+
+    from .connections import ConnectionBenchmark
+    from .rendering import RenderBenchmark
+    from .runner import (
+        BenchmarkRunner,
+        build_report,
+        compare_reports,
+        format_comparison,
+    )
+    from .scenarios import ScenarioFactory
+    from .seed import DataSeeder, SeedVolumes
+
+    def log(message):
+        print(message, file=sys.stderr, flush=True)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = json.load(file)
+
+    setup_test_environment()
+    old_name = setup_database(args.keepdb)
+    try:
+        volumes = SeedVolumes.scaled(args.scale)
+        seeder = DataSeeder(volumes, seed=args.seed, log=log)
+        if get_user_model().objects.filter(email=seeder.benchmark_email).exists():
+            log("기존 벤치마크 데이터를 사용합니다.")
+        else:
+            seeder.seed()
+
+        runner = BenchmarkRunner(args.iterations, args.warmup, log=log)
+        results = runner.run(ScenarioFactory().get_scenarios())
+        report = build_report(results, volumes, runner)
+        if args.render_topics:
+            report["rendering"] = RenderBenchmark(
+                args.render_topics, args.iterations, args.warmup, log=log
+            ).run()
+        if args.connection_requests:
+            report["connections"] = ConnectionBenchmark(
+                args.connection_requests, args.warmup, log=log
+            ).run()
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=args.keepdb)
+
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(report, file, ensure_ascii=False, indent=2)
+    log(f"결과를 {args.output}에 저장했습니다.")
+
+    if baseline:
+        print(format_comparison(compare_reports(baseline, report)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+import time
+
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.backends.signals import connection_created
+from django.test import Client
+from django.urls import reverse
+
+from .runner import percentile
+
+
+class ConnectionBenchmark:
+    """
+    연결 재사용 방식에 따른 코스 목록(CourseListCreateView) 응답 시간을 측정하는 클래스입니다.
+    - per_request: 요청마다 연결을 닫습니다(CONN_MAX_AGE=0). 커넥션 풀이 설정된 경우 닫힌 연결은
+      풀로 반환되므로 pooled로 표시합니다.
+    - persistent: 요청이 끝나도 연결을 유지하고 다음 요청에서 재사용합니다(CONN_MAX_AGE>0).
+    - 테스트 클라이언트는 요청 종료 시 연결 정리(close_old_connections)를 하지 않으므로 직접 닫습니다.
+    """
+
+    url_name = "courses:course-list"
+
+    def __init__(self, requests=200, warmup=10, alias=DEFAULT_DB_ALIAS, log=None):
+        self.requests = requests
+        self.warmup = warmup
+        self.alias = alias
+        self.log = log or (lambda message: None)
+        self.client = Client()
+
+    def run(self):
+        connection = connections[self.alias]
+        close_mode = "pooled" if getattr(connection, "pool", None) else "per_request"
+        results = {
+            close_mode: self.measure(close_after_request=True),
+            "persistent": self.measure(close_after_request=False),
+        }
+        baseline = results[close_mode]["p50_ms"]
+        for name, result in results.items():
+            result["speedup"] = (
+                round(baseline / result["p50_ms"], 2) if result["p50_ms"] else None
+            )
+            self.log(
+                f"connections {name}: p50={result['p50_ms']}ms "
+                f"p95={result['p95_ms']}ms opened={result['connections_opened']} "
+                f"speedup={result['speedup']}x"
+            )
+        return {"requests": self.requests, "vendor": connection.vendor, **results}
+
+    def measure(self, close_after_request):
+        connection = connections[self.alias]
+        url = reverse(self.url_name)
+        opened = []
+
+        def count_connection(sender, connection, **kwargs):
+            if connection.alias == self.alias:
+                opened.append(connection.alias)
+
+        durations = []
+        connection.close()
+        connection_created.connect(count_connection)
+        try:
+            for iteration in range(self.warmup + self.requests):
+                started_at = time.perf_counter()
+                self.client.get(url)
+                if close_after_request:
+                    connection.close()
+                duration = time.perf_counter() - started_at
+                if iteration >= self.warmup:
+                    durations.append(duration * 1000)
+        finally:
+            connection_created.disconnect(count_connection)
+        return {
+            "p50_ms": round(percentile(durations, 50), 3),
+            "p95_ms": round(percentile(durations, 95), 3),
+            "connections_opened": len(opened),
+        }
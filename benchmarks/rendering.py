@@ -0,0 +1,130 @@
+import time
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from courses.models import (
+    Assignment,
+    Course,
+    Lecture,
+    MultipleChoiceQuestion,
+    MultipleChoiceQuestionChoice,
+    Topic,
+)
+from courses.serializers import CourseDetailSerializer
+from materials.models import Video
+from weaverse.renderers import OrJSONRenderer
+
+from .runner import percentile
+
+User = get_user_model()
+
+
+class RenderBenchmark:
+    """
+    주제가 많은 코스 상세 응답을 렌더러별로 JSON 직렬화하는 시간을 측정하는 클래스입니다.
+    - 코스는 트랜잭션 안에서 생성하고 측정 후 롤백하므로 벤치마크 데이터에 남지 않습니다.
+    - 주제는 퀴즈(선택지 4개), 과제, 동영상, 글 유형을 번갈아 생성합니다.
+    """
+
+    renderer_classes = (JSONRenderer, OrJSONRenderer)
+    topic_types = ("quiz", "assignment", "video", "article")
+    topics_per_lecture = 10
+
+    def __init__(self, topics=500, iterations=50, warmup=5, log=None):
+        self.topics = topics
+        self.iterations = iterations
+        self.warmup = warmup
+        self.log = log or (lambda message: None)
+
+    def run(self):
+        with transaction.atomic():
+            data = self.get_course_data(self.create_course())
+            transaction.set_rollback(True)
+
+        results = {
+            renderer_class.__name__: self.measure(renderer_class(), data)
+            for renderer_class in self.renderer_classes
+        }
+        baseline = results[JSONRenderer.__name__]["p50_ms"]
+        for name, result in results.items():
+            result["speedup"] = (
+                round(baseline / result["p50_ms"], 2) if result["p50_ms"] else None
+            )
+            self.log(
+                f"render {name} ({self.topics} topics): p50={result['p50_ms']}ms "
+                f"p95={result['p95_ms']}ms bytes={result['bytes']} "
+                f"speedup={result['speedup']}x"
+            )
+        return {"topics": self.topics, "iterations": self.iterations, **results}
+
+    def create_course(self):
+        author = User.objects.create_staff(
+            email="render-benchmark@weaverse.test",
+            password=None,
+            nickname="render-benchmark",
+        )
+        course = Course.objects.create(
+            author=author,
+            title="렌더링 벤치마크 코스",
+            short_description="주제가 많은 코스",
+            description={"blocks": ["코스 소개"]},
+            price=50_000,
+        )
+        lecture_count = -(-self.topics // self.topics_per_lecture)
+        lectures = Lecture.objects.bulk_create(
+            Lecture(course=course, title=f"강의 {order}", order=order)
+            for order in range(1, lecture_count + 1)
+        )
+        topics = Topic.objects.bulk_create(
+            Topic(
+                lecture=lectures[index // self.topics_per_lecture],
+                title=f"주제 {index + 1}",
+                type=self.topic_types[index % len(self.topic_types)],
+                order=index % self.topics_per_lecture + 1,
+                is_premium=index >= self.topics_per_lecture,
+            )
+            for index in range(self.topics)
+        )
+        questions = MultipleChoiceQuestion.objects.bulk_create(
+            MultipleChoiceQuestion(topic=topic, question=f"{topic.title} 퀴즈")
+            for topic in topics
+            if topic.type == "quiz"
+        )
+        MultipleChoiceQuestionChoice.objects.bulk_create(
+            MultipleChoiceQuestionChoice(
+                question=question, choice=f"선택지 {number}", is_correct=number == 1
+            )
+            for question in questions
+            for number in range(1, 5)
+        )
+        Assignment.objects.bulk_create(
+            Assignment(topic=topic, question=f"{topic.title} 과제 " * 20)
+            for topic in topics
+            if topic.type == "assignment"
+        )
+        Video.objects.bulk_create(
+            Video(topic=topic) for topic in topics if topic.type == "video"
+        )
+        return course
+
+    def get_course_data(self, course):
+        queryset = CourseDetailSerializer.get_query_plan(None).apply(
+            Course.objects.filter(pk=course.pk)
+        )
+        return CourseDetailSerializer(queryset.get()).data
+
+    def measure(self, renderer, data):
+        durations = []
+        for iteration in range(self.warmup + self.iterations):
+            started_at = time.perf_counter()
+            content = renderer.render(data, renderer.media_type)
+            duration = time.perf_counter() - started_at
+            if iteration >= self.warmup:
+                durations.append(duration * 1000)
+        return {
+            "p50_ms": round(percentile(durations, 50), 3),
+            "p95_ms": round(percentile(durations, 95), 3),
+            "bytes": len(content),
+        }
@@ -0,0 +1,150 @@
+import json
+import platform
+import subprocess
+import time
+from collections import Counter
+
+import django
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+
+def percentile(values, pct):
+    """
+    정렬된 값에서 선형 보간으로 백분위수를 계산합니다.
+    """
+    if not values:
+        return None
+    values = sorted(values)
+    position = (len(values) - 1) * pct / 100
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+class BenchmarkRunner:
+    """
+    시나리오를 반복 호출하여 응답 시간과 쿼리 수를 측정하는 클래스입니다.
+    - warmup 횟수만큼의 호출은 결과에서 제외합니다.
+    - 결과는 시나리오 이름을 키로 하는 dict이며, JSON으로 저장해 커밋 간에 비교합니다.
+    """
+
+    def __init__(self, iterations=50, warmup=5, log=None):
+        self.iterations = iterations
+        self.warmup = warmup
+        self.log = log or (lambda message: None)
+        self.client = Client()
+
+    def run(self, scenarios):
+        results = {}
+        for scenario in scenarios:
+            results[scenario.name] = self.run_scenario(scenario)
+            result = results[scenario.name]
+            self.log(
+                f"{scenario.name}: p50={result['p50_ms']}ms "
+                f"p95={result['p95_ms']}ms queries={result['queries']['p50']} "
+                f"status={result['status_codes']}"
+            )
+        return results
+
+    def run_scenario(self, scenario):
+        durations = []
+        query_counts = []
+        status_codes = Counter()
+        for iteration in range(self.warmup + self.iterations):
+            if scenario.setup:
+                scenario.setup()
+            with CaptureQueriesContext(connection) as context:
+                started_at = time.perf_counter()
+                response = self.request(scenario, iteration)
+                duration = time.perf_counter() - started_at
+            if iteration < self.warmup:
+                continue
+            durations.append(duration * 1000)
+            query_counts.append(len(context.captured_queries))
+            status_codes[str(response.status_code)] += 1
+
+        return {
+            "method": scenario.method.upper(),
+            "path": scenario.get_path(0),
+            "iterations": self.iterations,
+            "status_codes": dict(status_codes),
+            "p50_ms": round(percentile(durations, 50), 2),
+            "p95_ms": round(percentile(durations, 95), 2),
+            "mean_ms": round(sum(durations) / len(durations), 2),
+            "max_ms": round(max(durations), 2),
+            "queries": {
+                "p50": percentile(query_counts, 50),
+                "max": max(query_counts),
+            },
+        }
+
+    def request(self, scenario, iteration):
+        method = getattr(self.client, scenario.method)
+        data = scenario.get_data(iteration)
+        kwargs = {"headers": scenario.headers}
+        if data is not None:
+            kwargs.update(data=json.dumps(data), content_type="application/json")
+        return method(scenario.get_path(iteration), **kwargs)
+
+
+def get_git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def build_report(results, volumes, runner):
+    return {
+        "meta": {
+            "created_at": timezone.now().isoformat(),
+            "git_revision": get_git_revision(),
+            "database": connection.vendor,
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "iterations": runner.iterations,
+            "warmup": runner.warmup,
+            "volumes": volumes.as_dict(),
+        },
+        "results": results,
+    }
+
+
+def compare_reports(baseline, current):
+    """
+    두 결과의 시나리오별 p50/p95 응답 시간과 쿼리 수 변화를 반환합니다.
+    """
+    rows = []
+    for name, result in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            continue
+        rows.append(
+            {
+                "name": name,
+                "p50_ms": (base["p50_ms"], result["p50_ms"]),
+                "p95_ms": (base["p95_ms"], result["p95_ms"]),
+                "queries": (base["queries"]["p50"], result["queries"]["p50"]),
+            }
+        )
+    return rows
+
+
+def format_comparison(rows):
+    lines = [f"{'scenario':<24}{'p50 (ms)':>26}{'p95 (ms)':>26}{'queries':>20}"]
+    for row in rows:
+        columns = []
+        for key, width in (("p50_ms", 26), ("p95_ms", 26), ("queries", 20)):
+            before, after = row[key]
+            change = f" ({(after - before) / before:+.0%})" if before else ""
+            columns.append(f"{f'{before} -> {after}{change}':>{width}}")
+        lines.append(f"{row['name']:<24}" + "".join(columns))
+    return "\n".join(lines)
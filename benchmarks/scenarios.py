@@ -0,0 +1,165 @@
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+
+from courses.models import Course
+from jwtauth.services import token_service
+from materials.models import Video
+from payments.models import Cart, CartItem, Payment
+
+from .seed import DataSeeder
+
+User = get_user_model()
+
+
+class Scenario:
+    """
+    측정할 엔드포인트 호출 하나를 정의합니다.
+    - path, data는 반복 횟수(iteration)를 받아 값을 반환하는 함수일 수 있습니다.
+    - setup은 매 호출 전에 실행되며 측정 시간과 쿼리 수에 포함되지 않습니다.
+    """
+
+    def __init__(self, name, method, path, data=None, headers=None, setup=None):
+        self.name = name
+        self.method = method
+        self.path = path
+        self.data = data
+        self.headers = headers or {}
+        self.setup = setup
+
+    def get_path(self, iteration):
+        return self.path(iteration) if callable(self.path) else self.path
+
+    def get_data(self, iteration):
+        return self.data(iteration) if callable(self.data) else self.data
+
+
+class ScenarioFactory:
+    """
+    생성된 데이터에서 측정 대상(사용자, 코스, 동영상, 결제)을 골라 시나리오 목록을 만듭니다.
+    - 코스 상세 조회는 매 호출마다 다른 코스를 조회하여 캐시 효과를 줄입니다.
+    """
+
+    sample_size = 100
+    cart_size = 3
+    # 주문 생성 시 장바구니 총액 한도(50,000원)를 넘지 않도록 장바구니 상품을 고릅니다.
+    cart_price_limit = 50_000
+
+    def __init__(self, email=DataSeeder.benchmark_email):
+        self.user = User.objects.get(email=email)
+        self.headers = {
+            "Authorization": f"Bearer {token_service.generate_access_token(self.user)}"
+        }
+        self.course_ids = list(
+            Course.objects.order_by("?").values_list("id", flat=True)[
+                : self.sample_size
+            ]
+        )
+        self.video = (
+            Video.objects.filter(topic__is_premium=False)
+            .select_related("topic")
+            .order_by("id")
+            .first()
+        )
+        self.payment_id = (
+            Payment.objects.filter(user=self.user).values_list("id", flat=True).first()
+        )
+        self.cart, _ = Cart.objects.get_or_create(user=self.user)
+        self.cart_course_ids = self.get_cart_course_ids()
+
+    def get_scenarios(self):
+        course_ids = self.course_ids
+        return [
+            Scenario("course-list", "get", reverse("courses:course-list")),
+            Scenario(
+                "course-list-filtered",
+                "get",
+                reverse("courses:course-list") + "?category=Python&ordering=-price",
+            ),
+            Scenario(
+                "course-detail",
+                "get",
+                lambda i: reverse(
+                    "courses:course-detail", args=[course_ids[i % len(course_ids)]]
+                ),
+            ),
+            Scenario(
+                "course-outline",
+                "get",
+                lambda i: reverse(
+                    "courses:course-outline", args=[course_ids[i % len(course_ids)]]
+                ),
+            ),
+            Scenario(
+                "cart-detail",
+                "get",
+                reverse("payments:cart-list-create"),
+                headers=self.headers,
+                setup=self.fill_cart,
+            ),
+            Scenario(
+                "cart-add",
+                "post",
+                reverse("payments:cart-list-create"),
+                data={"course": self.cart_course_ids[0]},
+                headers=self.headers,
+                setup=self.empty_cart,
+            ),
+            Scenario(
+                "checkout",
+                "post",
+                reverse("payments:order"),
+                data={"from_cart": True},
+                headers=self.headers,
+                setup=self.fill_cart,
+            ),
+            Scenario(
+                "receipt-list",
+                "get",
+                reverse("payments:receipt-list"),
+                headers=self.headers,
+            ),
+            Scenario(
+                "receipt-detail",
+                "get",
+                reverse("payments:receipt-detail", args=[self.payment_id]),
+                headers=self.headers,
+            ),
+            Scenario(
+                "video-event-ingest",
+                "post",
+                reverse(
+                    "materials:video-event-data", args=[self.user.id, self.video.id]
+                ),
+                data=lambda i: {
+                    "video": self.video.id,
+                    "video_id": self.video.id,
+                    "video_url": self.video.url,
+                    "event_type": "pause",
+                    "duration": 600.0,
+                    "current_time": float(i % 600),
+                },
+                headers=self.headers,
+            ),
+        ]
+
+    def get_cart_course_ids(self):
+        course_ids = []
+        total_price = 0
+        for course_id, price in Course.objects.order_by("price").values_list(
+            "id", "price"
+        )[: self.cart_size]:
+            if course_ids and total_price + price > self.cart_price_limit:
+                break
+            course_ids.append(course_id)
+            total_price += price
+        return course_ids
+
+    def empty_cart(self):
+        CartItem.objects.filter(cart=self.cart).delete()
+
+    def fill_cart(self):
+        self.empty_cart()
+        CartItem.objects.bulk_create(
+            CartItem(cart=self.cart, course_id=course_id)
+            for course_id in self.cart_course_ids
+        )
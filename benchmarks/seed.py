@@ -0,0 +1,343 @@
+import random
+from itertools import islice
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.utils import timezone
+from faker import Faker
+
+from accounts.counters import UserRoleCounter
+from courses.counters import CatalogCounter
+from courses.models import Course, Curriculum, Lecture, Topic
+from materials.models import Video, VideoEventData
+from payments.models import Order, OrderItem, Payment, UserBillingAddress
+from payments.services import EntitlementService, OrderItemExpiryService
+
+User = get_user_model()
+
+
+class SeedVolumes:
+    """
+    생성할 데이터의 규모입니다.
+    - 기본값은 운영 규모(코스 1만 개, 사용자 100만 명, 동영상 이벤트 1천만 건)입니다.
+    - scaled()는 건수만 줄이고 강의/주제 트리의 깊이는 유지합니다.
+    """
+
+    def __init__(
+        self,
+        courses=10_000,
+        users=1_000_000,
+        video_events=10_000_000,
+        lectures_per_course=8,
+        topics_per_lecture=6,
+        courses_per_curriculum=5,
+        tutor_ratio=0.01,
+        payments_per_user=0.1,
+        receipts_per_benchmark_user=30,
+    ):
+        self.courses = courses
+        self.users = users
+        self.video_events = video_events
+        self.lectures_per_course = lectures_per_course
+        self.topics_per_lecture = topics_per_lecture
+        self.courses_per_curriculum = courses_per_curriculum
+        self.tutor_ratio = tutor_ratio
+        self.payments_per_user = payments_per_user
+        self.receipts_per_benchmark_user = receipts_per_benchmark_user
+
+    @classmethod
+    def scaled(cls, scale):
+        default = cls()
+        return cls(
+            courses=max(1, round(default.courses * scale)),
+            users=max(2, round(default.users * scale)),
+            video_events=max(1, round(default.video_events * scale)),
+        )
+
+    @property
+    def tutors(self):
+        return max(1, round(self.users * self.tutor_ratio))
+
+    @property
+    def payments(self):
+        return round(self.users * self.payments_per_user)
+
+    def as_dict(self):
+        return dict(vars(self), tutors=self.tutors, payments=self.payments)
+
+
+class DataSeeder:
+    """
+    벤치마크용 데이터를 bulk_create로 생성하는 클래스입니다.
+    - 1천만 건 단위의 데이터도 메모리에 모두 올리지 않도록 batch_size 단위로 나누어 저장합니다.
+    - 같은 seed는 같은 데이터를 만들어 커밋 간 결과를 비교할 수 있게 합니다.
+    - 측정에 사용할 학생(benchmark_email)은 청구 주소와 결제 내역을 함께 갖습니다.
+    """
+
+    batch_size = 5000
+    password = "benchmark-password"
+    benchmark_email = "benchmark-student@weaverse.test"
+    categories = [value for value, _ in Course.category_choices]
+    skill_levels = [value for value, _ in Course.skill_level_choices]
+    topic_types = [value for value, _ in Topic.topic_type_choices]
+    event_types = [value for value, _ in VideoEventData.EVENT_CHOICES]
+
+    def __init__(self, volumes, seed=0, log=None):
+        self.volumes = volumes
+        self.random = random.Random(seed)
+        self.log = log or (lambda message: None)
+        faker = Faker("ko_KR")
+        faker.seed_instance(seed)
+        self.titles = [faker.catch_phrase() for _ in range(200)]
+        self.sentences = [faker.sentence() for _ in range(200)]
+
+    def seed(self):
+        """
+        사용자, 커리큘럼/코스/강의/주제/동영상, 동영상 이벤트, 결제 순서로 데이터를 생성합니다.
+        """
+        password = make_password(self.password)
+        tutor_ids, student_ids = self.create_users(password)
+        courses = self.create_courses(tutor_ids)
+        video_ids = self.create_course_trees([course_id for course_id, *_ in courses])
+        self.create_video_events(student_ids, video_ids)
+        self.create_payments(student_ids, courses)
+        # bulk_create는 시그널을 보내지 않으므로 수강 권한과 카운터를 직접 다시 구성합니다.
+        self.create_entitlements()
+        self.log("코스, 커리큘럼 카운터 재계산")
+        CatalogCounter().recount(batch_size=self.batch_size)
+        UserRoleCounter().reconcile()
+
+    def create_users(self, password):
+        volumes = self.volumes
+        self.log(f"사용자 {volumes.users}명 생성")
+        users = (
+            User(
+                email=(
+                    self.benchmark_email
+                    if index == volumes.tutors
+                    else f"user{index}@weaverse.test"
+                ),
+                nickname=f"user{index}",
+                password=password,
+                is_staff=index < volumes.tutors,
+            )
+            for index in range(volumes.users)
+        )
+        self.bulk_create(User, users)
+
+        users = User.objects.filter(email__endswith="@weaverse.test")
+        tutor_ids = list(users.filter(is_staff=True).values_list("id", flat=True))
+        student_ids = list(users.filter(is_staff=False).values_list("id", flat=True))
+        return tutor_ids, student_ids
+
+    def create_courses(self, tutor_ids):
+        volumes = self.volumes
+        curriculum_count = max(1, volumes.courses // volumes.courses_per_curriculum)
+        self.log(f"커리큘럼 {curriculum_count}개, 코스 {volumes.courses}개 생성")
+        self.bulk_create(
+            Curriculum,
+            (
+                Curriculum(
+                    author_id=self.random.choice(tutor_ids),
+                    name=self.random.choice(self.titles),
+                    description=self.random.choice(self.sentences),
+                    price=self.random.randrange(10_000, 300_000, 1000),
+                    category=self.random.choice(self.categories),
+                    skill_level=self.random.choice(self.skill_levels),
+                )
+                for _ in range(curriculum_count)
+            ),
+        )
+        curriculum_ids = list(Curriculum.objects.values_list("id", flat=True))
+
+        self.bulk_create(
+            Course,
+            (
+                Course(
+                    curriculum_id=curriculum_ids[index % len(curriculum_ids)],
+                    author_id=self.random.choice(tutor_ids),
+                    title=self.random.choice(self.titles),
+                    short_description=self.random.choice(self.sentences),
+                    description={"blocks": self.random.sample(self.sentences, 3)},
+                    category=self.random.choice(self.categories),
+                    skill_level=self.random.choice(self.skill_levels),
+                    price=self.random.randrange(5_000, 100_000, 1000),
+                )
+                for index in range(volumes.courses)
+            ),
+        )
+        return list(
+            Course.objects.order_by("id").values_list("id", "price", "category")
+        )
+
+    def create_course_trees(self, course_ids):
+        """
+        코스마다 강의와 주제를 생성하고, 동영상 주제에는 동영상을 연결합니다.
+        - 첫 번째 강의의 주제는 무료 미리보기이며 나머지는 프리미엄입니다.
+        """
+        volumes = self.volumes
+        self.log(
+            f"코스당 강의 {volumes.lectures_per_course}개, "
+            f"강의당 주제 {volumes.topics_per_lecture}개 생성"
+        )
+        video_ids = []
+        courses_per_batch = max(1, self.batch_size // volumes.lectures_per_course)
+        for start in range(0, len(course_ids), courses_per_batch):
+            with transaction.atomic():
+                lectures = Lecture.objects.bulk_create(
+                    Lecture(
+                        course_id=course_id,
+                        title=self.random.choice(self.titles),
+                        order=order,
+                    )
+                    for course_id in course_ids[start : start + courses_per_batch]
+                    for order in range(1, volumes.lectures_per_course + 1)
+                )
+                topics = Topic.objects.bulk_create(
+                    (
+                        Topic(
+                            lecture_id=lecture.id,
+                            title=self.random.choice(self.titles),
+                            # 모든 강의가 동영상 주제를 하나 이상 갖도록 첫 주제는 동영상입니다.
+                            type=(
+                                "video"
+                                if order == 1
+                                else self.random.choice(self.topic_types)
+                            ),
+                            order=order,
+                            is_premium=lecture.order > 1,
+                        )
+                        for lecture in lectures
+                        for order in range(1, volumes.topics_per_lecture + 1)
+                    ),
+                    batch_size=self.batch_size,
+                )
+                videos = Video.objects.bulk_create(
+                    (
+                        Video(
+                            topic_id=topic.id,
+                            duration=self.random.randint(60, 1800),
+                        )
+                        for topic in topics
+                        if topic.type == "video"
+                    ),
+                    batch_size=self.batch_size,
+                )
+            video_ids.extend(video.id for video in videos)
+        return video_ids
+
+    def create_video_events(self, student_ids, video_ids):
+        volumes = self.volumes
+        self.log(f"동영상 이벤트 {volumes.video_events}건 생성")
+        if not video_ids:
+            return
+
+        def events():
+            for _ in range(volumes.video_events):
+                duration = float(self.random.randint(60, 3600))
+                yield VideoEventData(
+                    user_id=self.random.choice(student_ids),
+                    video_id=self.random.choice(video_ids),
+                    event_type=self.random.choice(self.event_types),
+                    duration=duration,
+                    current_time=self.random.uniform(0, duration),
+                )
+
+        self.bulk_create(VideoEventData, events())
+
+    def create_payments(self, student_ids, courses):
+        """
+        학생들의 완료된 결제(주문, 주문 상품, 결제)를 생성합니다.
+        - 측정용 학생은 영수증 목록 조회를 위해 receipts_per_benchmark_user건의 결제를 갖습니다.
+        """
+        volumes = self.volumes
+        benchmark_user_id = User.objects.get(email=self.benchmark_email).id
+        UserBillingAddress.objects.create(
+            user_id=benchmark_user_id,
+            country="대한민국",
+            main_address="서울특별시 종로구",
+            postal_code="03000",
+            is_default=True,
+        )
+        # 측정용 학생의 결제 건수가 seed에 따라 달라지지 않도록 나머지 결제에서는 제외합니다.
+        other_student_ids = [
+            student_id for student_id in student_ids if student_id != benchmark_user_id
+        ] or student_ids
+        buyer_ids = [benchmark_user_id] * volumes.receipts_per_benchmark_user + [
+            self.random.choice(other_student_ids) for _ in range(volumes.payments)
+        ]
+        self.log(f"결제 {len(buyer_ids)}건 생성")
+
+        now = timezone.now()
+        expiry_period = OrderItemExpiryService.expiry_period
+        buyers = iter(buyer_ids)
+        while batch := list(islice(buyers, self.batch_size)):
+            with transaction.atomic():
+                orders = Order.objects.bulk_create(
+                    Order(user_id=user_id, order_status=Order.Status.COMPLETED)
+                    for user_id in batch
+                )
+                items = []
+                payments = []
+                for order in orders:
+                    course_id, price, category = self.random.choice(courses)
+                    item_name = self.random.choice(self.titles)
+                    paid_at = now - timezone.timedelta(
+                        minutes=self.random.randint(0, 525_600)
+                    )
+                    items.append(
+                        OrderItem(
+                            order_id=order.id,
+                            course_id=course_id,
+                            item_name=item_name,
+                            unit_price=price,
+                            total_price=price,
+                            category=category,
+                            expiry_date=paid_at + expiry_period,
+                        )
+                    )
+                    payments.append(
+                        Payment(
+                            user_id=order.user_id,
+                            order_id=order.id,
+                            payment_status=Payment.Status.COMPLETED,
+                            amount=price,
+                            item_name=item_name,
+                            total_items=1,
+                            transaction_id=f"BENCH-{order.id}",
+                            paid_at=paid_at,
+                        )
+                    )
+                OrderItem.objects.bulk_create(items)
+                Payment.objects.bulk_create(payments)
+
+    def create_entitlements(self):
+        """
+        결제한 사용자들의 수강 권한을 batch_size명 단위로 구성합니다.
+        """
+        user_ids = list(
+            Order.objects.order_by("user_id")
+            .values_list("user_id", flat=True)
+            .distinct()
+        )
+        self.log(f"사용자 {len(user_ids)}명의 수강 권한 생성")
+        entitlement_service = EntitlementService()
+        for start in range(0, len(user_ids), self.batch_size):
+            entitlement_service.refresh_for_users(
+                user_ids[start : start + self.batch_size]
+            )
+
+    def bulk_create(self, model, objs):
+        """
+        객체를 batch_size 단위로 나누어 트랜잭션마다 저장합니다.
+        """
+        objs = iter(objs)
+        created = 0
+        while batch := list(islice(objs, self.batch_size)):
+            with transaction.atomic():
+                model.objects.bulk_create(batch)
+            created += len(batch)
+            if created % (self.batch_size * 100) == 0:
+                self.log(f"  {model.__name__}: {created}건")
+        return created
@@ -0,0 +1,137 @@
+import pytest
+
+from benchmarks.connections import ConnectionBenchmark
+from benchmarks.rendering import RenderBenchmark
+from benchmarks.runner import (
+    BenchmarkRunner,
+    build_report,
+    compare_reports,
+    format_comparison,
+    percentile,
+)
+from benchmarks.scenarios import ScenarioFactory
+from benchmarks.seed import DataSeeder, SeedVolumes
+from courses.models import Course, Topic
+from materials.models import Video, VideoEventData
+from payments.models import Entitlement, Payment
+
+
+@pytest.fixture
+def volumes():
+    return SeedVolumes(
+        courses=3,
+        users=20,
+        video_events=50,
+        lectures_per_course=2,
+        topics_per_lecture=4,
+        receipts_per_benchmark_user=3,
+    )
+
+
+@pytest.fixture
+def seeded(db, volumes):
+    DataSeeder(volumes, seed=1).seed()
+    return volumes
+
+
+# Given: 백분위수를 구할 값들이 있을 때
+# When: p50, p95를 계산하면
+# Then: 선형 보간된 값을 반환해야 합니다.
+def test_percentile():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50.5
+    assert percentile(values, 95) == pytest.approx(95.05)
+    assert percentile([7], 95) == 7
+    assert percentile([], 50) is None
+
+
+# Given: 운영 규모 대비 배율이 주어졌을 때
+# When: 데이터 규모를 계산하면
+# Then: 건수만 줄고 강의/주제 트리의 깊이는 유지되어야 합니다.
+def test_scaled_volumes():
+    volumes = SeedVolumes.scaled(0.01)
+    assert volumes.courses == 100
+    assert volumes.users == 10_000
+    assert volumes.video_events == 100_000
+    assert volumes.lectures_per_course == SeedVolumes().lectures_per_course
+    assert volumes.tutors == 100
+
+
+# Given: 작은 데이터 규모가 주어졌을 때
+# When: 데이터를 생성하면
+# Then: 지정한 건수의 코스, 주제, 동영상 이벤트, 결제가 생성되고
+#       수강 권한과 코스 카운터도 운영 데이터처럼 구성되어야 합니다.
+def test_seed(seeded):
+    assert Course.objects.count() == seeded.courses
+    assert Topic.objects.count() == (
+        seeded.courses * seeded.lectures_per_course * seeded.topics_per_lecture
+    )
+    assert VideoEventData.objects.count() == seeded.video_events
+    assert Payment.objects.filter(user__email=DataSeeder.benchmark_email).count() == (
+        seeded.receipts_per_benchmark_user
+    )
+    assert Entitlement.objects.filter(user__email=DataSeeder.benchmark_email).exists()
+    assert not Video.objects.filter(duration=0).exists()
+
+    course = Course.objects.order_by("id").first()
+    assert course.lectures_count == seeded.lectures_per_course
+    assert course.topics_count == seeded.lectures_per_course * seeded.topics_per_lecture
+    assert course.total_video_seconds > 0
+    assert sum(Course.objects.values_list("enrollments_count", flat=True)) > 0
+
+
+# Given: 벤치마크 데이터가 생성되었을 때
+# When: 모든 시나리오를 실행하면
+# Then: 모든 요청이 성공하고 응답 시간과 쿼리 수가 기록되어야 합니다.
+def test_run_scenarios(seeded):
+    runner = BenchmarkRunner(iterations=2, warmup=1)
+    results = runner.run(ScenarioFactory().get_scenarios())
+
+    assert set(results) == {
+        "course-list",
+        "course-list-filtered",
+        "course-detail",
+        "course-outline",
+        "cart-detail",
+        "cart-add",
+        "checkout",
+        "receipt-list",
+        "receipt-detail",
+        "video-event-ingest",
+    }
+    for name, result in results.items():
+        assert all(code.startswith("2") for code in result["status_codes"]), name
+        assert sum(result["status_codes"].values()) == 2
+        assert result["p50_ms"] <= result["p95_ms"] <= result["max_ms"]
+        assert result["queries"]["p50"] > 0
+
+    report = build_report(results, seeded, runner)
+    assert report["meta"]["volumes"]["courses"] == seeded.courses
+    rows = compare_reports(report, report)
+    assert len(rows) == len(results)
+    assert "course-list" in format_comparison(rows)
+
+
+# Given: 주제가 많은 코스가 있을 때
+# When: 렌더러별 렌더링 시간을 측정하면
+# Then: 두 렌더러의 결과 크기가 같고, 측정에 사용한 코스는 남지 않아야 합니다.
+@pytest.mark.django_db
+def test_render_benchmark():
+    result = RenderBenchmark(topics=40, iterations=2, warmup=1).run()
+
+    assert result["topics"] == 40
+    assert result["JSONRenderer"]["bytes"] == result["OrJSONRenderer"]["bytes"]
+    assert result["JSONRenderer"]["speedup"] == 1.0
+    assert not Course.objects.exists()
+
+
+# Given: 코스 데이터가 있을 때
+# When: 연결 재사용 방식별로 코스 목록 응답 시간을 측정하면
+# Then: 방식별 결과와 지속 연결의 상대 속도를 반환해야 합니다.
+def test_connection_benchmark(seeded):
+    result = ConnectionBenchmark(requests=3, warmup=1).run()
+
+    assert result["requests"] == 3
+    assert set(result) >= {"per_request", "persistent"}
+    assert result["per_request"]["speedup"] == 1.0
+    assert result["persistent"]["p50_ms"] > 0
@@ -0,0 +1,14 @@
+import pytest
+
+from weaverse.query_budget import QueryBudget
+
+
+@pytest.fixture
+def query_budget(db):
+    """
+    블록의 쿼리 수가 예산을 넘으면 실패시키는 컨텍스트 매니저를 반환합니다.
+
+        with query_budget(5):
+            api_client.get(url)
+    """
+    return QueryBudget
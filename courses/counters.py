@@ -0,0 +1,139 @@
+from django.db import transaction
+from django.db.models import Count, F, IntegerField, OuterRef, Q, Subquery, Sum
+from django.db.models.functions import Coalesce, Now
+from django.utils import timezone
+
+from materials.models import Video
+from payments.models import Entitlement
+
+from .models import Course, Curriculum, Lecture, Topic
+
+
+def subquery_aggregate(queryset, outer_field, aggregate):
+    """
+    outer_field로 바깥 행과 연결한 queryset의 집계 값을 반환하는 상관 서브쿼리입니다.
+    하위 행이 없으면 0을 반환합니다.
+    """
+    subquery = (
+        queryset.filter(**{outer_field: OuterRef("pk")})
+        .order_by()
+        .values(outer_field)
+        .annotate(value=aggregate)
+        .values("value")
+    )
+    return Coalesce(Subquery(subquery, output_field=IntegerField()), 0)
+
+
+def update_changed(queryset, expressions):
+    """
+    expressions로 다시 계산한 값이 현재 값과 다른 행만 갱신하고 updated_at을 현재 시각으로 바꿉니다.
+    HTTP 캐시 검증자(CatalogCachePolicyViewMixin)가 updated_at으로 카운터 변경을 감지하며,
+    값이 그대로인 행은 갱신하지 않아 recount가 모든 응답의 캐시를 무효화하지 않게 합니다.
+    """
+    unchanged = Q(*(Q(**{field: F(f"recounted_{field}")}) for field in expressions))
+    return (
+        queryset.alias(
+            **{
+                f"recounted_{field}": expression
+                for field, expression in expressions.items()
+            }
+        )
+        .exclude(unchanged)
+        .update(**expressions, updated_at=Now())
+    )
+
+
+class CatalogCounter:
+    """
+    코스와 커리큘럼의 비정규화 카운터를 관리하는 클래스입니다.
+    - Course: lectures_count, topics_count, total_video_seconds, enrollments_count
+    - Curriculum: courses_count
+    - 카운터는 증감하지 않고, 대상 행마다 하위 행을 집계하는 UPDATE 한 번으로 다시 계산합니다.
+      값이 바뀐 행은 updated_at도 갱신하여 ETag, Last-Modified가 바뀌도록 합니다.
+      여러 쓰기 경로가 같은 코스를 동시에 갱신해도 마지막 갱신이 실제 값과 일치합니다.
+    - 수강 권한의 만료처럼 쓰기 없이 바뀌는 값은 recount 명령으로 주기적으로 보정합니다.
+    """
+
+    structure_fields = ("lectures_count", "topics_count", "total_video_seconds")
+    enrollment_fields = ("enrollments_count",)
+
+    def get_course_expressions(self):
+        return {
+            "lectures_count": subquery_aggregate(
+                Lecture.objects.all(), "course", Count("pk")
+            ),
+            "topics_count": subquery_aggregate(
+                Topic.objects.all(), "lecture__course", Count("pk")
+            ),
+            "total_video_seconds": subquery_aggregate(
+                Video.objects.filter(is_deleted=False),
+                "topic__lecture__course",
+                Sum("duration"),
+            ),
+            "enrollments_count": subquery_aggregate(
+                Entitlement.objects.filter(expires_at__gt=timezone.now()),
+                "course",
+                Count("user", distinct=True),
+            ),
+        }
+
+    def refresh_courses(self, course_ids, fields=None):
+        """
+        주어진 코스들의 카운터를 다시 계산하고 값이 바뀐 행 수를 반환합니다.
+        fields를 생략하면 모든 카운터를 갱신합니다.
+        """
+        course_ids = {course_id for course_id in course_ids if course_id is not None}
+        if not course_ids:
+            return 0
+        expressions = self.get_course_expressions()
+        if fields is not None:
+            expressions = {field: expressions[field] for field in fields}
+        return update_changed(Course.objects.filter(pk__in=course_ids), expressions)
+
+    def refresh_course_structure(self, course_ids):
+        """
+        코스의 강의, 주제 수와 동영상 총 길이를 다시 계산합니다.
+        """
+        return self.refresh_courses(course_ids, self.structure_fields)
+
+    def refresh_enrollments(self, course_ids):
+        """
+        코스의 유효한 수강 권한을 가진 사용자 수를 다시 계산합니다.
+        """
+        return self.refresh_courses(course_ids, self.enrollment_fields)
+
+    def refresh_curriculums(self, curriculum_ids):
+        """
+        주어진 커리큘럼들의 코스 수를 다시 계산합니다.
+        """
+        curriculum_ids = {
+            curriculum_id
+            for curriculum_id in curriculum_ids
+            if curriculum_id is not None
+        }
+        if not curriculum_ids:
+            return 0
+        return update_changed(
+            Curriculum.objects.filter(pk__in=curriculum_ids),
+            {
+                "courses_count": subquery_aggregate(
+                    Course.objects.all(), "curriculum", Count("pk")
+                )
+            },
+        )
+
+    def recount(self, batch_size=1000):
+        """
+        모든 코스와 커리큘럼의 카운터를 batch_size개씩 다시 계산하고 처리한 행 수를 반환합니다.
+        """
+        counts = {}
+        for model, refresh in (
+            (Course, self.refresh_courses),
+            (Curriculum, self.refresh_curriculums),
+        ):
+            ids = list(model.objects.order_by("pk").values_list("pk", flat=True))
+            for start in range(0, len(ids), batch_size):
+                with transaction.atomic():
+                    refresh(ids[start : start + batch_size])
+            counts[model._meta.model_name] = len(ids)
+        return counts
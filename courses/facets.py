@@ -0,0 +1,113 @@
+import hashlib
+import json
+from collections import Counter
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Case, CharField, Count, Q, Value, When
+
+from .models import Course
+
+
+class CourseFacetCounter:
+    """
+    코스 목록의 필터 값(카테고리, 난이도, 가격대)별 코스 수를 계산하는 클래스입니다.
+    - 검색 결과를 (카테고리, 난이도, 가격대)로 묶는 GROUP BY 쿼리 한 번으로 집계하고,
+      그 결과 행을 정규화한 검색어를 키로 CATALOG_FACETS_CACHE_TIMEOUT초 동안 캐시합니다.
+    - 카테고리, 난이도 필터는 캐시한 행에 적용하므로 필터 조합마다 쿼리하지 않습니다.
+    - 각 필터의 개수는 자기 자신을 제외한 나머지 필터만 적용합니다. 카테고리를 선택해도
+      다른 카테고리의 개수를 보여주어 선택을 바꿀 수 있게 합니다.
+    - price_buckets의 최대 가격은 포함하지 않으며, None이면 상한이 없습니다.
+    """
+
+    cache_key_prefix = "catalog:facets"
+    price_buckets = (
+        ("free", 0, 1),
+        ("under_30000", 1, 30000),
+        ("30000_to_100000", 30000, 100000),
+        ("over_100000", 100000, None),
+    )
+
+    def get_facets(self, queryset, search_terms, category=None, skill_level=None):
+        """
+        검색어로 필터링한 queryset과 선택한 카테고리, 난이도로 필터별 코스 수를 반환합니다.
+        """
+        rows = self.get_rows(queryset, search_terms)
+        total = 0
+        counts = {"category": Counter(), "skill_level": Counter(), "price": Counter()}
+        for row_category, row_skill_level, price_bucket, count in rows:
+            category_matched = not category or row_category == category
+            skill_level_matched = not skill_level or row_skill_level == skill_level
+            if skill_level_matched:
+                counts["category"][row_category] += count
+            if category_matched:
+                counts["skill_level"][row_skill_level] += count
+            if category_matched and skill_level_matched:
+                counts["price"][price_bucket] += count
+                total += count
+
+        return {
+            "total": total,
+            "category": [
+                {"value": value, "label": label, "count": counts["category"][value]}
+                for value, label in Course.category_choices
+            ],
+            "skill_level": [
+                {"value": value, "label": label, "count": counts["skill_level"][value]}
+                for value, label in Course.skill_level_choices
+            ],
+            "price": [
+                {
+                    "value": value,
+                    "min_price": min_price,
+                    "max_price": max_price,
+                    "count": counts["price"][value],
+                }
+                for value, min_price, max_price in self.price_buckets
+            ],
+        }
+
+    def get_rows(self, queryset, search_terms):
+        """
+        (카테고리, 난이도, 가격대, 코스 수) 행 목록을 캐시에서 가져오거나 집계합니다.
+        """
+        key = self.get_cache_key(search_terms)
+        rows = cache.get(key)
+        if rows is None:
+            rows = self.aggregate_rows(queryset)
+            cache.set(
+                key,
+                rows,
+                timeout=getattr(settings, "CATALOG_FACETS_CACHE_TIMEOUT", 60),
+            )
+        return rows
+
+    def aggregate_rows(self, queryset):
+        return [
+            (row["category"], row["skill_level"], row["price_bucket"], row["count"])
+            for row in queryset.order_by()
+            .annotate(price_bucket=self.get_price_bucket_expression())
+            .values("category", "skill_level", "price_bucket")
+            .annotate(count=Count("pk"))
+        ]
+
+    def get_price_bucket_expression(self):
+        whens = []
+        for value, min_price, max_price in self.price_buckets:
+            condition = Q(price__gte=min_price)
+            if max_price is not None:
+                condition &= Q(price__lt=max_price)
+            whens.append(When(condition, then=Value(value)))
+        return Case(*whens, output_field=CharField())
+
+    def get_cache_key(self, search_terms):
+        """
+        검색어는 대소문자를 구분하지 않고 순서와 무관하게 모두 포함하는 코스를 찾으므로,
+        소문자로 바꾸고 중복을 제거해 정렬한 목록을 키로 사용합니다.
+        """
+        normalized = sorted({term.lower() for term in search_terms})
+        version = getattr(settings, "CATALOG_CACHE_VERSION", "1")
+        digest = hashlib.blake2b(
+            json.dumps(normalized, ensure_ascii=False).encode(), digest_size=16
+        ).hexdigest()
+        return f"{self.cache_key_prefix}:{version}:{digest}"
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+
+from courses.counters import CatalogCounter
+
+
+class Command(BaseCommand):
+    """
+    코스와 커리큘럼의 비정규화 카운터를 실제 값으로 보정합니다.
+    """
+
+    help = (
+        "코스(강의, 주제 수, 동영상 총 길이, 수강생 수)와 커리큘럼(코스 수)의 "
+        "카운터를 다시 계산합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="한 번에 갱신할 코스, 커리큘럼 수",
+        )
+
+    def handle(self, *args, **options):
+        counts = CatalogCounter().recount(batch_size=options["batch_size"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"코스 {counts['course']}개, 커리큘럼 {counts['curriculum']}개의 "
+                "카운터를 보정했습니다."
+            )
+        )
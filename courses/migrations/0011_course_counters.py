@@ -0,0 +1,87 @@
+# Generated by Django 5.1.1 on 2026-10-19 14:12
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+
+def subquery_aggregate(queryset, outer_field, aggregate):
+    subquery = (
+        queryset.filter(**{outer_field: OuterRef('pk')})
+        .order_by()
+        .values(outer_field)
+        .annotate(value=aggregate)
+        .values('value')
+    )
+    return Coalesce(Subquery(subquery, output_field=IntegerField()), 0)
+
+
+def backfill_counters(apps, schema_editor):
+    """
+    기존 코스와 커리큘럼의 비정규화 카운터를 현재 데이터 기준으로 채웁니다.
+    """
+    Course = apps.get_model('courses', 'Course')
+    Curriculum = apps.get_model('courses', 'Curriculum')
+    Lecture = apps.get_model('courses', 'Lecture')
+    Topic = apps.get_model('courses', 'Topic')
+    Video = apps.get_model('materials', 'Video')
+    Entitlement = apps.get_model('payments', 'Entitlement')
+
+    Course.objects.update(
+        lectures_count=subquery_aggregate(Lecture.objects.all(), 'course', Count('pk')),
+        topics_count=subquery_aggregate(
+            Topic.objects.all(), 'lecture__course', Count('pk')
+        ),
+        total_video_seconds=subquery_aggregate(
+            Video.objects.filter(is_deleted=False),
+            'topic__lecture__course',
+            Sum('duration'),
+        ),
+        enrollments_count=subquery_aggregate(
+            Entitlement.objects.filter(expires_at__gt=timezone.now()),
+            'course',
+            Count('user', distinct=True),
+        ),
+    )
+    Curriculum.objects.update(
+        courses_count=subquery_aggregate(Course.objects.all(), 'curriculum', Count('pk'))
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0010_remove_topic_description'),
+        ('materials', '0011_video_duration'),
+        ('payments', '0016_entitlement'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='course',
+            name='enrollments_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='수강생 수'),
+        ),
+        migrations.AddField(
+            model_name='course',
+            name='lectures_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='강의 수'),
+        ),
+        migrations.AddField(
+            model_name='course',
+            name='topics_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='주제 수'),
+        ),
+        migrations.AddField(
+            model_name='course',
+            name='total_video_seconds',
+            field=models.PositiveIntegerField(default=0, verbose_name='동영상 총 길이(초)'),
+        ),
+        migrations.AddField(
+            model_name='curriculum',
+            name='courses_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='코스 수'),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
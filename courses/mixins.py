@@ -2,6 +2,7 @@ from django.db import transaction
 
 from materials.models import Image, Video
 
+from .counters import CatalogCounter
 from .models import (
     Assignment,
     Course,
@@ -15,8 +16,11 @@ from .models import (
 class CourseMixin:
     """
     Course 모델과 관련된 기능을 제공하는 Mixin 클래스입니다
+    - 코스를 생성, 수정, 삭제하면 코스와 커리큘럼의 비정규화 카운터를 함께 갱신합니다.
     """
 
+    catalog_counter = CatalogCounter()
+
     @transaction.atomic
     def create_course_with_lectures_and_topics(
         self, course_data, lectures_data, author
@@ -31,6 +35,7 @@ class CourseMixin:
             for topic_data in lecture_data.get("topics", []):
                 topic = self._create_topic(topic_data, lecture)
                 self._handle_topic_type(topic, topic_data)
+        self.refresh_course_counters(course)
         return course
 
     @transaction.atomic
@@ -49,6 +54,27 @@ class CourseMixin:
             for topic_data in lecture_data.get("topics", []):
                 topic = self._create_topic(topic_data, lecture)
                 self._handle_topic_type(topic, topic_data)
+        self.refresh_course_counters(course)
+
+    def refresh_course_counters(self, course):
+        """
+        course의 강의, 주제 수와 동영상 총 길이를 다시 계산하고 인스턴스에도 반영합니다.
+        """
+
+        self.catalog_counter.refresh_course_structure([course.id])
+        course.refresh_from_db(
+            fields=[*self.catalog_counter.structure_fields, "updated_at"]
+        )
+
+    @transaction.atomic
+    def delete_course(self, course):
+        """
+        course를 삭제하고, 속해 있던 curriculum의 코스 수를 갱신합니다.
+        """
+
+        curriculum_id = course.curriculum_id
+        course.delete()
+        self.catalog_counter.refresh_curriculums([curriculum_id])
 
     def _create_course(self, course_data, author):
         """
@@ -45,6 +45,7 @@ class Curriculum(models.Model):
         choices=skill_level_choices,
         default="beginner",
     )
+    courses_count = models.PositiveIntegerField(default=0, verbose_name="코스 수")
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일")
 
@@ -109,6 +110,13 @@ class Course(models.Model):
         default="beginner",
     )
     price = models.PositiveIntegerField(verbose_name="가격")
+    # 비정규화 카운터입니다. CatalogCounter가 쓰기 경로에서 갱신합니다.
+    lectures_count = models.PositiveIntegerField(default=0, verbose_name="강의 수")
+    topics_count = models.PositiveIntegerField(default=0, verbose_name="주제 수")
+    total_video_seconds = models.PositiveIntegerField(
+        default=0, verbose_name="동영상 총 길이(초)"
+    )
+    enrollments_count = models.PositiveIntegerField(default=0, verbose_name="수강생 수")
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일")
 
@@ -1,5 +1,8 @@
 from rest_framework import serializers
 
+from payments.services import EntitlementService
+from weaverse.fieldsets import QueryPlan, SparseFieldsetSerializerMixin
+
 from .models import (
     Assignment,
     Course,
@@ -94,7 +97,7 @@ class TopicSerializer(serializers.ModelSerializer):
 
     def get_video_duration(self, obj):
         if getattr(obj, "video", None):
-            return 0
+            return obj.video.duration
         return None
 
 
@@ -111,7 +114,9 @@ class LectureSerializer(serializers.ModelSerializer):
         read_only_fields = ["created_at", "updated_at", "id"]
 
 
-class CourseDetailSerializer(serializers.ModelSerializer):
+class CourseDetailSerializer(
+    SparseFieldsetSerializerMixin, serializers.ModelSerializer
+):
     """
     Course 모델을 위한 Serializer입니다
     """
@@ -128,6 +133,9 @@ class CourseDetailSerializer(serializers.ModelSerializer):
     author_name = serializers.SerializerMethodField()
     author_id = serializers.SerializerMethodField()
     author_introduction = serializers.SerializerMethodField()
+    has_access = serializers.SerializerMethodField()
+
+    entitlement_service = EntitlementService()
 
     class Meta:
         model = Course
@@ -142,6 +150,10 @@ class CourseDetailSerializer(serializers.ModelSerializer):
             "lectures",
             "skill_level",
             "price",
+            "lectures_count",
+            "topics_count",
+            "total_video_seconds",
+            "enrollments_count",
             "thumbnail_id",
             "video_id",
             "video_url",
@@ -150,18 +162,38 @@ class CourseDetailSerializer(serializers.ModelSerializer):
             "author_name",
             "author_id",
             "author_introduction",
+            "has_access",
         ]
         read_only_fields = [
             "created_at",
             "updated_at",
             "id",
+            "lectures_count",
+            "topics_count",
+            "total_video_seconds",
+            "enrollments_count",
             "video_url",
             "thumbnail_url",
             "author_image",
             "author_name",
             "author_id",
             "author_introduction",
+            "has_access",
         ]
+        field_query_plans = {
+            "lectures": QueryPlan(
+                prefetch_related=[
+                    "lectures__topics__multiple_choice_question__multiple_choice_question_choices",
+                    "lectures__topics__assignment",
+                    "lectures__topics__video",
+                ]
+            ),
+            "video_url": QueryPlan(select_related=["video"]),
+            "author_image": QueryPlan(select_related=["author__image"]),
+            "author_name": QueryPlan(select_related=["author"]),
+            "author_id": QueryPlan(select_related=["author"]),
+            "author_introduction": QueryPlan(select_related=["author"]),
+        }
 
     def get_author_image(self, obj):
         if getattr(obj.author, "image", None):
@@ -189,13 +221,91 @@ class CourseDetailSerializer(serializers.ModelSerializer):
             obj.author.introduction if obj.author.introduction else "소개가 없습니다."
         )
 
+    def get_has_access(self, obj):
+        """
+        요청한 사용자가 코스의 프리미엄 주제를 수강할 수 있는지 여부를 반환합니다.
+        """
+        request = self.context.get("request")
+        if request is None:
+            return False
+        return self.entitlement_service.has_course_access(request, obj.id)
+
+
+class CourseOutlineTopicSerializer(serializers.Serializer):
+    """
+    코스 목차의 주제 항목을 위한 Serializer입니다.
+    퀴즈, 과제 본문은 포함하지 않으며, 주제를 열 때 주제 콘텐츠 API로 조회합니다.
+    """
+
+    id = serializers.IntegerField()
+    title = serializers.CharField()
+    type = serializers.CharField()
+    order = serializers.IntegerField()
+    is_premium = serializers.BooleanField()
+    video_duration = serializers.IntegerField(allow_null=True)
+
 
-class CourseSummarySerializer(serializers.ModelSerializer):
+class CourseOutlineLectureSerializer(serializers.Serializer):
+    """
+    코스 목차의 강의 항목을 위한 Serializer입니다.
+    """
+
+    id = serializers.IntegerField()
+    title = serializers.CharField()
+    order = serializers.IntegerField()
+    topics = CourseOutlineTopicSerializer(many=True)
+
+
+class CourseOutlineSerializer(serializers.Serializer):
+    """
+    코스 목차(강의, 주제의 제목과 순서)를 위한 Serializer입니다.
+    """
+
+    id = serializers.IntegerField()
+    title = serializers.CharField()
+    has_access = serializers.BooleanField()
+    lectures = CourseOutlineLectureSerializer(many=True)
+
+
+class CourseFacetValueSerializer(serializers.Serializer):
+    """
+    코스 필터 값(카테고리, 난이도)별 코스 수를 위한 Serializer입니다.
+    """
+
+    value = serializers.CharField()
+    label = serializers.CharField()
+    count = serializers.IntegerField()
+
+
+class CourseFacetPriceSerializer(serializers.Serializer):
+    """
+    가격대별 코스 수를 위한 Serializer입니다. max_price는 포함하지 않으며 null이면 상한이 없습니다.
+    """
+
+    value = serializers.CharField()
+    min_price = serializers.IntegerField()
+    max_price = serializers.IntegerField(allow_null=True)
+    count = serializers.IntegerField()
+
+
+class CourseFacetSerializer(serializers.Serializer):
+    """
+    코스 목록의 필터별 코스 수를 위한 Serializer입니다.
+    """
+
+    total = serializers.IntegerField()
+    category = CourseFacetValueSerializer(many=True)
+    skill_level = CourseFacetValueSerializer(many=True)
+    price = CourseFacetPriceSerializer(many=True)
+
+
+class CourseSummarySerializer(
+    SparseFieldsetSerializerMixin, serializers.ModelSerializer
+):
     """
     Course 모델을 위한 Serializer입니다
     """
 
-    lectures_count = serializers.SerializerMethodField()
     thumbnail = serializers.SerializerMethodField()
     author_image = serializers.SerializerMethodField()
     author_name = serializers.SerializerMethodField()
@@ -211,6 +321,9 @@ class CourseSummarySerializer(serializers.ModelSerializer):
             "updated_at",
             "skill_level",
             "lectures_count",
+            "topics_count",
+            "total_video_seconds",
+            "enrollments_count",
             "thumbnail",
             "author_image",
             "author_name",
@@ -220,13 +333,18 @@ class CourseSummarySerializer(serializers.ModelSerializer):
             "updated_at",
             "id",
             "lectures_count",
+            "topics_count",
+            "total_video_seconds",
+            "enrollments_count",
             "thumbnail",
             "author_image",
             "author_name",
         ]
-
-    def get_lectures_count(self, obj):
-        return obj.lectures.count()
+        field_query_plans = {
+            "thumbnail": QueryPlan(select_related=["image"]),
+            "author_image": QueryPlan(select_related=["author__image"]),
+            "author_name": QueryPlan(select_related=["author"]),
+        }
 
     def get_thumbnail(self, obj):
         return obj.get_thumbnail()
@@ -285,7 +403,6 @@ class CurriculumSummarySerializer(serializers.ModelSerializer):
 
     author_image = serializers.SerializerMethodField()
     author_name = serializers.SerializerMethodField()
-    courses_count = serializers.SerializerMethodField()
 
     class Meta:
         model = Curriculum
@@ -321,6 +438,3 @@ class CurriculumSummarySerializer(serializers.ModelSerializer):
 
     def get_author_name(self, obj):
         return obj.author.nickname
-
-    def get_courses_count(self, obj):
-        return obj.courses.count()
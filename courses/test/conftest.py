@@ -2,6 +2,7 @@ import pytest
 from django.contrib.auth import get_user_model
 from rest_framework.test import APIClient
 
+from courses.counters import CatalogCounter
 from courses.models import (
     Assignment,
     Course,
@@ -108,6 +109,9 @@ def setup_course_data(create_staff_user):
         is_correct=False,
         question=mcq,
     )
+    # ORM으로 직접 생성했으므로 비정규화 카운터를 다시 계산합니다.
+    CatalogCounter().refresh_courses([course.id])
+    course.refresh_from_db()
     return {
         "course": course,
         "lecture1": lecture1,
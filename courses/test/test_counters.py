@@ -0,0 +1,274 @@
+import ffmpeg
+import pytest
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from model_bakery import baker
+
+from courses.counters import CatalogCounter
+from courses.mixins import CourseMixin
+from courses.models import Course, Curriculum, Lecture, Topic
+from jwtauth.utils.token_generator import generate_access_token
+from materials import views as material_views
+from materials.models import Video
+from payments.models import Order, OrderItem
+from payments.services import EntitlementService
+
+
+def get_lectures_data(video_ids):
+    return [
+        {
+            "title": f"lecture_{order}",
+            "order": order,
+            "topics": [
+                {
+                    "title": f"topic_{order}",
+                    "type": "video",
+                    "order": 1,
+                    "is_premium": False,
+                    "video_id": video_id,
+                }
+            ],
+        }
+        for order, video_id in enumerate(video_ids, start=1)
+    ]
+
+
+def make_completed_order(user, course):
+    order = baker.make(Order, user=user, order_status="completed")
+    baker.make(
+        OrderItem,
+        order=order,
+        course=course,
+        expiry_date=timezone.now() + timezone.timedelta(days=30),
+    )
+    return order
+
+
+@pytest.mark.django_db
+class TestCatalogCounter:
+
+    def test_코스_생성_수정시_구조_카운터_갱신(self, create_staff_user):
+        # Given
+        videos = [baker.make(Video, duration=duration) for duration in (90, 30)]
+        course_mixin = CourseMixin()
+        course_data = {
+            "title": "course",
+            "short_description": "course",
+            "description": {},
+            "category": "Python",
+            "skill_level": "beginner",
+            "price": 1000,
+        }
+
+        # When
+        course = course_mixin.create_course_with_lectures_and_topics(
+            course_data,
+            get_lectures_data([video.id for video in videos]),
+            create_staff_user,
+        )
+
+        # Then
+        assert course.lectures_count == 2
+        assert course.topics_count == 2
+        assert course.total_video_seconds == 120
+
+        # When
+        course_mixin.update_course_with_lectures_and_topics(
+            course, course_data, get_lectures_data([baker.make(Video, duration=10).id])
+        )
+
+        # Then
+        course = Course.objects.get(pk=course.pk)
+        assert course.lectures_count == 1
+        assert course.topics_count == 1
+        assert course.total_video_seconds == 10
+
+    def test_커리큘럼_코스_이동과_코스_삭제시_코스_수_갱신(
+        self, api_client, staff_user_token, create_staff_user
+    ):
+        # Given
+        old_curriculum = baker.make(Curriculum, author=create_staff_user)
+        courses = baker.make(
+            Course,
+            author=create_staff_user,
+            curriculum=old_curriculum,
+            description={},
+            _quantity=3,
+        )
+        CatalogCounter().refresh_curriculums([old_curriculum.id])
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {staff_user_token}")
+
+        # When
+        response = api_client.post(
+            reverse("courses:curriculum-list"),
+            {
+                "name": "new",
+                "description": "new",
+                "price": 1000,
+                "courses_ids": [courses[0].id, courses[1].id],
+            },
+            format="json",
+        )
+
+        # Then
+        assert response.status_code == 201
+        new_curriculum = Curriculum.objects.get(name="new")
+        assert new_curriculum.courses_count == 2
+        old_curriculum.refresh_from_db()
+        assert old_curriculum.courses_count == 1
+
+        # When
+        api_client.delete(reverse("courses:course-detail", args=[courses[0].id]))
+
+        # Then
+        new_curriculum.refresh_from_db()
+        assert new_curriculum.courses_count == 1
+
+    def test_결제_완료와_환불시_수강생_수_갱신(self, create_user):
+        # Given
+        course = baker.make(Course, description={})
+        order = make_completed_order(create_user, course)
+        entitlement_service = EntitlementService()
+
+        # When
+        entitlement_service.refresh_for_order(order)
+
+        # Then
+        course.refresh_from_db()
+        assert course.enrollments_count == 1
+
+        # When
+        order.order_status = "refunded"
+        order.save()
+        entitlement_service.refresh_for_order(order)
+
+        # Then
+        course.refresh_from_db()
+        assert course.enrollments_count == 0
+
+    def test_수강생_수_변경시_캐시_검증자_갱신(self, api_client, create_user):
+        # Given
+        course = baker.make(Course, description={})
+        url = reverse("courses:course-detail", args=[course.id])
+        etag = api_client.get(url)["ETag"]
+        CatalogCounter().refresh_enrollments([course.id])
+        assert api_client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+        # When
+        EntitlementService().refresh_for_order(
+            make_completed_order(create_user, course)
+        )
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        # Then
+        assert response.status_code == 200
+        assert response.data["enrollments_count"] == 1
+
+    def test_동영상_업로드시_길이_저장(self, api_client, staff_user_token, monkeypatch):
+        # Given
+        monkeypatch.setattr(
+            ffmpeg, "probe", lambda source: {"format": {"duration": "61.6"}}
+        )
+        monkeypatch.setattr(
+            material_views.storage_service,
+            "upload",
+            lambda file_io, file_name, content_type: f"https://cdn/{file_name}",
+        )
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {staff_user_token}")
+
+        # When
+        response = api_client.post(
+            reverse("materials:video-upload"),
+            {"file": SimpleUploadedFile("lecture.mp4", b"video", "video/mp4")},
+            format="multipart",
+        )
+
+        # Then
+        assert response.status_code == 201
+        assert response.data["duration"] == 62
+        assert Video.objects.get(pk=response.data["id"]).duration == 62
+
+    def test_동영상_길이_확인_실패시_0으로_업로드(
+        self, api_client, staff_user_token, monkeypatch
+    ):
+        # Given
+        def probe(source):
+            raise ffmpeg.Error("ffprobe", b"", b"Invalid data found")
+
+        monkeypatch.setattr(ffmpeg, "probe", probe)
+        monkeypatch.setattr(
+            material_views.storage_service,
+            "upload",
+            lambda file_io, file_name, content_type: f"https://cdn/{file_name}",
+        )
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {staff_user_token}")
+
+        # When
+        response = api_client.post(
+            reverse("materials:video-upload"),
+            {"file": SimpleUploadedFile("lecture.mov", b"video", "video/quicktime")},
+            format="multipart",
+        )
+
+        # Then
+        assert response.status_code == 201
+        assert response.data["duration"] == 0
+
+    def test_동영상_삭제시_동영상_총_길이_갱신(self, api_client, create_staff_user):
+        # Given
+        create_staff_user.is_superuser = True
+        create_staff_user.save()
+        # 인증 시 캐시한 사용자 정보에 관리자 권한이 반영되도록 캐시를 비웁니다.
+        cache.clear()
+        course = baker.make(Course, description={})
+        lecture = baker.make(Lecture, course=course, order=1)
+        videos = [
+            baker.make(
+                Video,
+                topic=baker.make(Topic, lecture=lecture, order=order),
+                duration=30,
+            )
+            for order in (1, 2)
+        ]
+        CatalogCounter().refresh_courses([course.id])
+        token = generate_access_token(create_staff_user)
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+        # When
+        response = api_client.delete(
+            reverse("materials:video-detail", args=[videos[0].id])
+        )
+
+        # Then
+        assert response.status_code == 204
+        course.refresh_from_db()
+        assert course.total_video_seconds == 30
+
+    def test_recount_명령으로_카운터_보정(self, create_user):
+        # Given
+        curriculum = baker.make(Curriculum)
+        course = baker.make(Course, curriculum=curriculum, description={})
+        lecture = baker.make(Lecture, course=course, order=1)
+        topic = baker.make(Topic, lecture=lecture, order=1)
+        baker.make(Video, topic=topic, duration=42)
+        baker.make(Video, topic=baker.make(Topic, lecture=lecture, order=2), duration=8)
+        EntitlementService().refresh_for_order(
+            make_completed_order(create_user, course)
+        )
+        Course.objects.update(lectures_count=99, topics_count=99, total_video_seconds=0)
+        Curriculum.objects.update(courses_count=0)
+
+        # When
+        call_command("recount", "--batch-size", "1")
+
+        # Then
+        course.refresh_from_db()
+        curriculum.refresh_from_db()
+        assert course.lectures_count == 1
+        assert course.topics_count == 2
+        assert course.total_video_seconds == 50
+        assert course.enrollments_count == 1
+        assert curriculum.courses_count == 1
@@ -0,0 +1,123 @@
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from model_bakery import baker
+
+from courses.facets import CourseFacetCounter
+from courses.models import Course
+
+
+@pytest.fixture
+def facet_courses(create_staff_user):
+    cache.clear()
+    for title, category, skill_level, price in (
+        ("Python 입문", "Python", "beginner", 0),
+        ("Python 심화", "Python", "advanced", 50000),
+        ("Django 입문", "Django", "beginner", 20000),
+        ("React 입문", "React", "beginner", 150000),
+    ):
+        baker.make(
+            Course,
+            author=create_staff_user,
+            title=title,
+            short_description=title,
+            description={},
+            category=category,
+            skill_level=skill_level,
+            price=price,
+        )
+    yield
+    cache.clear()
+
+
+def get_counts(facet):
+    return {item["value"]: item["count"] for item in facet}
+
+
+@pytest.mark.django_db
+class TestCourseFacetView:
+
+    def test_필터별_코스_수_조회(self, api_client, facet_courses):
+        # Given
+        url = reverse("courses:course-facets")
+
+        # When
+        response = api_client.get(url)
+
+        # Then
+        assert response.status_code == 200
+        assert response.data["total"] == 4
+        category = get_counts(response.data["category"])
+        assert category["Python"] == 2
+        assert category["Django"] == 1
+        assert category["AWS"] == 0
+        assert get_counts(response.data["skill_level"]) == {
+            "beginner": 3,
+            "intermediate": 0,
+            "advanced": 1,
+        }
+        assert get_counts(response.data["price"]) == {
+            "free": 1,
+            "under_30000": 1,
+            "30000_to_100000": 1,
+            "over_100000": 1,
+        }
+        assert "public" in response["Cache-Control"]
+
+    def test_선택한_필터는_자신의_개수에_적용하지_않음(self, api_client, facet_courses):
+        # Given
+        url = reverse("courses:course-facets")
+
+        # When
+        response = api_client.get(url, {"category": "Python", "search": "입문"})
+
+        # Then
+        assert response.data["total"] == 1
+        category = get_counts(response.data["category"])
+        assert category["Python"] == 1
+        assert category["Django"] == 1
+        assert category["React"] == 1
+        assert get_counts(response.data["skill_level"])["beginner"] == 1
+        assert get_counts(response.data["price"])["free"] == 1
+
+    def test_잘못된_필터_값(self, api_client, facet_courses):
+        # Given
+        url = reverse("courses:course-facets")
+
+        # When
+        response = api_client.get(url, {"category": "Rust"})
+
+        # Then
+        assert response.status_code == 400
+
+    def test_검색어별_캐시(self, api_client, facet_courses):
+        # Given
+        url = reverse("courses:course-facets")
+        api_client.get(url, {"search": "입문 python"})
+
+        # When
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get(
+                url, {"search": "Python  입문", "skill_level": "beginner"}
+            )
+
+        # Then
+        assert len(queries) == 0
+        assert response.data["total"] == 1
+
+
+@pytest.mark.django_db
+class TestCourseFacetCounter:
+
+    def test_정규화한_검색어로_캐시_키_생성(self):
+        # Given
+        facet_counter = CourseFacetCounter()
+
+        # When
+        key = facet_counter.get_cache_key(["Django", "입문", "django"])
+
+        # Then
+        assert key == facet_counter.get_cache_key(["입문", "DJANGO"])
+        assert key != facet_counter.get_cache_key(["입문"])
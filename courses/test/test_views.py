@@ -44,6 +44,20 @@ class TestCourseDetail:
             is not None
         )
 
+    def test_course_조회_수강권한(self, api_client, setup_course_data, user_token):
+        # Given
+        course = setup_course_data["course"]
+        url = reverse("courses:course-detail", args=[course.id])
+
+        # When
+        anonymous_response = api_client.get(url)
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {user_token}")
+        user_response = api_client.get(url)
+
+        # Then
+        assert anonymous_response.data["has_access"] is False
+        assert user_response.data["has_access"] is False
+
     def test_course_수정(self, api_client, setup_course_data, staff_user_token):
         # Given
         course = setup_course_data["course"]
@@ -665,3 +679,128 @@ class TestCurriculumDetail:
         # Then
         assert response.status_code == status.HTTP_404_NOT_FOUND
         assert response.data is not None
+
+
+@pytest.mark.django_db
+class TestCourseOutline:
+
+    def test_course_목차_조회(self, api_client, setup_course_data):
+        # Given
+        course = setup_course_data["course"]
+        url = reverse("courses:course-outline", args=[course.id])
+
+        # When
+        response = api_client.get(url)
+
+        # Then
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["title"] == conftest.COURSE_TITLE
+        assert response.data["has_access"] is False
+        assert [lecture["title"] for lecture in response.data["lectures"]] == [
+            conftest.LECTURE1_TITLE,
+            conftest.LECTURE2_TITLE,
+        ]
+        topic = response.data["lectures"][0]["topics"][0]
+        assert topic == {
+            "id": setup_course_data["topic1"].id,
+            "title": conftest.TOPIC1_TITLE,
+            "type": conftest.TOPIC1_TYPE,
+            "order": conftest.TOPIC1_ORDER,
+            "is_premium": conftest.TOPIC1_IS_PREMIUM,
+            "video_duration": None,
+        }
+        assert "assignment" not in topic
+        assert "multiple_choice_question" not in topic
+
+    def test_course_목차_조회_주제가_없는_강의(self, api_client, setup_course_data):
+        # Given
+        course = setup_course_data["course"]
+        setup_course_data["topic2"].delete()
+        url = reverse("courses:course-outline", args=[course.id])
+
+        # When
+        response = api_client.get(url)
+
+        # Then
+        assert len(response.data["lectures"]) == 2
+        assert response.data["lectures"][1]["topics"] == []
+
+    def test_course_목차_조회_한번의_쿼리(
+        self, api_client, setup_course_data, django_assert_num_queries
+    ):
+        # Given: 비로그인 사용자는 수강 권한 조회가 필요하지 않습니다.
+        course = setup_course_data["course"]
+        url = reverse("courses:course-outline", args=[course.id])
+
+        # When, Then
+        with django_assert_num_queries(1):
+            response = api_client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_course_목차_조회_실패_존재하지않는_course인_경우(self, api_client):
+        # Given
+        url = reverse("courses:course-outline", args=[1])
+
+        # When
+        response = api_client.get(url)
+
+        # Then
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+class TestTopicContent:
+
+    def test_topic_콘텐츠_조회(self, api_client, setup_course_data, staff_user_token):
+        # Given
+        topic = setup_course_data["topic2"]
+        url = reverse("courses:topic-content", args=[topic.id])
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {staff_user_token}")
+
+        # When
+        response = api_client.get(url)
+
+        # Then
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["title"] == conftest.TOPIC2_TITLE
+        assert response.data["multiple_choice_question"]["question"] == (
+            conftest.MCQ_QUESTION
+        )
+        assert (
+            len(
+                response.data["multiple_choice_question"][
+                    "multiple_choice_question_choices"
+                ]
+            )
+            == 4
+        )
+
+    def test_topic_콘텐츠_조회_프리미엄이_아닌_주제(
+        self, api_client, setup_course_data
+    ):
+        # Given
+        topic = setup_course_data["topic1"]
+        topic.is_premium = False
+        topic.save()
+        url = reverse("courses:topic-content", args=[topic.id])
+
+        # When
+        response = api_client.get(url)
+
+        # Then
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["assignment"]["question"] == conftest.ASSIGNMENT_QUESTION
+
+    def test_topic_콘텐츠_조회_실패_수강권한이_없는_경우(
+        self, api_client, setup_course_data, user_token
+    ):
+        # Given
+        topic = setup_course_data["topic1"]
+        url = reverse("courses:topic-content", args=[topic.id])
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {user_token}")
+
+        # When
+        response = api_client.get(url)
+
+        # Then
+        assert response.status_code == status.HTTP_403_FORBIDDEN
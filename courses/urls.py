@@ -2,19 +2,33 @@ from django.urls import path
 
 from .views import (
     CourseDetailRetrieveUpdateDestroyView,
+    CourseFacetView,
     CourseListCreateView,
+    CourseOutlineView,
     CurriculumDetailRetrieveUpdateDestroyView,
     CurriculumListCreateView,
+    TopicContentView,
 )
 
 app_name = "courses"
 urlpatterns = [
     path("courses/", CourseListCreateView.as_view(), name="course-list"),
+    path("courses/facets/", CourseFacetView.as_view(), name="course-facets"),
     path(
         "courses/<int:pk>/",
         CourseDetailRetrieveUpdateDestroyView.as_view(),
         name="course-detail",
     ),
+    path(
+        "courses/<int:pk>/outline/",
+        CourseOutlineView.as_view(),
+        name="course-outline",
+    ),
+    path(
+        "topics/<int:pk>/content/",
+        TopicContentView.as_view(),
+        name="topic-content",
+    ),
     path(
         "curriculums/",
         CurriculumListCreateView.as_view(),
@@ -1,19 +1,34 @@
+from django.conf import settings
 from django.db import transaction
+from django.db.models import Prefetch
+from django.http import Http404
+from django.utils.cache import patch_cache_control
 from django_filters.rest_framework import DjangoFilterBackend
+from django_filters.utils import translate_validation
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from rest_framework import filters, generics
+from rest_framework.exceptions import PermissionDenied
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 
+from payments.services import EntitlementService
+from weaverse.cache_policy import CatalogCachePolicyViewMixin
+from weaverse.fieldsets import SparseFieldsetViewMixin
+
+from .counters import CatalogCounter
+from .facets import CourseFacetCounter
 from .mixins import CourseMixin
-from .models import Course, Curriculum
+from .models import Course, Curriculum, Topic
 from .permissions import IsStaffOrReadOnly
 from .serializers import (
     CourseDetailSerializer,
+    CourseFacetSerializer,
+    CourseOutlineSerializer,
     CourseSummarySerializer,
     CurriculumCreateAndUpdateSerializer,
     CurriculumReadSerializer,
     CurriculumSummarySerializer,
+    TopicSerializer,
 )
 
 
@@ -48,19 +63,29 @@ class CourseResultsSetPagination(PageNumberPagination):
     ),
 )
 class CourseDetailRetrieveUpdateDestroyView(
-    CourseMixin, generics.RetrieveUpdateDestroyAPIView
+    CatalogCachePolicyViewMixin,
+    SparseFieldsetViewMixin,
+    CourseMixin,
+    generics.RetrieveUpdateDestroyAPIView,
 ):
     """
     course를 조회하거나 수정하거나 삭제합니다.
+    - ?fields=, ?exclude=로 응답 필드를 선택할 수 있으며, 선택한 필드에 필요한 관계만 조회합니다.
+    - 코스, 작성자, 강의, 주제의 수정 시각으로 ETag, Last-Modified를 만들고 조건부 요청에 304로 응답합니다.
+      수강 권한(has_access)이 사용자마다 다르므로 로그인한 사용자의 응답은 공유 캐시에 저장하지 않습니다.
     """
 
-    queryset = Course.objects.prefetch_related(
-        "lectures__topics__multiple_choice_question__multiple_choice_question_choices",
-        "lectures__topics__assignment",
-        "author",
-    )
+    queryset = Course.objects.all()
     serializer_class = CourseDetailSerializer
     permission_classes = [IsStaffOrReadOnly]
+    cache_validator_fields = (
+        "updated_at",
+        "author__updated_at",
+        "lectures__updated_at",
+        "lectures__topics__updated_at",
+    )
+    cache_count_fields = ("lectures", "lectures__topics")
+    cache_varies_on_user = True
 
     def get_permissions(self):
         """
@@ -91,6 +116,139 @@ class CourseDetailRetrieveUpdateDestroyView(
         serializer = self.get_serializer(course)
         return Response(serializer.data)
 
+    def perform_destroy(self, instance):
+        """
+        course를 삭제합니다.
+        """
+
+        self.delete_course(instance)
+
+
+@extend_schema_view(
+    get=extend_schema(
+        summary="Course 목차를 조회하는 API",
+        description=(
+            "특정 Course의 강의와 주제 목차(제목, 순서, 유형, 프리미엄 여부)를 조회합니다. "
+            "퀴즈와 과제 본문은 포함하지 않습니다. 누구나 조회할 수 있습니다."
+        ),
+        responses={200: CourseOutlineSerializer},
+    ),
+)
+class CourseOutlineView(generics.GenericAPIView):
+    """
+    course의 목차를 조회합니다.
+    - 코스, 강의, 주제를 한 번의 평탄한(flat) 쿼리로 조회한 뒤 강의별로 묶습니다.
+    - 퀴즈 선택지, 과제 본문은 주제 콘텐츠 API(TopicContentView)에서 조회합니다.
+    """
+
+    queryset = Course.objects.all()
+    serializer_class = CourseOutlineSerializer
+    permission_classes = []
+    entitlement_service = EntitlementService()
+
+    outline_fields = (
+        "id",
+        "title",
+        "lectures__id",
+        "lectures__title",
+        "lectures__order",
+        "lectures__topics__id",
+        "lectures__topics__title",
+        "lectures__topics__type",
+        "lectures__topics__order",
+        "lectures__topics__is_premium",
+        "lectures__topics__video__duration",
+    )
+
+    def get(self, request, *args, **kwargs):
+        rows = list(
+            self.get_queryset()
+            .filter(pk=self.kwargs["pk"])
+            .values(*self.outline_fields)
+            .order_by(
+                "lectures__order",
+                "lectures__id",
+                "lectures__topics__order",
+                "lectures__topics__id",
+            )
+        )
+        if not rows:
+            raise Http404
+        outline = self.build_outline(rows)
+        outline["has_access"] = self.entitlement_service.has_course_access(
+            request, outline["id"]
+        )
+        serializer = self.get_serializer(outline)
+        return Response(serializer.data)
+
+    def build_outline(self, rows):
+        """
+        코스-강의-주제 조인 결과 행을 강의별 주제 목록으로 묶습니다.
+        강의나 주제가 없는 경우 LEFT JOIN으로 None 값이 채워진 행은 건너뜁니다.
+        """
+        lectures = {}
+        for row in rows:
+            lecture_id = row["lectures__id"]
+            if lecture_id is None:
+                continue
+            lecture = lectures.setdefault(
+                lecture_id,
+                {
+                    "id": lecture_id,
+                    "title": row["lectures__title"],
+                    "order": row["lectures__order"],
+                    "topics": [],
+                },
+            )
+            if row["lectures__topics__id"] is None:
+                continue
+            lecture["topics"].append(
+                {
+                    "id": row["lectures__topics__id"],
+                    "title": row["lectures__topics__title"],
+                    "type": row["lectures__topics__type"],
+                    "order": row["lectures__topics__order"],
+                    "is_premium": row["lectures__topics__is_premium"],
+                    # TopicSerializer.get_video_duration과 같은 값을 반환합니다.
+                    "video_duration": row["lectures__topics__video__duration"],
+                }
+            )
+        return {
+            "id": rows[0]["id"],
+            "title": rows[0]["title"],
+            "lectures": list(lectures.values()),
+        }
+
+
+@extend_schema_view(
+    get=extend_schema(
+        summary="Topic 콘텐츠를 조회하는 API",
+        description=(
+            "특정 Topic의 퀴즈, 과제, 동영상 콘텐츠를 조회합니다. "
+            "프리미엄 주제는 수강 권한이 있는 사용자만 조회할 수 있습니다."
+        ),
+        responses={200: TopicSerializer},
+    ),
+)
+class TopicContentView(generics.RetrieveAPIView):
+    """
+    topic 하나의 콘텐츠(퀴즈 선택지, 과제 본문, 동영상)를 조회합니다.
+    사용자가 목차에서 주제를 열 때만 호출됩니다.
+    """
+
+    queryset = Topic.objects.select_related(
+        "lecture", "assignment", "multiple_choice_question", "video"
+    ).prefetch_related("multiple_choice_question__multiple_choice_question_choices")
+    serializer_class = TopicSerializer
+    permission_classes = []
+    entitlement_service = EntitlementService()
+
+    def get_object(self):
+        topic = super().get_object()
+        if not self.entitlement_service.has_topic_access(self.request, topic):
+            raise PermissionDenied("해당 주제를 수강할 권한이 없습니다.")
+        return topic
+
 
 @extend_schema_view(
     get=extend_schema(
@@ -105,12 +263,21 @@ class CourseDetailRetrieveUpdateDestroyView(
         responses={201: CourseDetailSerializer},
     ),
 )
-class CourseListCreateView(CourseMixin, generics.ListCreateAPIView):
+class CourseListCreateView(
+    CatalogCachePolicyViewMixin,
+    SparseFieldsetViewMixin,
+    CourseMixin,
+    generics.ListCreateAPIView,
+):
     """
     course 목록을 조회하거나 새로운 course를 생성합니다.
+    - ?fields=, ?exclude=로 응답 필드를 선택할 수 있으며, 선택한 필드에 필요한 관계만 조회합니다.
+    - 필터를 적용한 코스와 작성자의 수정 시각으로 ETag, Last-Modified를 만들고
+      조건부 요청에 304로 응답합니다.
     """
 
     queryset = Course.objects.all()
+    cache_validator_fields = ("updated_at", "author__updated_at")
     permission_classes = [IsStaffOrReadOnly]
     pagination_class = CourseResultsSetPagination
     filter_backends = [
@@ -154,6 +321,55 @@ class CourseListCreateView(CourseMixin, generics.ListCreateAPIView):
         return Response(serializer.data, status=201, headers=headers)
 
 
+@extend_schema_view(
+    get=extend_schema(
+        summary="Course 필터별 개수를 조회하는 API",
+        description=(
+            "Course 목록의 검색어와 필터 조건에서 카테고리, 난이도, 가격대별 Course 수를 조회합니다. "
+            "각 필터의 개수에는 그 필터 자신의 선택 값을 적용하지 않습니다. 누구나 조회할 수 있습니다."
+        ),
+        responses={200: CourseFacetSerializer},
+    ),
+)
+class CourseFacetView(generics.GenericAPIView):
+    """
+    course 목록 필터의 값별 course 수를 조회합니다.
+    - CourseListCreateView와 같은 검색어(?search=)와 필터(?category=, ?skill_level=)를 받습니다.
+    - 집계와 캐시는 CourseFacetCounter가 담당하며, 결과는 필터 선택과 무관하게 검색어 단위로 캐시합니다.
+    """
+
+    queryset = Course.objects.all()
+    serializer_class = CourseFacetSerializer
+    permission_classes = []
+    filter_backends = [DjangoFilterBackend, filters.SearchFilter]
+    search_fields = CourseListCreateView.search_fields
+    filterset_fields = CourseListCreateView.filterset_fields
+    facet_counter = CourseFacetCounter()
+
+    def get(self, request, *args, **kwargs):
+        search_filter = filters.SearchFilter()
+        queryset = search_filter.filter_queryset(request, self.get_queryset(), self)
+        filterset = DjangoFilterBackend().get_filterset(request, queryset, self)
+        if not filterset.is_valid():
+            raise translate_validation(filterset.errors)
+
+        facets = self.facet_counter.get_facets(
+            queryset,
+            search_filter.get_search_terms(request),
+            category=filterset.form.cleaned_data.get("category"),
+            skill_level=filterset.form.cleaned_data.get("skill_level"),
+        )
+        serializer = self.get_serializer(facets)
+        response = Response(serializer.data)
+        # 응답이 사용자와 무관하므로 서버 캐시와 같은 시간 동안 공유 캐시에서도 재사용합니다.
+        patch_cache_control(
+            response,
+            public=True,
+            max_age=getattr(settings, "CATALOG_FACETS_CACHE_TIMEOUT", 60),
+        )
+        return response
+
+
 @extend_schema_view(
     get=extend_schema(
         summary="Curriculum 목록을 조회하는 API",
@@ -167,14 +383,24 @@ class CourseListCreateView(CourseMixin, generics.ListCreateAPIView):
         responses={201: CurriculumReadSerializer},
     ),
 )
-class CurriculumListCreateView(generics.ListCreateAPIView):
+class CurriculumListCreateView(CatalogCachePolicyViewMixin, generics.ListCreateAPIView):
     """
     curriculum 목록을 조회하거나 새로운 curriculum을 생성합니다.
+    - 커리큘럼, 작성자, 포함된 코스의 수정 시각으로 ETag, Last-Modified를 만들고
+      조건부 요청에 304로 응답합니다.
     """
 
     queryset = Curriculum.objects.all()
+    cache_validator_fields = (
+        "updated_at",
+        "author__updated_at",
+        "courses__updated_at",
+    )
+    cache_count_fields = ("pk", "courses")
     serializer_class = CurriculumSummarySerializer
     permission_classes = [IsStaffOrReadOnly]
+    entitlement_service = EntitlementService()
+    catalog_counter = CatalogCounter()
     filter_backends = [
         DjangoFilterBackend,
         filters.SearchFilter,
@@ -184,6 +410,12 @@ class CurriculumListCreateView(generics.ListCreateAPIView):
     filterset_fields = ["category", "skill_level"]
     ordering_fields = ["created_at", "price"]
 
+    def get_queryset(self):
+        """
+        작성자 프로필 이미지를 함께 조회하여 커리큘럼마다 조회하지 않도록 합니다.
+        """
+        return super().get_queryset().select_related("author__image")
+
     def get_serializer_class(self):
         """
         요청 메서드에 따라 다른 serializer를 반환합니다.
@@ -208,8 +440,17 @@ class CurriculumListCreateView(generics.ListCreateAPIView):
             price=serializer.data.get("price"),
             author=author,
         )
-        courses_ids = serializer.data.get("courses_ids", [])
+        courses_ids = serializer.validated_data.get("courses_ids", [])
+        curriculum_ids = [
+            curriculum.id,
+            *Course.objects.filter(id__in=courses_ids).values_list(
+                "curriculum_id", flat=True
+            ),
+        ]
+        user_ids = self.entitlement_service.get_curriculum_user_ids(curriculum_ids)
         Course.objects.filter(id__in=courses_ids).update(curriculum=curriculum)
+        self.entitlement_service.refresh_for_users(user_ids)
+        self.catalog_counter.refresh_curriculums(curriculum_ids)
 
 
 @extend_schema_view(
@@ -236,14 +477,42 @@ class CurriculumListCreateView(generics.ListCreateAPIView):
         responses={204: None},
     ),
 )
-class CurriculumDetailRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
+class CurriculumDetailRetrieveUpdateDestroyView(
+    CatalogCachePolicyViewMixin, generics.RetrieveUpdateDestroyAPIView
+):
     """
     curriculum를 조회하거나 수정하거나 삭제합니다.
+    - 커리큘럼, 포함된 코스와 그 작성자, 강의의 수정 시각으로 ETag, Last-Modified를 만들고
+      조건부 요청에 304로 응답합니다.
     """
 
     queryset = Curriculum.objects.all()
+    cache_validator_fields = (
+        "updated_at",
+        "courses__updated_at",
+        "courses__author__updated_at",
+        "courses__lectures__updated_at",
+    )
+    cache_count_fields = ("courses", "courses__lectures")
     serializer_class = CurriculumReadSerializer
     permission_classes = [IsStaffOrReadOnly]
+    entitlement_service = EntitlementService()
+    catalog_counter = CatalogCounter()
+
+    def get_queryset(self):
+        """
+        포함된 코스의 썸네일, 작성자와 프로필 이미지를 함께 조회하여 코스마다 조회하지 않도록 합니다.
+        """
+        return (
+            super()
+            .get_queryset()
+            .prefetch_related(
+                Prefetch(
+                    "courses",
+                    queryset=Course.objects.select_related("image", "author__image"),
+                )
+            )
+        )
 
     def get_serializer_class(self):
         """
@@ -270,10 +539,27 @@ class CurriculumDetailRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAP
         curriculum.description = serializer.data.get("description")
         curriculum.price = serializer.data.get("price")
         curriculum.save()
+        courses_ids = serializer.validated_data.get("courses_ids", [])
+        curriculum_ids = [
+            curriculum.id,
+            *Course.objects.filter(id__in=courses_ids).values_list(
+                "curriculum_id", flat=True
+            ),
+        ]
+        user_ids = self.entitlement_service.get_curriculum_user_ids(curriculum_ids)
         Course.objects.filter(curriculum=curriculum).update(curriculum=None)
-        courses_ids = serializer.data.get("courses_ids", [])
         Course.objects.filter(id__in=courses_ids).update(curriculum=curriculum)
-        if getattr(curriculum, "_prefetched_objects_cache", None):
-            curriculum._prefetched_objects_cache = {}
+        self.entitlement_service.refresh_for_users(user_ids)
+        self.catalog_counter.refresh_curriculums(curriculum_ids)
+        curriculum = self.get_queryset().get(pk=curriculum.pk)
         serializer = CurriculumReadSerializer(curriculum)
         return Response(serializer.data)
+
+    @transaction.atomic
+    def perform_destroy(self, instance):
+        """
+        curriculum을 삭제하고 구매한 사용자들의 수강 권한을 갱신합니다.
+        """
+        user_ids = self.entitlement_service.get_curriculum_user_ids([instance.id])
+        instance.delete()
+        self.entitlement_service.refresh_for_users(user_ids)
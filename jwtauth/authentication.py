@@ -3,7 +3,8 @@ from rest_framework.exceptions import AuthenticationFailed
 from django.contrib.auth import get_user_model
 import jwt, logging
 from django.core.cache import cache
-from django.conf import settings
+
+from .context import AuthContext
 
 
 logger = logging.getLogger(__name__)
@@ -11,16 +12,34 @@ User = get_user_model()
 
 
 class JWTAuthentication(BaseAuthentication):
+    """
+    Authorization 헤더의 JWT로 사용자를 인증합니다.
+    - 토큰 검증과 사용자 구성 결과를 요청 단위 AuthContext에 보관하여,
+      같은 요청에서 인증이 여러 번 호출되어도 decode와 캐시 조회는 한 번만 수행합니다.
+    """
+
     def authenticate(self, request):
-        auth_header = request.headers.get("Authorization")
-        if not auth_header:
+        context = AuthContext.from_request(request)
+        if not context.auth_header:
             return None
 
+        if context.user is None and context.error is None:
+            try:
+                context.user = self.get_user(context)
+            except AuthenticationFailed as e:
+                context.error = e
+
+        if context.error is not None:
+            raise context.error
+        return (context.user, None)
+
+    def get_user(self, context):
+        """
+        검증된 토큰 페이로드로 사용자 인스턴스를 구성합니다.
+        - 사용자 정보는 캐시에서 조회하고, 없을 때만 DB에서 조회합니다.
+        """
         try:
-            access_token = auth_header.split(" ")[1]
-            payload = jwt.decode(
-                access_token, settings.SECRET_KEY, algorithms=["HS256"]
-            )
+            payload = context.get_payload()
 
             user_id = payload["user_id"]
 
@@ -37,15 +56,13 @@ class JWTAuthentication(BaseAuthentication):
                 }
                 cache.set(cache_key, user_data, timeout=18000)
 
-            user = User(
+            return User(
                 id=user_data["id"],
                 email=user_data["email"],
                 is_staff=user_data["is_staff"],
                 is_superuser=user_data["is_superuser"],
             )
 
-            return (user, None)
-
         except jwt.ExpiredSignatureError:
             raise AuthenticationFailed("토큰이 만료되었습니다!")
         except IndexError:
@@ -55,5 +72,5 @@ class JWTAuthentication(BaseAuthentication):
         except User.DoesNotExist:
             raise AuthenticationFailed("유효하지 않은 사용자입니다!")
         except Exception as e:
-            logger.error(f"인증 오류: {str(e)}")
+            logger.error(f"인증 오류: {str(e)}", extra=context.log_extra)
             raise AuthenticationFailed("인증이 유효하지 않습니다!")
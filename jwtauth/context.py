@@ -0,0 +1,75 @@
+from .services import token_service
+
+
+class AuthContext:
+    """
+    요청 단위 인증 컨텍스트입니다.
+    - Authorization 헤더 파싱과 토큰 검증(decode)을 요청당 한 번만 수행하고 결과를 보관합니다.
+    - Django HttpRequest에 저장되므로 같은 요청에서 생성된 여러 DRF Request,
+      인증 클래스, 권한 클래스(request.user), 미들웨어와 로깅이 모두 같은 결과를 공유합니다.
+    """
+
+    request_attribute = "_jwt_auth_context"
+
+    def __init__(self, auth_header):
+        self.auth_header = auth_header
+        self.user = None
+        self.error = None
+        self._payload = None
+        self._decode_error = None
+        self._decoded = False
+
+    @classmethod
+    def from_request(cls, request):
+        """
+        요청에 저장된 인증 컨텍스트를 반환하고, 없으면 생성하여 저장합니다.
+        """
+        django_request = getattr(request, "_request", request)
+        context = getattr(django_request, cls.request_attribute, None)
+        if context is None:
+            context = cls(django_request.headers.get("Authorization"))
+            setattr(django_request, cls.request_attribute, context)
+        return context
+
+    @property
+    def token(self):
+        """
+        Authorization 헤더의 토큰을 반환합니다.
+        - 헤더가 없으면 None을, 형식이 잘못되었으면 IndexError를 발생시킵니다.
+        """
+        if not self.auth_header:
+            return None
+        return self.auth_header.split(" ")[1]
+
+    def get_payload(self):
+        """
+        검증된 토큰 페이로드를 반환합니다.
+        - 최초 호출에서만 decode하며, 검증 실패도 보관했다가 같은 예외를 다시 발생시킵니다.
+        """
+        if not self._decoded:
+            self._decoded = True
+            try:
+                self._payload = token_service.decode(self.token)
+            except Exception as e:
+                self._decode_error = e
+        if self._decode_error is not None:
+            raise self._decode_error
+        return self._payload
+
+    @property
+    def claims(self):
+        """
+        검증에 성공한 페이로드를 반환합니다. 검증 전이거나 실패했다면 빈 딕셔너리를 반환합니다.
+        """
+        return self._payload or {}
+
+    @property
+    def user_id(self):
+        return self.claims.get("user_id")
+
+    @property
+    def log_extra(self):
+        """
+        로그 레코드에 추가할 인증 정보를 반환합니다.
+        """
+        return {"user_id": self.user_id}
@@ -0,0 +1,51 @@
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from jwtauth.services import token_service
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    """
+    토큰 발급/검증의 초당 처리량을 측정합니다.
+    """
+
+    help = "토큰 서명, 검증, 클레임 조회를 포함한 발급의 초당 처리량을 측정합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=1000, help="반복 횟수")
+        parser.add_argument("--user-id", type=int, help="측정에 사용할 사용자 ID")
+
+    def handle(self, *args, **options):
+        iterations = options["iterations"]
+        user_id = (
+            options["user_id"] or User.objects.values_list("id", flat=True).first()
+        )
+        if user_id is None:
+            raise CommandError("측정에 사용할 사용자가 없습니다.")
+
+        user = token_service.get_claim_user(user_id)
+        access_token = token_service.generate_access_token(user)
+
+        cases = [
+            ("access token 서명", lambda: token_service.generate_access_token(user)),
+            ("access token 검증", lambda: token_service.decode(access_token)),
+            (
+                "클레임 조회 + 토큰 발급",
+                lambda: token_service.issue_tokens(
+                    token_service.get_claim_user(user_id)
+                ),
+            ),
+        ]
+        for name, func in cases:
+            started_at = time.perf_counter()
+            for _ in range(iterations):
+                func()
+            elapsed = time.perf_counter() - started_at
+            self.stdout.write(
+                f"{name}: {iterations / elapsed:.0f}회/초 "
+                f"({elapsed / iterations * 1_000_000:.1f}µs/회)"
+            )
@@ -0,0 +1,46 @@
+import json
+import uuid
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    """
+    비대칭 JWT 서명 키 쌍과 kid를 생성합니다.
+    """
+
+    help = "RS256/EdDSA 서명용 개인키와 공개키(PEM), kid를 생성합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--algorithm", choices=["RS256", "EdDSA"], default="EdDSA")
+
+    def handle(self, *args, **options):
+        if options["algorithm"] == "RS256":
+            private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        else:
+            private_key = ed25519.Ed25519PrivateKey.generate()
+
+        private_pem = private_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        ).decode()
+        public_pem = (
+            private_key.public_key()
+            .public_bytes(
+                serialization.Encoding.PEM,
+                serialization.PublicFormat.SubjectPublicKeyInfo,
+            )
+            .decode()
+        )
+
+        self.stdout.write(f"JWT_ALGORITHM={options['algorithm']}")
+        kid = uuid.uuid4().hex
+        self.stdout.write(f"JWT_KEY_ID={kid}")
+        escaped_pem = private_pem.strip().replace("\n", "\\n")
+        self.stdout.write(f'JWT_PRIVATE_KEY="{escaped_pem}"')
+        self.stdout.write("\n# 키 교체 후 JWT_PREVIOUS_PUBLIC_KEYS에 등록할 공개키")
+        previous_key = {"algorithm": options["algorithm"], "key": public_pem}
+        self.stdout.write(f'"{kid}": {json.dumps(previous_key)}')
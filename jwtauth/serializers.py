@@ -39,15 +39,11 @@ class LogoutSerializer(serializers.ModelSerializer):
 class RefreshTokenSerializer(serializers.ModelSerializer):
     """
     이 시리얼라이저는 리프레시 토큰을 검증합니다.
+    - 블랙리스트 여부는 TokenService가 블랙리스트 등록 시 유니크 제약으로 함께 검사합니다.
     """
 
     refresh_token = serializers.CharField()
 
-    def validate_refresh_token(self, value):
-        if BlacklistedToken.objects.filter(token=value).exists():
-            raise serializers.ValidationError("유효하지 않은 리프레시 토큰입니다.")
-        return value
-
     class Meta:
         """
         이 시리얼라이저는 BlacklistedToken 모델을 사용합니다.
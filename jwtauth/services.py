@@ -0,0 +1,225 @@
+from datetime import timedelta
+
+import jwt
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ImproperlyConfigured
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from .models import BlacklistedToken
+
+User = get_user_model()
+
+
+class TokenReuseError(Exception):
+    """
+    이미 블랙리스트에 등록된 토큰을 다시 사용하려 할 때 발생합니다.
+    """
+
+
+class TokenService:
+    """
+    액세스/리프레시 토큰 발급과 블랙리스트 등록을 담당하는 클래스입니다.
+    - 토큰 클레임에 필요한 필드만 한 번의 쿼리(select_related("image").only(...))로 조회합니다.
+    - 서명 키와 kid별 검증 키는 처음 사용할 때 한 번만 준비하여 프로세스 안에 캐시합니다.
+    - RS256/EdDSA는 공개키만으로 검증할 수 있어 JWKS로 다른 서비스에 검증 키를 제공합니다.
+    - 여러 토큰의 블랙리스트 등록은 한 번의 bulk_create로 처리합니다.
+    """
+
+    symmetric_algorithms = ("HS256", "HS384", "HS512")
+    access_token_lifetime = timedelta(minutes=30)
+    refresh_token_lifetime = timedelta(days=14)
+    claim_fields = (
+        "id",
+        "email",
+        "nickname",
+        "is_staff",
+        "is_superuser",
+        "is_active",
+        "image__url",
+    )
+
+    def __init__(self):
+        self.reset_keys()
+
+    def reset_keys(self):
+        """
+        캐시된 서명 키와 검증 키를 비웁니다. (설정 변경 시 사용)
+        """
+        self._signing_key = None
+        self._verifying_keys = None
+
+    @property
+    def algorithm(self):
+        return settings.JWT_ALGORITHM
+
+    @property
+    def is_symmetric(self):
+        return self.algorithm in self.symmetric_algorithms
+
+    @property
+    def algorithm_object(self):
+        return jwt.get_algorithm_by_name(self.algorithm)
+
+    def get_signing_key(self):
+        """
+        알고리즘에 맞게 준비된 서명 키를 반환합니다.
+        - 비대칭 알고리즘은 PEM 개인키를 한 번만 파싱하여 키 객체로 재사용합니다.
+        """
+        if self._signing_key is None:
+            raw_key = (
+                settings.SECRET_KEY if self.is_symmetric else settings.JWT_PRIVATE_KEY
+            )
+            self._signing_key = self.algorithm_object.prepare_key(raw_key)
+        return self._signing_key
+
+    def get_verifying_keys(self):
+        """
+        kid별 (알고리즘, 검증용 공개키 객체)를 반환합니다.
+        - 현재 서명 키의 공개키와 JWT_PREVIOUS_PUBLIC_KEYS의 이전 공개키를 포함합니다.
+        - 이전 공개키는 키마다 알고리즘을 기록하므로 알고리즘을 바꾸는 교체(RS256 -> EdDSA 등)도 지원합니다.
+        """
+        if self._verifying_keys is None:
+            keys = {
+                kid: self.prepare_previous_key(kid, value)
+                for kid, value in settings.JWT_PREVIOUS_PUBLIC_KEYS.items()
+            }
+            if not self.is_symmetric:
+                keys[settings.JWT_KEY_ID] = (
+                    self.algorithm,
+                    self.get_signing_key().public_key(),
+                )
+            self._verifying_keys = keys
+        return self._verifying_keys
+
+    def prepare_previous_key(self, kid, value):
+        """
+        JWT_PREVIOUS_PUBLIC_KEYS 항목을 (알고리즘, 공개키 객체)로 변환합니다.
+        - {"algorithm": "RS256", "key": "PEM"} 형식이며, PEM 문자열만 있으면 현재 알고리즘을 사용합니다.
+        """
+        if isinstance(value, str):
+            value = {"algorithm": self.algorithm, "key": value}
+        algorithm = value["algorithm"]
+        if algorithm in self.symmetric_algorithms:
+            raise ImproperlyConfigured(
+                f"JWT_PREVIOUS_PUBLIC_KEYS[{kid!r}]에는 비대칭 알고리즘의 공개키만 등록할 수 있습니다."
+            )
+        return algorithm, jwt.get_algorithm_by_name(algorithm).prepare_key(value["key"])
+
+    def get_verifying_key(self, token):
+        """
+        토큰 헤더의 kid에 해당하는 (알고리즘, 검증 키)를 반환합니다.
+        - 대칭 알고리즘으로 서명한 토큰은 kid가 없으므로 현재 서명 키로 검증합니다.
+        """
+        kid = jwt.get_unverified_header(token).get("kid", "")
+        keys = self.get_verifying_keys()
+        if self.is_symmetric and kid not in keys:
+            return self.algorithm, self.get_signing_key()
+        try:
+            return keys[kid]
+        except KeyError:
+            raise jwt.DecodeError("알 수 없는 서명 키(kid)입니다.")
+
+    def get_jwks(self):
+        """
+        검증용 공개키 목록을 JWKS 형식으로 반환합니다.
+        - 대칭 키(HS256)는 외부에 공개할 수 없으므로 포함하지 않습니다.
+        """
+        keys = []
+        for kid, (algorithm, key) in self.get_verifying_keys().items():
+            jwk = jwt.get_algorithm_by_name(algorithm).to_jwk(key, as_dict=True)
+            jwk.update({"kid": kid, "alg": algorithm, "use": "sig"})
+            keys.append(jwk)
+        return {"keys": keys}
+
+    def get_claim_user(self, user_id):
+        """
+        토큰 클레임에 필요한 필드만 담은 사용자 인스턴스를 반환합니다.
+        """
+        return (
+            User.objects.select_related("image")
+            .only(*self.claim_fields)
+            .get(id=user_id)
+        )
+
+    def encode(self, payload):
+        headers = None if self.is_symmetric else {"kid": settings.JWT_KEY_ID}
+        return jwt.encode(
+            payload, self.get_signing_key(), algorithm=self.algorithm, headers=headers
+        )
+
+    def decode(self, token):
+        algorithm, key = self.get_verifying_key(token)
+        return jwt.decode(token, key, algorithms=[algorithm])
+
+    def generate_access_token(self, user):
+        """
+        사용자 정보를 받아서 access token을 생성합니다.
+        - 프로필 이미지가 함께 조회되지 않은 사용자라면 이미지 조회 쿼리가 추가로 발생합니다.
+        """
+        now = timezone.now()
+        payload = {
+            "user_id": user.id,
+            "is_staff": user.is_staff,
+            "is_superuser": user.is_superuser,
+            "iat": now,
+            "nickname": user.nickname,
+            "email": user.email,
+            "image": user.get_image_url(),
+            "exp": now + self.access_token_lifetime,
+        }
+        return self.encode(payload)
+
+    def generate_refresh_token(self, user):
+        """
+        사용자 정보를 받아서 refresh token을 생성합니다.
+        """
+        payload = {
+            "user_id": user.id,
+            "exp": timezone.now() + self.refresh_token_lifetime,
+        }
+        return self.encode(payload)
+
+    def issue_tokens(self, user):
+        """
+        access token과 refresh token을 함께 발급합니다.
+        - 프로필 이미지가 함께 조회되지 않은 사용자는 클레임 필드만 다시 조회합니다.
+        """
+        if not User.image.is_cached(user):
+            user = self.get_claim_user(user.id)
+        return self.generate_access_token(user), self.generate_refresh_token(user)
+
+    def blacklist(self, user_id, tokens, ignore_conflicts=True):
+        """
+        (토큰, 토큰 유형) 목록을 한 번의 쿼리로 블랙리스트에 등록합니다.
+        - ignore_conflicts=False이면 이미 등록된 토큰이 있을 때 TokenReuseError가 발생합니다.
+        """
+        rows = [
+            BlacklistedToken(token=token, user_id=user_id, token_type=token_type)
+            for token, token_type in tokens
+            if token
+        ]
+        try:
+            with transaction.atomic():
+                BlacklistedToken.objects.bulk_create(
+                    rows, ignore_conflicts=ignore_conflicts
+                )
+        except IntegrityError:
+            raise TokenReuseError("이미 사용된 토큰입니다.")
+
+    def rotate_refresh_token(self, refresh_token):
+        """
+        리프레시 토큰을 검증하고 블랙리스트에 등록한 뒤 새 토큰을 발급합니다.
+        - 사용자 조회 1회, 블랙리스트 등록 1회의 쿼리로 처리됩니다.
+        - 블랙리스트 등록 시 유니크 제약으로 재사용(동시 요청 포함)을 막습니다.
+        """
+        payload = self.decode(refresh_token)
+        user = self.get_claim_user(payload["user_id"])
+        if not user.is_active:
+            return user, None
+        self.blacklist(user.id, [(refresh_token, "refresh")], ignore_conflicts=False)
+        return user, self.issue_tokens(user)
+
+
+token_service = TokenService()
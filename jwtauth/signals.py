@@ -0,0 +1,13 @@
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+from .services import token_service
+
+
+@receiver(setting_changed)
+def reset_token_keys_on_setting_change(setting, **kwargs):
+    """
+    JWT 서명 설정이 바뀌면 캐시된 서명/검증 키를 비웁니다.
+    """
+    if setting == "SECRET_KEY" or setting.startswith("JWT_"):
+        token_service.reset_keys()
@@ -0,0 +1,79 @@
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+from django.test import RequestFactory
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.request import Request
+from rest_framework.test import APIClient
+
+from accounts.models import CustomUser as User
+from jwtauth.authentication import JWTAuthentication
+from jwtauth.context import AuthContext
+from jwtauth.services import token_service
+
+
+@pytest.fixture
+def superuser(db):
+    return User.objects.create_superuser(
+        email="admin@example.com", password="testpass123", nickname="admin"
+    )
+
+
+@pytest.fixture
+def decode_counter():
+    """
+    요청 처리 중 토큰 decode 호출 횟수를 세는 픽스처입니다.
+    """
+    with patch.object(token_service, "decode", wraps=token_service.decode) as mock:
+        yield mock
+
+
+@pytest.mark.django_db
+def test_요청당_토큰_decode_한번(superuser, decode_counter):
+    """권한 검사를 포함한 요청 처리에서 토큰이 한 번만 decode되는지 테스트합니다."""
+    # Given: 관리자의 액세스 토큰이 있음
+    cache.clear()
+    client = APIClient()
+    client.credentials(
+        HTTP_AUTHORIZATION=f"Bearer {token_service.generate_access_token(superuser)}"
+    )
+    # When: 관리자 권한이 필요한 API를 호출함
+    response = client.get(reverse("accounts:tutor-list"))
+    # Then: 응답이 성공하고 decode는 한 번만 호출됨
+    assert response.status_code == status.HTTP_200_OK
+    assert decode_counter.call_count == 1
+
+
+@pytest.mark.django_db
+def test_같은_요청의_여러_인증_호출_공유(superuser, decode_counter):
+    """같은 HttpRequest로 만든 여러 DRF Request가 인증 결과를 공유하는지 테스트합니다."""
+    # Given: 액세스 토큰이 담긴 요청이 있음
+    token = token_service.generate_access_token(superuser)
+    django_request = RequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {token}")
+    authenticators = [JWTAuthentication()]
+    # When: 여러 DRF Request에서 사용자를 조회함
+    with patch.object(cache, "get", wraps=cache.get) as cache_get:
+        users = [
+            Request(django_request, authenticators=authenticators).user
+            for _ in range(3)
+        ]
+    # Then: decode와 캐시 조회는 한 번만 수행되고 같은 사용자를 공유함
+    assert decode_counter.call_count == 1
+    assert cache_get.call_count == 1
+    assert all(user is users[0] for user in users)
+    assert AuthContext.from_request(django_request).user_id == superuser.id
+
+
+def test_유효하지_않은_토큰_결과_공유(decode_counter):
+    """유효하지 않은 토큰의 검증 실패도 요청 안에서 재사용되는지 테스트합니다."""
+    # Given: 유효하지 않은 토큰이 담긴 요청이 있음
+    django_request = RequestFactory().get("/", HTTP_AUTHORIZATION="Bearer invalid")
+    authentication = JWTAuthentication()
+    # When & Then: 여러 번 인증해도 같은 예외가 발생하고 decode는 한 번만 호출됨
+    for _ in range(2):
+        with pytest.raises(AuthenticationFailed):
+            authentication.authenticate(Request(django_request))
+    assert decode_counter.call_count == 1
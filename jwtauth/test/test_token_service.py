@@ -0,0 +1,84 @@
+import jwt
+import pytest
+from django.conf import settings
+from django.core.management import call_command
+
+from accounts.models import CustomUser as User
+from jwtauth.models import BlacklistedToken
+from jwtauth.services import TokenReuseError, TokenService
+from materials.models import Image
+
+
+@pytest.fixture
+def service():
+    return TokenService()
+
+
+@pytest.fixture
+def user(db):
+    user = User.objects.create_user(
+        email="test@example.com", password="testpass123", nickname="testuser"
+    )
+    Image.objects.create(user=user, url="https://example.com/profile.png")
+    return user
+
+
+@pytest.mark.django_db
+def test_토큰_발급_클레임_단일_쿼리(service, user, django_assert_num_queries):
+    """프로필 이미지를 포함한 클레임 조회와 토큰 발급이 한 번의 쿼리로 처리되는지 테스트합니다."""
+    # Given: 프로필 이미지가 있는 사용자가 있음
+    # When: 클레임 사용자를 조회하여 토큰을 발급함
+    with django_assert_num_queries(1):
+        access_token, refresh_token = service.issue_tokens(
+            service.get_claim_user(user.id)
+        )
+    # Then: 액세스 토큰에 프로필 이미지가 포함되어 있음
+    payload = jwt.decode(access_token, settings.SECRET_KEY, algorithms=["HS256"])
+    assert payload["image"] == "https://example.com/profile.png"
+    assert payload["nickname"] == "testuser"
+
+
+@pytest.mark.django_db
+def test_리프레시_토큰_재발급_쿼리수(service, user, django_assert_num_queries):
+    """리프레시 토큰 재발급이 사용자 조회와 블랙리스트 등록만으로 처리되는지 테스트합니다."""
+    # Given: 유효한 리프레시 토큰이 있음
+    refresh_token = service.generate_refresh_token(user)
+    # When: 리프레시 토큰으로 새 토큰을 발급함 (사용자 조회 1회, savepoint 2회, 등록 1회)
+    with django_assert_num_queries(4):
+        _, tokens = service.rotate_refresh_token(refresh_token)
+    # Then: 새 토큰이 발급되고 기존 토큰은 블랙리스트에 등록됨
+    assert tokens is not None
+    assert BlacklistedToken.objects.filter(token=refresh_token).exists()
+
+
+@pytest.mark.django_db
+def test_리프레시_토큰_재사용_차단(service, user):
+    """이미 사용된 리프레시 토큰의 재사용이 차단되는지 테스트합니다."""
+    # Given: 한 번 사용된 리프레시 토큰이 있음
+    refresh_token = service.generate_refresh_token(user)
+    service.rotate_refresh_token(refresh_token)
+    # When & Then: 같은 토큰으로 다시 재발급하면 예외가 발생함
+    with pytest.raises(TokenReuseError):
+        service.rotate_refresh_token(refresh_token)
+
+
+@pytest.mark.django_db
+def test_블랙리스트_일괄_등록(service, user, django_assert_max_num_queries):
+    """여러 토큰이 한 번의 삽입 쿼리로 블랙리스트에 등록되는지 테스트합니다."""
+    # Given: 여러 토큰이 있음
+    tokens = [(f"token-{i}", "refresh") for i in range(5)]
+    # When: 블랙리스트에 일괄 등록함
+    with django_assert_max_num_queries(3):
+        service.blacklist(user.id, tokens)
+    # Then: 모든 토큰이 등록됨
+    assert BlacklistedToken.objects.filter(user=user).count() == 5
+
+
+@pytest.mark.django_db
+def test_토큰_벤치마크_명령(user, capsys):
+    """토큰 처리량 벤치마크 명령을 테스트합니다."""
+    # Given: 사용자가 있음
+    # When: 벤치마크 명령을 실행함
+    call_command("benchmark_tokens", iterations=5, user_id=user.id)
+    # Then: 항목별 처리량이 출력됨
+    assert "access token 서명" in capsys.readouterr().out
@@ -1,5 +1,5 @@
 from django.urls import path
-from .views import LoginView, LogoutView, RefreshTokenView, GoogleLogin
+from .views import JWKSView, LoginView, LogoutView, RefreshTokenView, GoogleLogin
 
 
 urlpatterns = [
@@ -7,4 +7,5 @@ urlpatterns = [
     path("logout/", LogoutView.as_view(), name="logout"),
     path("refresh/", RefreshTokenView.as_view(), name="refresh"),
     path("social-login/google/", GoogleLogin.as_view(), name="google_login"),
+    path(".well-known/jwks.json", JWKSView.as_view(), name="jwks"),
 ]
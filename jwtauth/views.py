@@ -11,9 +11,8 @@ from rest_framework.generics import GenericAPIView
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 
-from .models import BlacklistedToken
 from .serializers import LoginSerializer, LogoutSerializer, RefreshTokenSerializer
-from .utils.token_generator import generate_access_token, generate_refresh_token
+from .services import TokenReuseError, token_service
 
 logger = logging.getLogger(__name__)
 User = get_user_model()
@@ -39,8 +38,7 @@ class LoginView(GenericAPIView):
             user = authenticate(email=email, password=password)
 
             if user is not None and user.is_active:
-                access_token = generate_access_token(user)
-                refresh_token = generate_refresh_token(user)
+                access_token, refresh_token = token_service.issue_tokens(user)
 
                 response = redirect(settings.LOGIN_REDIRECT_URL)
                 same_site = None if settings.DEBUG else "Lax"
@@ -82,9 +80,7 @@ class LogoutView(GenericAPIView):
             refresh_token = serializer.validated_data["refresh_token"]
 
             try:
-                BlacklistedToken.objects.create(
-                    token=refresh_token, user=request.user, token_type="refresh"
-                )
+                token_service.blacklist(request.user.id, [(refresh_token, "refresh")])
                 return Response(
                     {"success": "로그아웃 완료."},
                     status=status.HTTP_200_OK,
@@ -116,28 +112,25 @@ class RefreshTokenView(GenericAPIView):
             refresh_token = serializer.validated_data["refresh_token"]
 
             try:
-                payload = jwt.decode(
-                    refresh_token, settings.SECRET_KEY, algorithms=["HS256"]
-                )
-                user = User.objects.get(id=payload["user_id"])
+                user, tokens = token_service.rotate_refresh_token(refresh_token)
 
-                if not user.is_active:
+                if tokens is None:
                     return Response(
                         {"error": "비활성화된 유저입니다."},
                         status=status.HTTP_401_UNAUTHORIZED,
                     )
 
-                access_token = generate_access_token(user)
-                new_refresh_token = generate_refresh_token(user)
-
-                BlacklistedToken.objects.create(
-                    token=refresh_token, user=user, token_type="refresh"
-                )
+                access_token, new_refresh_token = tokens
                 return Response(
                     {"access_token": access_token, "refresh_token": new_refresh_token},
                     status=status.HTTP_200_OK,
                 )
 
+            except TokenReuseError:
+                return Response(
+                    {"refresh_token": ["유효하지 않은 리프레시 토큰입니다."]},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
             except jwt.ExpiredSignatureError:
                 return Response(
                     {"error": "인증 요청이 유효하지 않습니다."},
@@ -158,6 +151,22 @@ class RefreshTokenView(GenericAPIView):
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
+class JWKSView(GenericAPIView):
+    """
+    토큰 검증용 공개키 목록(JWKS)을 반환합니다.
+    다른 서비스는 이 공개키로 DB 조회나 공유 비밀키 없이 토큰을 검증할 수 있습니다.
+    """
+
+    permission_classes = [AllowAny]
+    authentication_classes = []
+    jwks_max_age = 60 * 60
+
+    def get(self, request):
+        response = Response(token_service.get_jwks())
+        response["Cache-Control"] = f"public, max-age={self.jwks_max_age}"
+        return response
+
+
 class GoogleLogin(SocialLoginView):
     """
     사용자가 구글 로그인을 할 때 사용, 구글 로그인을 위한 소셜 로그인 뷰입니다.
@@ -186,8 +195,7 @@ class GoogleLogin(SocialLoginView):
             user.set_unusable_password()
             user.save()
 
-        access_token = generate_access_token(user)
-        refresh_token = generate_refresh_token(user)
+        access_token, refresh_token = token_service.issue_tokens(user)
 
         response = redirect(settings.LOGIN_REDIRECT_URL)
         same_site = None if settings.DEBUG else "Lax"
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.1 on 2026-10-19 14:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('materials', '0010_image_url_video_url'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='video',
+            name='duration',
+            field=models.PositiveIntegerField(default=0, verbose_name='동영상 길이(초)'),
+        ),
+    ]
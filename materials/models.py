@@ -80,6 +80,7 @@ class Video(models.Model):
         verbose_name="동영상 URL",
         default="https://www.youtube.com/watch?v=bZh8oUIDfdI&t=1s",
     )
+    duration = models.PositiveIntegerField(default=0, verbose_name="동영상 길이(초)")
     is_deleted = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -1,8 +1,7 @@
-import cv2
-from PIL import Image as PILImage
 from rest_framework import serializers
 
 from .models import Image, Video, VideoEventData
+from .services import ImageProcessingService, MediaProcessingError
 
 
 class ImageSerializer(serializers.ModelSerializer):
@@ -13,6 +12,7 @@ class ImageSerializer(serializers.ModelSerializer):
     """
 
     file = serializers.ImageField(write_only=True)
+    image_processing_service = ImageProcessingService()
 
     class Meta:
         model = Image
@@ -40,10 +40,9 @@ class ImageSerializer(serializers.ModelSerializer):
             )
 
         try:
-            img = PILImage.open(value)
-            img.verify()
-        except Exception:
-            raise serializers.ValidationError("유효한 이미지 파일이 아닙니다.")
+            self.image_processing_service.verify(value)
+        except MediaProcessingError as e:
+            raise serializers.ValidationError(str(e))
         return value
 
 
@@ -62,11 +61,19 @@ class VideoSerializer(serializers.ModelSerializer):
             "id",
             "url",
             "file",
+            "duration",
+            "is_deleted",
+            "created_at",
+            "updated_at",
+        ]
+        read_only_fields = [
+            "id",
+            "url",
+            "duration",
             "is_deleted",
             "created_at",
             "updated_at",
         ]
-        read_only_fields = ["id", "url", "is_deleted", "created_at", "updated_at"]
 
     def validate_file(self, value):
         allowed_extensions = ["mp4", "avi", "mov", "wmv"]
@@ -153,14 +160,14 @@ class VideoEventDataSerializer(serializers.ModelSerializer):
     def create(self, validated_data):
         video_url = validated_data.pop("video_url", None)
 
-        try:
-            video_instance = Video.objects.get(video_url=video_url)
-        except Video.DoesNotExist:
-            raise serializers.ValidationError(
-                "해당 URL과 일치하는 영상 파일이 없습니다."
-            )
-        video_event_data = VideoEventData.objects.create(
-            video=video_instance, **validated_data
-        )
+        # 뷰에서 동영상을 지정한 경우 URL로 다시 조회하지 않습니다.
+        if validated_data.get("video") is None:
+            try:
+                validated_data["video"] = Video.objects.get(url=video_url)
+            except Video.DoesNotExist:
+                raise serializers.ValidationError(
+                    "해당 URL과 일치하는 영상 파일이 없습니다."
+                )
+        video_event_data = VideoEventData.objects.create(**validated_data)
 
         return video_event_data
@@ -0,0 +1,181 @@
+import io
+import os
+import subprocess
+import tempfile
+import threading
+
+from django.conf import settings
+
+# 미디어 코덱(PIL, ffmpeg)과 클라우드 SDK(boto3)는 모듈 로드 시 수백 ms와 수십 MB를 사용하므로,
+# 이 모듈에서는 최상단에서 import하지 않고 처음 사용하는 시점에 불러옵니다.
+# (weaverse/test/test_import_time.py에서 URL 로딩 시 import되지 않는지 확인합니다.)
+
+
+class StorageError(Exception):
+    """
+    파일 저장소(S3) 요청이 실패했을 때 발생하는 예외입니다.
+    """
+
+
+class MediaProcessingError(Exception):
+    """
+    이미지/동영상 파일을 처리할 수 없을 때 발생하는 예외입니다.
+    """
+
+
+class S3StorageService:
+    """
+    S3에 미디어 파일을 업로드하고 삭제하는 클래스입니다.
+    - boto3 클라이언트는 첫 요청 시 생성하여 프로세스 안에서 재사용합니다.
+    - botocore의 ClientError는 StorageError로 변환하여 뷰가 SDK에 의존하지 않도록 합니다.
+    """
+
+    def __init__(self):
+        self._client = None
+        self._lock = threading.Lock()
+
+    @property
+    def client(self):
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    import boto3
+
+                    self._client = boto3.client(
+                        "s3",
+                        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+                        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+                        region_name=settings.AWS_S3_REGION_NAME,
+                    )
+        return self._client
+
+    def upload(self, file_io, file_name, content_type):
+        """
+        파일을 업로드하고 공개 URL을 반환합니다.
+        """
+        self._call(
+            "upload_fileobj",
+            file_io,
+            settings.AWS_STORAGE_BUCKET_NAME,
+            file_name,
+            ExtraArgs={"ContentType": content_type},
+        )
+        return self.get_url(file_name)
+
+    def delete(self, key):
+        self._call("delete_object", Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=key)
+
+    def get_url(self, file_name):
+        return f"https://{settings.AWS_S3_CUSTOM_DOMAIN}/{file_name}"
+
+    def _call(self, method, *args, **kwargs):
+        from botocore.exceptions import BotoCoreError, ClientError
+
+        try:
+            return getattr(self.client, method)(*args, **kwargs)
+        except (BotoCoreError, ClientError) as e:
+            raise StorageError(str(e)) from e
+
+
+class ImageProcessingService:
+    """
+    업로드된 이미지 파일을 검사하고 최적화하는 클래스입니다.
+    """
+
+    max_size = (800, 600)
+    quality = 85
+
+    def verify(self, image_file):
+        """
+        이미지 파일이 손상되지 않았는지 확인합니다.
+        """
+        from PIL import Image as PILImage
+
+        try:
+            PILImage.open(image_file).verify()
+        except Exception as e:
+            raise MediaProcessingError("유효한 이미지 파일이 아닙니다.") from e
+        finally:
+            image_file.seek(0)
+
+    def optimize(self, image_file):
+        """
+        이미지 파일을 최적화합니다.
+        - 포맷 변환
+        - 리사이징
+        - 필터링
+        """
+        from PIL import Image as PILImage
+        from PIL import ImageFilter
+
+        img = PILImage.open(image_file)
+        img = img.convert("RGB")
+        img.thumbnail(self.max_size)
+        img = img.filter(ImageFilter.SHARPEN)
+
+        optimized_io = io.BytesIO()
+        img.save(optimized_io, format="JPEG", quality=self.quality)
+        optimized_io.seek(0)
+
+        return optimized_io
+
+
+class VideoProcessingService:
+    """
+    업로드된 동영상 파일을 웹 재생용 MP4(H.264)로 변환하고 길이를 확인하는 클래스입니다.
+    """
+
+    crf = 28
+
+    def probe_duration(self, video_file):
+        """
+        ffprobe로 동영상 길이(초)를 확인합니다.
+        """
+        import ffmpeg
+
+        with tempfile.TemporaryDirectory() as directory:
+            source = self._write_source(video_file, directory)
+            try:
+                probe = ffmpeg.probe(source)
+                return round(float(probe["format"]["duration"]))
+            except (
+                ffmpeg.Error,
+                OSError,
+                subprocess.SubprocessError,
+                KeyError,
+                ValueError,
+            ) as e:
+                raise MediaProcessingError("동영상 길이를 확인할 수 없습니다.") from e
+            finally:
+                video_file.seek(0)
+
+    def optimize(self, video_file):
+        import ffmpeg
+
+        with tempfile.TemporaryDirectory() as directory:
+            source = self._write_source(video_file, directory)
+            target = os.path.join(directory, "optimized.mp4")
+            try:
+                (
+                    ffmpeg.input(source)
+                    .output(
+                        target,
+                        vcodec="libx264",
+                        crf=self.crf,
+                        acodec="aac",
+                        movflags="+faststart",
+                    )
+                    .run(quiet=True, overwrite_output=True)
+                )
+            except (ffmpeg.Error, OSError, subprocess.SubprocessError) as e:
+                raise MediaProcessingError("동영상 파일을 변환할 수 없습니다.") from e
+
+            with open(target, "rb") as f:
+                return io.BytesIO(f.read())
+
+    def _write_source(self, video_file, directory):
+        source = os.path.join(directory, "source")
+        with open(source, "wb") as f:
+            for chunk in video_file.chunks():
+                f.write(chunk)
+        return source
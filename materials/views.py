@@ -1,14 +1,8 @@
-import io
+import logging
 import time
 
-import boto3
-import ffmpeg
-from botocore.exceptions import ClientError
-from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.shortcuts import get_object_or_404
-from PIL import Image as PILImage
-from PIL import ImageFilter
 from rest_framework import generics, permissions, status
 from rest_framework.exceptions import NotFound, PermissionDenied
 from rest_framework.parsers import FormParser, MultiPartParser
@@ -16,49 +10,58 @@ from rest_framework.response import Response
 
 from accounts.models import CustomUser
 from accounts.permissions import IsSuperUser, IsTutor
+from courses.counters import CatalogCounter
+from courses.models import Topic
+from payments.services import EntitlementService
 
 from .models import Image, Video, VideoEventData
 from .serializers import ImageSerializer, VideoEventDataSerializer, VideoSerializer
+from .services import (
+    ImageProcessingService,
+    MediaProcessingError,
+    S3StorageService,
+    StorageError,
+    VideoProcessingService,
+)
 
 User = get_user_model()
 
+logger = logging.getLogger(__name__)
 
-def optimize_image(image_file):
-    """
-    이미지 파일을 최적화합니다.
-    - 포맷 변환
-    - 리사이징
-    - 필터링
-    """
+# 미디어 처리와 S3 클라이언트는 처음 사용하는 시점에 초기화됩니다.
+storage_service = S3StorageService()
+image_processing_service = ImageProcessingService()
+video_processing_service = VideoProcessingService()
+catalog_counter = CatalogCounter()
 
-    img = PILImage.open(image_file)
-    img = img.convert("RGB")
-    img.thumbnail((800, 600))
-    img = img.filter(ImageFilter.SHARPEN)
 
-    optimized_io = io.BytesIO()
-    img.save(optimized_io, format="JPEG", quality=85)
-    optimized_io.seek(0)
-
-    return optimized_io
+def probe_video_duration(video_file):
+    """
+    동영상 길이(초)를 확인합니다.
+    길이는 부가 정보이므로 ffprobe가 없거나 컨테이너를 해석하지 못하면
+    경고를 남기고 0을 반환하여 업로드를 계속합니다.
+    """
+    try:
+        return video_processing_service.probe_duration(video_file)
+    except MediaProcessingError as e:
+        logger.warning(
+            f"동영상 길이 확인 실패 ({video_file.name}): {str(e.__cause__ or e)}"
+        )
+        return 0
 
 
-def upload_to_s3(file_io, file_name, content_type):
+def refresh_course_counters(video):
     """
-    파일을 S3에 업로드합니다.
+    동영상이 주제에 연결되어 있으면 해당 코스의 동영상 총 길이를 다시 계산합니다.
     """
-    s3_client = boto3.client(
-        "s3",
-        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-        region_name=settings.AWS_S3_REGION_NAME,
-    )
-    s3_client.upload_fileobj(
-        file_io,
-        settings.AWS_STORAGE_BUCKET_NAME,
-        file_name,
-        ExtraArgs={"ContentType": content_type},
+    if video.topic_id is None:
+        return
+    course_id = (
+        Topic.objects.filter(pk=video.topic_id)
+        .values_list("lecture__course_id", flat=True)
+        .first()
     )
+    catalog_counter.refresh_course_structure([course_id])
 
 
 class ImageCreateView(generics.CreateAPIView):
@@ -67,7 +70,7 @@ class ImageCreateView(generics.CreateAPIView):
     - 권한: 인증된 사용자만이 이미지 파일을 업로드할 수 있습니다.
     - 위치: S3에서 'images/사용자 식별자(user_id)' 폴더에 이미지 파일을 업로드합니다.
     - 사용자 편의성: 파일명 중복을 피하기 위해, 생성 시간을 포함시킵니다.
-    - 에러: AWS S3에 대한 요청이 실패했을 때 발생했을 때 ClientError를 발생시킵니다.
+    - 에러: AWS S3에 대한 요청이 실패했을 때 발생했을 때 StorageError를 발생시킵니다.
     """
 
     queryset = Image.objects.all()
@@ -86,7 +89,7 @@ class ImageCreateView(generics.CreateAPIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        optimized_image = optimize_image(image_file)
+        optimized_image = image_processing_service.optimize(image_file)
         try:
             user = get_object_or_404(CustomUser, id=request.user.id)
 
@@ -99,16 +102,14 @@ class ImageCreateView(generics.CreateAPIView):
                     status=status.HTTP_400_BAD_REQUEST,
                 )
 
-            upload_to_s3(optimized_image, file_name, "image/jpeg")
-
-            file_url = f"https://{settings.AWS_S3_CUSTOM_DOMAIN}/{file_name}"
+            file_url = storage_service.upload(optimized_image, file_name, "image/jpeg")
 
             image = Image.objects.create(author=user, url=file_url)
 
             return Response(
                 self.get_serializer(image).data, status=status.HTTP_201_CREATED
             )
-        except ClientError as e:
+        except StorageError as e:
             return Response(
                 {"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
@@ -133,7 +134,7 @@ class ImageRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
     - 권한: 인증된 사용자만이 이미지 파일을 갱신할 수 있습니다.
     - 위치: S3에서 'images/사용자 식별자(user_id)' 폴더에 이미지 파일을 업로드합니다.
     - 사용자 편의성: 파일명 중복을 피하기 위해, 생성 시간을 포함시킵니다.
-    - 에러: AWS S3에 대한 요청이 실패했을 때 발생했을 때 ClientError를 발생시킵니다.
+    - 에러: AWS S3에 대한 요청이 실패했을 때 발생했을 때 StorageError를 발생시킵니다.
     """
 
     queryset = Image.objects.all()
@@ -160,20 +161,11 @@ class ImageRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+        optimized_image = None
         try:
+            storage_service.delete(image.url.split("/")[-1])
 
-            s3_client = boto3.client(
-                "s3",
-                aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-                aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-                region_name=settings.AWS_S3_REGION_NAME,
-            )
-            s3_client.delete_object(
-                Bucket=settings.AWS_STORAGE_BUCKET_NAME,
-                Key=image.image_url.split("/")[-1],
-            )
-
-            optimized_image = self.optimize_image(image_file)
+            optimized_image = image_processing_service.optimize(image_file)
 
             user = get_object_or_404(CustomUser, id=request.data.get("user_id"))
 
@@ -181,14 +173,12 @@ class ImageRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
                 timestamp = int(time.time())
                 file_name = f"images/user_{image.user.id}/{timestamp}_{image_file.name}"
 
-            upload_to_s3(optimized_image, file_name, "image/jpeg")
-
-            file_url = f"https://{settings.AWS_S3_CUSTOM_DOMAIN}/{file_name}"
+            file_url = storage_service.upload(optimized_image, file_name, "image/jpeg")
 
             image = serializer.save(url=file_url)
 
             return Response(self.get_serializer(image).data, status=status.HTTP_200_OK)
-        except ClientError as e:
+        except StorageError as e:
             return Response(
                 {"error": str(e)},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -214,7 +204,7 @@ class ImageRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
             image.is_deleted = True
             image.save()
             return Response(status=status.HTTP_204_NO_CONTENT)
-        except ClientError as e:
+        except StorageError as e:
             return Response(
                 {"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
@@ -226,7 +216,8 @@ class VideoCreateView(generics.CreateAPIView):
     - 권한: 인증된 사용자 중 강사와 수퍼유저만이 동영상 파일을 업로드할 수 있습니다.
     - 위치: S3에서 'videos/사용자 식별자(user_id)' 폴더에 동영상 파일을 업로드합니다.
     - 사용자 편의성: 파일명 중복을 피하기 위해, 생성 시간을 포함시킵니다.
-    - 에러: AWS S3에 대한 요청이 실패했을 때 발생했을 때 ClientError를 발생시킵니다.
+    - 길이: ffprobe로 확인한 동영상 길이(초)를 저장하며, 확인하지 못하면 0을 저장합니다.
+    - 에러: AWS S3에 대한 요청이 실패했을 때 발생했을 때 StorageError를 발생시킵니다.
     """
 
     queryset = Video.objects.all()
@@ -246,22 +237,22 @@ class VideoCreateView(generics.CreateAPIView):
             )
 
         try:
+            duration = probe_video_duration(video_file)
+
             user = get_object_or_404(CustomUser, id=request.user.id)
 
             if user:
                 timestamp = int(time.time())
                 file_name = f"videos/user_{user.id}/{timestamp}_{video_file.name}"
 
-            upload_to_s3(video_file, file_name, "video/mp4")
+            file_url = storage_service.upload(video_file, file_name, "video/mp4")
 
-            file_url = f"https://{settings.AWS_S3_CUSTOM_DOMAIN}/{file_name}"
-
-            video = Video.objects.create(url=file_url)
+            video = Video.objects.create(url=file_url, duration=duration)
 
             return Response(
                 self.get_serializer(video).data, status=status.HTTP_201_CREATED
             )
-        except ClientError as e:
+        except StorageError as e:
             return Response(
                 {"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
@@ -284,7 +275,8 @@ class VideoRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
     - 권한: 인증된 사용자 중 수퍼유저만이 이미지 파일을 갱신할 수 있습니다.
     - 위치: S3에서 'videos/사용자 식별자(user_id)' 폴더에 이미지 파일을 업로드합니다.
     - 사용자 편의성: 파일명 중복을 피하기 위해, 생성 시간을 포함시킵니다.
-    - 에러: AWS S3에 대한 요청이 실패했을 때 발생했을 때 ClientError를 발생시킵니다.
+    - 길이: 동영상 길이(초)를 다시 확인하고, 수정/삭제 후 코스의 동영상 총 길이를 다시 계산합니다.
+    - 에러: AWS S3에 대한 요청이 실패했을 때 발생했을 때 StorageError를 발생시킵니다.
     """
 
     queryset = Video.objects.all()
@@ -293,10 +285,21 @@ class VideoRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
 
     def check_object_permissions(self, request, obj):
         if request.method in ["PUT", "PATCH", "DELETE"]:
-            if not request.user.is_staff and obj.topic.course.tutor != request.user:
+            if not request.user.is_staff and not self.is_course_author(request, obj):
                 raise PermissionDenied("접근 권한이 없습니다.")
         return super().check_object_permissions(request, obj)
 
+    def is_course_author(self, request, video):
+        """
+        동영상에는 소유자 필드가 없으므로, 동영상이 연결된 코스의 작성자를 소유자로 봅니다.
+        """
+        return (
+            video.topic_id is not None
+            and Topic.objects.filter(
+                pk=video.topic_id, lecture__course__author=request.user
+            ).exists()
+        )
+
     def put(self, request, *args, **kwargs):
         video = self.get_object()
         serializer = self.get_serializer(video, data=request.data, partial=True)
@@ -309,20 +312,12 @@ class VideoRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+        optimized_video = None
         try:
+            duration = probe_video_duration(video_file)
+            optimized_video = video_processing_service.optimize(video_file)
 
-            optimized_video = self.optimize_video(video_file)
-
-            s3_client = boto3.client(
-                "s3",
-                aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-                aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-                region_name=settings.AWS_S3_REGION_NAME,
-            )
-            s3_client.delete_object(
-                Bucket=settings.AWS_STORAGE_BUCKET_NAME,
-                Key=video.url.split("/")[-1],
-            )
+            storage_service.delete(video.url.split("/")[-1])
 
             user = get_object_or_404(CustomUser, id=request.data.get("user_id"))
 
@@ -330,15 +325,17 @@ class VideoRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
                 timestamp = int(time.time())
                 file_name = f"videos/user_{user.id}/{timestamp}_{video_file.name}"
 
-            upload_to_s3(optimized_video, file_name, "video/mp4")
-
-            file_url = f"https://{settings.AWS_S3_CUSTOM_DOMAIN}/{file_name}"
+            file_url = storage_service.upload(optimized_video, file_name, "video/mp4")
 
             serializer.validated_data["url"] = file_url
+            serializer.validated_data["duration"] = duration
             video = serializer.save()
+            refresh_course_counters(video)
 
             return Response(self.get_serializer(video).data, status=status.HTTP_200_OK)
-        except ClientError as e:
+        except MediaProcessingError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except StorageError as e:
             return Response(
                 {"error": str(e)},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -354,17 +351,12 @@ class VideoRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
     def delete(self, request, *args, **kwargs):
         video = self.get_object()
 
-        if video.user != request.user:
-            return Response(
-                {"error": "해당 동영상에 대한 권한이 없습니다."},
-                status=status.HTTP_403_FORBIDDEN,
-            )
-
         try:
             video.is_deleted = True
             video.save()
+            refresh_course_counters(video)
             return Response(status=status.HTTP_204_NO_CONTENT)
-        except ClientError as e:
+        except StorageError as e:
             return Response(
                 {"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
@@ -379,6 +371,7 @@ class UserVideoEventCreateView(generics.CreateAPIView):
     queryset = VideoEventData.objects.all()
     serializer_class = VideoEventDataSerializer
     permission_classes = [permissions.IsAuthenticated]
+    entitlement_service = EntitlementService()
 
     def perform_create(self, serializer):
         user_id = self.kwargs["user_id"]
@@ -394,7 +387,13 @@ class UserVideoEventCreateView(generics.CreateAPIView):
         video_id = request.data.get("video_id")
 
         user = get_object_or_404(CustomUser, id=user_id)
-        video = get_object_or_404(Video, id=video_id)
+        video = get_object_or_404(
+            Video.objects.select_related("topic__lecture"), id=video_id
+        )
+        if video.topic and not self.entitlement_service.has_topic_access(
+            request, video.topic
+        ):
+            raise PermissionDenied("해당 동영상을 시청할 권한이 없습니다.")
 
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
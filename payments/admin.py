@@ -1,6 +1,14 @@
 from django.contrib import admin
 
-from .models import Cart, Order, OrderItem, Payment, UserBillingAddress
+from .models import (
+    Cart,
+    DailySalesRollup,
+    Entitlement,
+    Order,
+    OrderItem,
+    Payment,
+    UserBillingAddress,
+)
 
 admin.site.register(OrderItem)
 
@@ -37,3 +45,24 @@ class UserBillingAddressAdmin(admin.ModelAdmin):
     list_display = ("user", "country", "main_address", "is_default")
     list_filter = ("country", "is_default")
     search_fields = ("user__email", "user__nickname", "main_address")
+
+
+@admin.register(Entitlement)
+class EntitlementAdmin(admin.ModelAdmin):
+    list_display = ("user", "course", "expires_at", "updated_at")
+    search_fields = ("user__email", "user__nickname", "course__title")
+    raw_id_fields = ("user", "course")
+
+
+@admin.register(DailySalesRollup)
+class DailySalesRollupAdmin(admin.ModelAdmin):
+    list_display = (
+        "date",
+        "dimension",
+        "dimension_label",
+        "revenue",
+        "units",
+        "refund_amount",
+    )
+    list_filter = ("dimension", "date")
+    search_fields = ("dimension_key", "dimension_label")
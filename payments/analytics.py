@@ -0,0 +1,147 @@
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from .models import AnalyticsWatermark, DailySalesRollup, OrderItem, Payment
+
+
+class SalesRollupService:
+    """
+    결제 데이터를 일별 매출 집계 테이블로 구성하는 클래스입니다.
+    - 워터마크 이후 변경된 결제만 찾아 해당 결제가 속한 날짜를 다시 집계합니다.
+    - 날짜 단위로 삭제 후 다시 생성하므로 여러 번 실행해도 결과가 같습니다.
+    """
+
+    watermark_name = "daily_sales_rollup"
+    # 집계 도중 커밋된 결제를 놓치지 않도록 워터마크 이전 구간을 겹쳐서 확인합니다.
+    overlap = timezone.timedelta(minutes=5)
+
+    def build(self, full=False):
+        """
+        변경된 결제가 속한 날짜의 매출 집계를 다시 구성합니다.
+        full=True이면 모든 결제를 다시 집계합니다.
+        """
+        now = timezone.now()
+        watermark = None if full else self.get_watermark()
+
+        payments = Payment.objects.filter(
+            payment_status__in=[Payment.Status.COMPLETED, Payment.Status.REFUNDED],
+            updated_at__lte=now,
+        )
+        if watermark:
+            payments = payments.filter(updated_at__gt=watermark - self.overlap)
+
+        dates = set()
+        for paid_at, cancelled_at in payments.values_list("paid_at", "cancelled_at"):
+            for moment in (paid_at, cancelled_at):
+                if moment:
+                    dates.add(timezone.localdate(moment))
+
+        self.rebuild_dates(dates)
+        AnalyticsWatermark.objects.update_or_create(
+            name=self.watermark_name, defaults={"processed_until": now}
+        )
+        return dates
+
+    def get_watermark(self):
+        return (
+            AnalyticsWatermark.objects.filter(name=self.watermark_name)
+            .values_list("processed_until", flat=True)
+            .first()
+        )
+
+    @transaction.atomic
+    def rebuild_dates(self, dates):
+        """
+        주어진 날짜들의 매출 집계를 결제 데이터로부터 다시 생성합니다.
+        """
+        if not dates:
+            return 0
+
+        rollups = defaultdict(lambda: defaultdict(int))
+        labels = {}
+
+        sales_rows = self._aggregate(
+            "paid_at", [Payment.Status.COMPLETED, Payment.Status.REFUNDED], dates
+        )
+        refund_rows = self._aggregate("cancelled_at", [Payment.Status.REFUNDED], dates)
+        for rows, amount_field, units_field in (
+            (sales_rows, "revenue", "units"),
+            (refund_rows, "refund_amount", "refund_units"),
+        ):
+            for row in rows:
+                for key, label in self._get_dimension_keys(row):
+                    rollups[key][amount_field] += row["amount"] or 0
+                    rollups[key][units_field] += row["units"] or 0
+                    labels[key] = label
+
+        DailySalesRollup.objects.filter(date__in=dates).delete()
+        DailySalesRollup.objects.bulk_create(
+            DailySalesRollup(
+                date=date,
+                dimension=dimension,
+                dimension_key=dimension_key,
+                dimension_label=labels[(date, dimension, dimension_key)],
+                **values,
+            )
+            for (date, dimension, dimension_key), values in rollups.items()
+        )
+        return len(rollups)
+
+    def _aggregate(self, date_field, payment_statuses, dates):
+        """
+        결제 일시(또는 취소 일시) 기준 날짜별, 상품별 금액과 수량을 집계합니다.
+        - 상품명과 카테고리는 주문 시점의 스냅샷을 사용하므로 이후 코스 정보가 바뀌어도 과거 집계는 같습니다.
+        """
+        payment_date_field = f"order__payments__{date_field}"
+        return (
+            OrderItem.objects.filter(
+                order__payments__payment_status__in=payment_statuses,
+                **{f"{payment_date_field}__date__in": dates},
+            )
+            .annotate(date=TruncDate(payment_date_field))
+            .values(
+                "date",
+                "course_id",
+                "curriculum_id",
+                "item_name",
+                "category",
+            )
+            .annotate(amount=Sum("total_price"), units=Sum("quantity"))
+            .order_by()
+        )
+
+    def _get_dimension_keys(self, row):
+        """
+        집계 행이 반영될 (날짜, 집계 단위, 집계 키)와 이름 목록을 반환합니다.
+        """
+        date = row["date"]
+        keys = []
+        if row["curriculum_id"]:
+            keys.append(
+                (
+                    (
+                        date,
+                        DailySalesRollup.Dimension.CURRICULUM,
+                        str(row["curriculum_id"]),
+                    ),
+                    row["item_name"],
+                )
+            )
+        elif row["course_id"]:
+            keys.append(
+                (
+                    (date, DailySalesRollup.Dimension.COURSE, str(row["course_id"])),
+                    row["item_name"],
+                )
+            )
+
+        category = row["category"]
+        if category:
+            keys.append(
+                ((date, DailySalesRollup.Dimension.CATEGORY, category), category)
+            )
+        return keys
@@ -0,0 +1,31 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from payments.analytics import SalesRollupService
+
+
+class Command(BaseCommand):
+    """
+    워터마크 이후 변경된 결제를 기준으로 일별 매출 집계를 갱신합니다.
+    """
+
+    help = "변경된 결제가 속한 날짜의 일별 매출 집계(DailySalesRollup)를 갱신합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="워터마크를 무시하고 모든 결제를 다시 집계합니다.",
+        )
+
+    def handle(self, *args, **options):
+        started_at = time.monotonic()
+        dates = SalesRollupService().build(full=options["full"])
+        elapsed = time.monotonic() - started_at
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{len(dates)}일의 매출 집계를 갱신했습니다. ({elapsed:.2f}초)"
+            )
+        )
@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand
+
+from payments.models import Order
+from payments.services import EntitlementService
+
+
+class Command(BaseCommand):
+    """
+    완료된 주문을 가진 모든 사용자의 수강 권한을 다시 구성합니다.
+    """
+
+    help = "완료된 주문으로부터 수강 권한(Entitlement) 테이블을 다시 구성합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="한 번에 처리할 사용자 수",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        entitlement_service = EntitlementService()
+
+        user_ids = list(
+            Order.objects.filter(order_status="completed")
+            .values_list("user_id", flat=True)
+            .distinct()
+            .order_by("user_id")
+        )
+        total = 0
+        for start in range(0, len(user_ids), batch_size):
+            total += entitlement_service.refresh_for_users(
+                user_ids[start : start + batch_size]
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{len(user_ids)}명의 사용자에 대해 {total}개의 수강 권한을 구성했습니다."
+            )
+        )
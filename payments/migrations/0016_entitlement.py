@@ -0,0 +1,35 @@
+# Generated by Django 5.1.1 on 2026-10-19 12:10
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0010_remove_topic_description'),
+        ('payments', '0015_alter_cart_options_alter_order_options_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Entitlement',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('expires_at', models.DateTimeField(verbose_name='만료일')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일')),
+                ('course', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='entitlements', to='courses.course', verbose_name='코스')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='entitlements', to=settings.AUTH_USER_MODEL, verbose_name='사용자')),
+            ],
+            options={
+                'verbose_name': '수강 권한',
+                'verbose_name_plural': '수강 권한 목록',
+                'ordering': ['-expires_at'],
+                'indexes': [models.Index(fields=['user', 'expires_at'], name='payments_en_user_id_6eef8c_idx')],
+                'constraints': [models.UniqueConstraint(fields=('user', 'course'), name='unique_user_course_entitlement')],
+            },
+        ),
+    ]
@@ -0,0 +1,83 @@
+# Generated by Django 5.1.1 on 2026-10-19 12:17
+
+from django.db import migrations, models
+from django.db.models import F, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+
+def capture_price_snapshot(apps, schema_editor):
+    """
+    기존 주문 상품과 결제에 현재 가격 기준의 스냅샷을 기록합니다.
+    """
+    Course = apps.get_model('courses', 'Course')
+    Curriculum = apps.get_model('courses', 'Curriculum')
+    OrderItem = apps.get_model('payments', 'OrderItem')
+    Payment = apps.get_model('payments', 'Payment')
+
+    curriculums = Curriculum.objects.filter(id=OuterRef('curriculum_id'))
+    OrderItem.objects.filter(curriculum__isnull=False).update(
+        item_name=Subquery(curriculums.values('name')[:1]),
+        unit_price=Subquery(curriculums.values('price')[:1]),
+    )
+    courses = Course.objects.filter(id=OuterRef('course_id'))
+    OrderItem.objects.filter(curriculum__isnull=True, course__isnull=False).update(
+        item_name=Subquery(courses.values('title')[:1]),
+        unit_price=Subquery(courses.values('price')[:1]),
+    )
+    OrderItem.objects.filter(curriculum__isnull=True, course__isnull=True).update(
+        item_name='알 수 없는 상품'
+    )
+    OrderItem.objects.update(total_price=F('unit_price') * F('quantity'))
+
+    order_items = OrderItem.objects.filter(order_id=OuterRef('order_id'))
+    Payment.objects.update(
+        item_name=Coalesce(
+            Subquery(order_items.order_by('id').values('item_name')[:1]), Value('')
+        ),
+        total_items=Coalesce(
+            Subquery(
+                order_items.order_by()
+                .values('order_id')
+                .annotate(total=Sum('quantity'))
+                .values('total')
+            ),
+            0,
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0010_remove_topic_description'),
+        ('payments', '0016_entitlement'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='orderitem',
+            name='item_name',
+            field=models.CharField(blank=True, default='', max_length=255, verbose_name='상품명'),
+        ),
+        migrations.AddField(
+            model_name='orderitem',
+            name='total_price',
+            field=models.PositiveIntegerField(default=0, verbose_name='합계 금액'),
+        ),
+        migrations.AddField(
+            model_name='orderitem',
+            name='unit_price',
+            field=models.PositiveIntegerField(default=0, verbose_name='단가'),
+        ),
+        migrations.AddField(
+            model_name='payment',
+            name='item_name',
+            field=models.CharField(blank=True, default='', max_length=255, verbose_name='상품명'),
+        ),
+        migrations.AddField(
+            model_name='payment',
+            name='total_items',
+            field=models.PositiveIntegerField(default=0, verbose_name='상품 수량'),
+        ),
+        migrations.RunPython(capture_price_snapshot, migrations.RunPython.noop),
+    ]
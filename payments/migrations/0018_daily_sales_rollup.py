@@ -0,0 +1,48 @@
+# Generated by Django 5.1.1 on 2026-10-19 12:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0017_orderitem_price_snapshot'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AnalyticsWatermark',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True, verbose_name='작업 이름')),
+                ('processed_until', models.DateTimeField(verbose_name='처리 완료 시점')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일')),
+            ],
+            options={
+                'verbose_name': '집계 워터마크',
+                'verbose_name_plural': '집계 워터마크 목록',
+            },
+        ),
+        migrations.CreateModel(
+            name='DailySalesRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(verbose_name='집계일')),
+                ('dimension', models.CharField(choices=[('course', '코스'), ('curriculum', '커리큘럼'), ('category', '카테고리')], max_length=20, verbose_name='집계 단위')),
+                ('dimension_key', models.CharField(max_length=255, verbose_name='집계 키')),
+                ('dimension_label', models.CharField(blank=True, default='', max_length=255, verbose_name='집계 대상 이름')),
+                ('revenue', models.PositiveBigIntegerField(default=0, verbose_name='매출')),
+                ('units', models.PositiveIntegerField(default=0, verbose_name='판매 수량')),
+                ('refund_amount', models.PositiveBigIntegerField(default=0, verbose_name='환불 금액')),
+                ('refund_units', models.PositiveIntegerField(default=0, verbose_name='환불 수량')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일')),
+            ],
+            options={
+                'verbose_name': '일별 매출 집계',
+                'verbose_name_plural': '일별 매출 집계 목록',
+                'ordering': ['-date', 'dimension', 'dimension_key'],
+                'indexes': [models.Index(fields=['dimension', 'date'], name='payments_da_dimensi_65a66a_idx')],
+                'constraints': [models.UniqueConstraint(fields=('date', 'dimension', 'dimension_key'), name='unique_daily_sales_rollup')],
+            },
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.1.1 on 2026-10-19 15:40
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def capture_category_snapshot(apps, schema_editor):
+    """
+    기존 주문 상품에 현재 코스, 커리큘럼 기준의 카테고리 스냅샷을 기록합니다.
+    """
+    Course = apps.get_model('courses', 'Course')
+    Curriculum = apps.get_model('courses', 'Curriculum')
+    OrderItem = apps.get_model('payments', 'OrderItem')
+
+    curriculums = Curriculum.objects.filter(id=OuterRef('curriculum_id'))
+    OrderItem.objects.filter(curriculum__isnull=False).update(
+        category=Subquery(curriculums.values('category')[:1]),
+    )
+    courses = Course.objects.filter(id=OuterRef('course_id'))
+    OrderItem.objects.filter(curriculum__isnull=True, course__isnull=False).update(
+        category=Subquery(courses.values('category')[:1]),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0011_course_counters'),
+        ('payments', '0018_daily_sales_rollup'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='orderitem',
+            name='category',
+            field=models.CharField(blank=True, default='', max_length=255, verbose_name='카테고리'),
+        ),
+        migrations.RunPython(capture_category_snapshot, migrations.RunPython.noop),
+    ]
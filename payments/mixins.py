@@ -1,18 +1,20 @@
+from django.core.cache import cache
 from django.db import transaction
+from django.db.models import Prefetch, prefetch_related_objects
 from django.utils import timezone
 from rest_framework import status
 from rest_framework.exceptions import NotFound, PermissionDenied, ValidationError
 from rest_framework.response import Response
 
-from .models import Cart, CartItem, Order, Payment, UserBillingAddress
-from .services import KakaoPayService
+from .models import Cart, CartItem, Order, OrderItem, Payment, UserBillingAddress
+from .services import EntitlementService, KakaoPayService, OrderItemExpiryService
 
 
 class GetObjectMixin:
     def get_object_or_404(self, queryset, *filter_args, **filter_kwargs):
         try:
             obj = queryset.get(*filter_args, **filter_kwargs)
-            if hasattr(obj, "user") and obj.user != self.request.user:
+            if hasattr(obj, "user_id") and obj.user_id != self.request.user.id:
                 raise PermissionDenied("이 객체에 접근할 권한이 없습니다.")
             return obj
         except queryset.model.DoesNotExist:
@@ -27,6 +29,20 @@ class CartMixin(GetObjectMixin):
         cart, _ = Cart.objects.get_or_create(user=user)
         return cart
 
+    def get_cart_with_items(self, user):
+        """
+        장바구니 상품의 커리큘럼, 코스와 썸네일을 함께 조회한 장바구니를 반환합니다.
+        """
+        cart = self.get_cart(user)
+        prefetch_related_objects(
+            [cart],
+            Prefetch(
+                "cart_items",
+                queryset=CartItem.objects.select_related("curriculum", "course__image"),
+            ),
+        )
+        return cart
+
     def get_cart_item(self, cart, **kwargs):
         return self.get_object_or_404(CartItem.objects.filter(cart=cart), **kwargs)
 
@@ -79,7 +95,7 @@ class OrderMixin(GetObjectMixin):
                 "quantity": item.quantity,
                 "price": item.get_price(),
             }
-            for item in cart.cart_items.all()
+            for item in cart.cart_items.select_related("curriculum", "course")
         ]
 
         return {
@@ -131,6 +147,8 @@ class UserBillingAddressMixin(GetObjectMixin):
 
 class PaymentMixin(GetObjectMixin):
     kakao_pay_service = KakaoPayService()
+    order_item_expiry_service = OrderItemExpiryService()
+    entitlement_service = EntitlementService()
 
     def get_payment(self, user, select_for_update=False, **kwargs):
         queryset = Payment.objects.filter(user=user)
@@ -165,11 +183,15 @@ class PaymentMixin(GetObjectMixin):
             user=user, is_default=True
         ).first()
 
+        item_name, total_items = order.get_item_summary()
+
         payment = Payment.objects.create(
             order=order,
             user=user,
             payment_status="pending",
             amount=order.get_total_price(),
+            item_name=item_name,
+            total_items=total_items,
             transaction_id=kakao_response["tid"],
             billing_address=billing_address,
         )
@@ -192,8 +214,8 @@ class PaymentMixin(GetObjectMixin):
         order.order_status = "completed"
         order.save()
 
-        for order_item in order.order_items.all():
-            order_item.save()
+        self.order_item_expiry_service.activate(order)
+        self.entitlement_service.refresh_for_order(order)
 
     def cancel_payment(self, order, payment):
         payment.payment_status = "cancelled"
@@ -232,18 +254,21 @@ class PaymentMixin(GetObjectMixin):
         order.order_status = "refunded"
         order.save()
 
-        for order_item in order.order_items.all():
-            order_item.expiry_date = None
-            order_item.save()
+        self.order_item_expiry_service.deactivate(order)
+        self.entitlement_service.refresh_for_order(order)
 
 
 class ReceiptMixin(GetObjectMixin):
-    def get_receipt_list(self, user):
-        payments = Payment.objects.filter(
+    # 완료/환불된 영수증은 변경되지 않으므로 만료 없이 캐시합니다.
+    receipt_cache_timeout = None
+
+    def get_receipt_queryset(self, user):
+        return Payment.objects.filter(
             user=user, payment_status__in=["completed", "refunded"]
         ).order_by("-paid_at")
 
-        receipt_list = [
+    def get_receipt_list(self, payments):
+        return [
             {
                 "receipt_number": f"REC-{payment.id}",
                 "payment_status": payment.payment_status,
@@ -253,20 +278,44 @@ class ReceiptMixin(GetObjectMixin):
                     if payment.paid_at
                     else None
                 ),
-                "order_id": payment.order.id,
+                "order_id": payment.order_id,
+                "item_name": payment.item_name,
             }
             for payment in payments
         ]
 
-        return receipt_list
+    def get_receipt_cache_key(self, payment):
+        """
+        완료 또는 환불된 결제의 영수증 캐시 키를 반환합니다.
+        결제 상태가 키에 포함되므로 환불 시 새로운 영수증이 생성됩니다.
+        """
+        if payment.payment_status not in ["completed", "refunded"]:
+            return None
+        return f"receipt_{payment.id}_{payment.payment_status}"
 
     def get_receipt_detail(self, payment, user):
-        order = payment.order
+        cache_key = self.get_receipt_cache_key(payment)
+        receipt_data = cache.get(cache_key) if cache_key else None
+
+        if receipt_data is None:
+            receipt_data = self.build_receipt_detail(payment, user)
+            if cache_key:
+                cache.set(cache_key, receipt_data, timeout=self.receipt_cache_timeout)
+
+        return {
+            **receipt_data,
+            "issue_date": timezone.now().strftime("%Y-%m-%d %H:%M:%S"),
+        }
+
+    def build_receipt_detail(self, payment, user):
+        order = Order.objects.prefetch_related(
+            Prefetch("order_items", queryset=OrderItem.objects.order_by("id"))
+        ).get(id=payment.order_id)
+        order_items = list(order.order_items.all())
         billing_address = payment.billing_address
 
         receipt_data = {
             "receipt_number": f"REC-{payment.id}",
-            "issue_date": timezone.now().strftime("%Y-%m-%d %H:%M:%S"),
             "payment_info": {
                 "payment_id": payment.id,
                 "amount": payment.amount,
@@ -280,15 +329,16 @@ class ReceiptMixin(GetObjectMixin):
             "order_info": {
                 "order_id": order.id,
                 "order_status": order.order_status,
-                "total_items": order.get_total_items(),
-                "total_price": order.get_total_price(),
+                "total_items": sum(item.quantity for item in order_items),
+                "total_price": sum(item.get_price() for item in order_items),
                 "items": [
                     {
                         "name": item.get_item_name(),
                         "quantity": item.quantity,
+                        "unit_price": item.unit_price,
                         "price": item.get_price(),
                     }
-                    for item in order.order_items.all()
+                    for item in order_items
                 ],
             },
             "customer_info": {"email": user.email},
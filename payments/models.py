@@ -1,6 +1,5 @@
 from django.conf import settings
 from django.db import models
-from django.utils import timezone
 
 from courses.models import Course, Curriculum
 
@@ -151,24 +150,27 @@ class Order(models.Model):
 
     def get_total_price(self):
         return (
-            self.order_items.aggregate(
-                total_price=models.Sum(
-                    models.F("quantity")
-                    * models.Case(
-                        models.When(
-                            curriculum__isnull=False, then=models.F("curriculum__price")
-                        ),
-                        models.When(
-                            course__isnull=False, then=models.F("course__price")
-                        ),
-                        default=0,
-                        output_field=models.DecimalField(),
-                    )
-                )
-            )["total_price"]
+            self.order_items.aggregate(total_price=models.Sum("total_price"))[
+                "total_price"
+            ]
             or 0
         )
 
+    def get_item_summary(self):
+        """
+        결제에 기록할 대표 상품명과 총 상품 수량을 반환합니다.
+        예: "Django 입문 외 2건"
+        """
+        order_items = list(
+            self.order_items.order_by("id").values_list("item_name", "quantity")
+        )
+        if not order_items:
+            return "", 0
+        item_name = order_items[0][0]
+        if len(order_items) > 1:
+            item_name = f"{item_name} 외 {len(order_items) - 1}건"
+        return item_name, sum(quantity for _, quantity in order_items)
+
     class Meta:
         ordering = ["-created_at"]
         verbose_name = "주문"
@@ -201,25 +203,42 @@ class OrderItem(models.Model):
         verbose_name="코스",
     )
     quantity = models.PositiveIntegerField(default=1, verbose_name="수량")
+    item_name = models.CharField(
+        max_length=255, blank=True, default="", verbose_name="상품명"
+    )
+    unit_price = models.PositiveIntegerField(default=0, verbose_name="단가")
+    total_price = models.PositiveIntegerField(default=0, verbose_name="합계 금액")
+    category = models.CharField(
+        max_length=255, blank=True, default="", verbose_name="카테고리"
+    )
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일")
     expiry_date = models.DateTimeField(null=True, blank=True, verbose_name="만료일")
 
     def get_item_name(self):
-        if self.curriculum:
-            return self.curriculum.name
-        elif self.course:
-            return self.course.title
-        else:
-            return "알 수 없는 상품"
+        return self.item_name or "알 수 없는 상품"
 
     def get_price(self):
-        unit_price = 0
+        return self.total_price
+
+    def capture_price_snapshot(self):
+        """
+        주문 시점의 상품명, 가격, 카테고리를 주문 상품에 기록합니다.
+        이후 코스나 커리큘럼의 가격이나 카테고리가 변경되어도 주문 내역과 매출 집계는 변하지 않습니다.
+        """
         if self.curriculum:
-            unit_price = self.curriculum.price
+            self.item_name = self.curriculum.name
+            self.unit_price = self.curriculum.price
+            self.category = self.curriculum.category
         elif self.course:
-            unit_price = self.course.price
-        return unit_price * self.quantity
+            self.item_name = self.course.title
+            self.unit_price = self.course.price
+            self.category = self.course.category
+        else:
+            self.item_name = "알 수 없는 상품"
+            self.unit_price = 0
+            self.category = ""
+        self.total_price = self.unit_price * self.quantity
 
     def get_image_url(self):
         if self.curriculum and hasattr(self.curriculum, "image"):
@@ -228,14 +247,9 @@ class OrderItem(models.Model):
             return self.course.image.url
         return None
 
-    def set_expiry_date(self):
-        self.expiry_date = timezone.now() + timezone.timedelta(days=730)  # 2년
-
     def save(self, *args, **kwargs):
-        if self.order.order_status == "completed" and (
-            not self.expiry_date or self.expiry_date < timezone.now()
-        ):
-            self.set_expiry_date()
+        if self._state.adding and not self.item_name:
+            self.capture_price_snapshot()
         super().save(*args, **kwargs)
 
     class Meta:
@@ -246,12 +260,7 @@ class OrderItem(models.Model):
     def __str__(self):
         try:
             user_nickname = self.order.user.nickname
-            item_name = (
-                self.curriculum.name
-                if self.curriculum
-                else self.course.title if self.course else "알 수 없는 상품"
-            )
-            return f"{user_nickname}의 주문에 있는 {item_name}"
+            return f"{user_nickname}의 주문에 있는 {self.get_item_name()}"
         except Exception as e:
             return f"주문 상품 (ID: {self.id})"
 
@@ -319,6 +328,10 @@ class Payment(models.Model):
         verbose_name="결제 상태",
     )
     amount = models.PositiveIntegerField(verbose_name="결제 금액")
+    item_name = models.CharField(
+        max_length=255, blank=True, default="", verbose_name="상품명"
+    )
+    total_items = models.PositiveIntegerField(default=0, verbose_name="상품 수량")
     transaction_id = models.CharField(
         max_length=255, verbose_name="거래 ID", blank=True, null=True
     )
@@ -355,3 +368,104 @@ class Payment(models.Model):
                 user=self.user, is_default=True
             ).first()
         super().save(*args, **kwargs)
+
+
+class Entitlement(models.Model):
+    """
+    사용자의 코스 수강 권한 모델입니다.
+    - 완료된 주문의 주문 상품(코스, 커리큘럼의 코스)으로부터 구체화됩니다.
+    - 결제 완료, 환불, 커리큘럼 구성 변경 시 EntitlementService가 갱신합니다.
+    """
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="entitlements",
+        verbose_name="사용자",
+    )
+    course = models.ForeignKey(
+        Course,
+        on_delete=models.CASCADE,
+        related_name="entitlements",
+        verbose_name="코스",
+    )
+    expires_at = models.DateTimeField(verbose_name="만료일")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일")
+
+    class Meta:
+        ordering = ["-expires_at"]
+        verbose_name = "수강 권한"
+        verbose_name_plural = "수강 권한 목록"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "course"], name="unique_user_course_entitlement"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["user", "expires_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.user.nickname}의 {self.course.title} 수강 권한"
+
+
+class DailySalesRollup(models.Model):
+    """
+    일별 매출 집계 모델입니다.
+    - 코스, 커리큘럼, 카테고리 단위로 매출, 판매 수량, 환불 금액을 집계합니다.
+    - build_sales_rollups 명령이 변경된 결제가 속한 날짜만 다시 집계합니다.
+    """
+
+    class Dimension(models.TextChoices):
+        COURSE = "course", "코스"
+        CURRICULUM = "curriculum", "커리큘럼"
+        CATEGORY = "category", "카테고리"
+
+    date = models.DateField(verbose_name="집계일")
+    dimension = models.CharField(
+        max_length=20, choices=Dimension.choices, verbose_name="집계 단위"
+    )
+    dimension_key = models.CharField(max_length=255, verbose_name="집계 키")
+    dimension_label = models.CharField(
+        max_length=255, blank=True, default="", verbose_name="집계 대상 이름"
+    )
+    revenue = models.PositiveBigIntegerField(default=0, verbose_name="매출")
+    units = models.PositiveIntegerField(default=0, verbose_name="판매 수량")
+    refund_amount = models.PositiveBigIntegerField(default=0, verbose_name="환불 금액")
+    refund_units = models.PositiveIntegerField(default=0, verbose_name="환불 수량")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일")
+
+    class Meta:
+        ordering = ["-date", "dimension", "dimension_key"]
+        verbose_name = "일별 매출 집계"
+        verbose_name_plural = "일별 매출 집계 목록"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["date", "dimension", "dimension_key"],
+                name="unique_daily_sales_rollup",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["dimension", "date"]),
+        ]
+
+    def __str__(self):
+        return f"{self.date} {self.get_dimension_display()} {self.dimension_label}"
+
+
+class AnalyticsWatermark(models.Model):
+    """
+    집계 작업이 마지막으로 처리한 시점을 기록하는 모델입니다.
+    """
+
+    name = models.CharField(max_length=100, unique=True, verbose_name="작업 이름")
+    processed_until = models.DateTimeField(verbose_name="처리 완료 시점")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일")
+
+    class Meta:
+        verbose_name = "집계 워터마크"
+        verbose_name_plural = "집계 워터마크 목록"
+
+    def __str__(self):
+        return f"{self.name} ({self.processed_until})"
@@ -1,6 +1,18 @@
+from django.db.models import Prefetch, Sum
+from django.db.models.functions import Coalesce
 from rest_framework import serializers
 
-from .models import Cart, CartItem, Order, OrderItem, Payment, UserBillingAddress
+from weaverse.fieldsets import QueryPlan, SparseFieldsetSerializerMixin
+
+from .models import (
+    Cart,
+    CartItem,
+    DailySalesRollup,
+    Order,
+    OrderItem,
+    Payment,
+    UserBillingAddress,
+)
 
 
 class CartItemSerializer(serializers.ModelSerializer):
@@ -85,6 +97,9 @@ class OrderItemSerializer(serializers.ModelSerializer):
             "curriculum",
             "course",
             "quantity",
+            "item_name",
+            "unit_price",
+            "total_price",
             "created_at",
             "updated_at",
             "expiry_date",
@@ -96,6 +111,9 @@ class OrderItemSerializer(serializers.ModelSerializer):
         read_only_fields = [
             "id",
             "quantity",
+            "item_name",
+            "unit_price",
+            "total_price",
             "created_at",
             "updated_at",
             "thumbnail",
@@ -130,12 +148,15 @@ class OrderItemSerializer(serializers.ModelSerializer):
         return data
 
 
-class OrderSerializer(serializers.ModelSerializer):
+class OrderSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     """
     주문 모델의 시리얼라이저입니다. 총 상품 수량과 가격을 계산합니다.
+    - 조회 시 총 상품 수량과 가격은 쿼리셋에서 집계한 값을 사용합니다.
     """
 
     order_items = OrderItemSerializer(many=True, read_only=True)
+    get_total_items = serializers.SerializerMethodField()
+    get_total_price = serializers.SerializerMethodField()
 
     class Meta:
         model = Order
@@ -154,6 +175,34 @@ class OrderSerializer(serializers.ModelSerializer):
             "created_at",
             "updated_at",
         ]
+        field_query_plans = {
+            "order_items": QueryPlan(
+                prefetch_related=[
+                    Prefetch(
+                        "order_items",
+                        queryset=OrderItem.objects.select_related(
+                            "course__image", "curriculum"
+                        ),
+                    )
+                ]
+            ),
+            "get_total_items": QueryPlan(
+                annotate={"total_items": Coalesce(Sum("order_items__quantity"), 0)}
+            ),
+            "get_total_price": QueryPlan(
+                annotate={"total_price": Coalesce(Sum("order_items__total_price"), 0)}
+            ),
+        }
+
+    def get_get_total_items(self, obj):
+        if hasattr(obj, "total_items"):
+            return obj.total_items
+        return obj.get_total_items()
+
+    def get_get_total_price(self, obj):
+        if hasattr(obj, "total_price"):
+            return obj.total_price
+        return obj.get_total_price()
 
 
 class UserBillingAddressSerializer(serializers.ModelSerializer):
@@ -190,6 +239,8 @@ class PaymentSerializer(serializers.ModelSerializer):
             "order",
             "payment_status",
             "amount",
+            "item_name",
+            "total_items",
             "transaction_id",
             "created_at",
             "updated_at",
@@ -204,9 +255,32 @@ class PaymentSerializer(serializers.ModelSerializer):
             "payment_status",
             "payment_method",
             "amount",
+            "item_name",
+            "total_items",
             "transaction_id",
             "created_at",
             "updated_at",
             "paid_at",
             "cancelled_at",
         ]
+
+
+class DailySalesRollupSerializer(serializers.ModelSerializer):
+    """
+    일별 매출 집계 모델의 시리얼라이저입니다.
+    """
+
+    class Meta:
+        model = DailySalesRollup
+        fields = [
+            "date",
+            "dimension",
+            "dimension_key",
+            "dimension_label",
+            "revenue",
+            "units",
+            "refund_amount",
+            "refund_units",
+            "updated_at",
+        ]
+        read_only_fields = fields
@@ -1,5 +1,12 @@
 import requests
 from django.conf import settings
+from django.db import transaction
+from django.db.models import Max, Q
+from django.utils import timezone
+
+from courses.counters import CatalogCounter
+
+from .models import Entitlement, OrderItem
 
 
 class KakaoPayService:
@@ -80,3 +87,144 @@ class KakaoPayService:
             "Authorization": f"SECRET_KEY {settings.KAKAOPAY_SECRET_KEY}",
             "Content-Type": "application/json",
         }
+
+
+class OrderItemExpiryService:
+    """
+    주문 상품의 수강 만료일을 일괄 처리하는 클래스입니다.
+    - 주문 상품 수와 관계없이 UPDATE 쿼리 한 번으로 처리합니다.
+    """
+
+    expiry_period = timezone.timedelta(days=730)  # 2년
+
+    def activate(self, order):
+        """
+        완료된 주문의 주문 상품들에 만료일을 설정합니다.
+        만료일이 없거나 이미 만료된 주문 상품만 갱신합니다.
+        """
+        now = timezone.now()
+        return (
+            OrderItem.objects.filter(order=order)
+            .filter(Q(expiry_date__isnull=True) | Q(expiry_date__lt=now))
+            .update(expiry_date=now + self.expiry_period, updated_at=now)
+        )
+
+    def deactivate(self, order):
+        """
+        환불된 주문의 주문 상품들의 만료일을 해제합니다.
+        """
+        return OrderItem.objects.filter(order=order).update(
+            expiry_date=None, updated_at=timezone.now()
+        )
+
+
+class EntitlementService:
+    """
+    사용자의 코스 수강 권한(Entitlement)을 관리하는 클래스입니다.
+    - 완료된 주문의 유효한 주문 상품으로부터 수강 권한 테이블을 다시 구성합니다.
+    - 요청 단위로 수강 권한을 캐시하여 O(1)로 조회할 수 있도록 합니다.
+    - 수강 권한이 바뀐 코스의 수강생 수 카운터(enrollments_count)를 함께 갱신합니다.
+    """
+
+    request_cache_attr = "_entitled_course_ids"
+    catalog_counter = CatalogCounter()
+
+    @transaction.atomic
+    def refresh_for_users(self, user_ids):
+        """
+        주어진 사용자들의 수강 권한을 주문 상품 기준으로 다시 구성합니다.
+        """
+        user_ids = set(user_ids)
+        if not user_ids:
+            return 0
+
+        order_items = OrderItem.objects.filter(
+            order__user_id__in=user_ids,
+            order__order_status="completed",
+            expiry_date__gt=timezone.now(),
+        )
+        course_rows = (
+            order_items.filter(course__isnull=False)
+            .values_list("order__user_id", "course_id")
+            .annotate(expires_at=Max("expiry_date"))
+            .order_by()
+        )
+        curriculum_rows = (
+            order_items.filter(curriculum__courses__isnull=False)
+            .values_list("order__user_id", "curriculum__courses")
+            .annotate(expires_at=Max("expiry_date"))
+            .order_by()
+        )
+
+        expires_at_by_key = {}
+        for user_id, course_id, expires_at in [*course_rows, *curriculum_rows]:
+            key = (user_id, course_id)
+            if key not in expires_at_by_key or expires_at_by_key[key] < expires_at:
+                expires_at_by_key[key] = expires_at
+
+        entitlements = Entitlement.objects.filter(user_id__in=user_ids)
+        course_ids = set(entitlements.values_list("course_id", flat=True))
+        entitlements.delete()
+        Entitlement.objects.bulk_create(
+            Entitlement(user_id=user_id, course_id=course_id, expires_at=expires_at)
+            for (user_id, course_id), expires_at in expires_at_by_key.items()
+        )
+        course_ids.update(course_id for _, course_id in expires_at_by_key)
+        self.catalog_counter.refresh_enrollments(course_ids)
+        return len(expires_at_by_key)
+
+    def refresh_for_order(self, order):
+        """
+        주문한 사용자의 수강 권한을 다시 구성합니다.
+        """
+        return self.refresh_for_users([order.user_id])
+
+    def get_curriculum_user_ids(self, curriculum_ids):
+        """
+        주어진 커리큘럼들을 구매한 사용자 ID 집합을 반환합니다.
+        커리큘럼의 코스 구성이 변경되기 전에 호출해야 합니다.
+        """
+        return set(
+            OrderItem.objects.filter(
+                curriculum_id__in=curriculum_ids, order__order_status="completed"
+            ).values_list("order__user_id", flat=True)
+        )
+
+    def get_entitled_course_ids(self, request):
+        """
+        요청한 사용자가 수강할 수 있는 코스 ID 집합을 반환합니다.
+        한 요청 안에서는 처음 한 번만 조회합니다.
+        """
+        request = getattr(request, "_request", request)
+        course_ids = getattr(request, self.request_cache_attr, None)
+        if course_ids is None:
+            user = getattr(request, "user", None)
+            if user is None or not user.is_authenticated:
+                course_ids = frozenset()
+            else:
+                course_ids = frozenset(
+                    Entitlement.objects.filter(
+                        user_id=user.id, expires_at__gt=timezone.now()
+                    ).values_list("course_id", flat=True)
+                )
+            setattr(request, self.request_cache_attr, course_ids)
+        return course_ids
+
+    def has_course_access(self, request, course_id):
+        """
+        요청한 사용자가 코스를 수강할 수 있는지 여부를 반환합니다.
+        - 강사(staff)는 모든 코스에 접근할 수 있습니다.
+        """
+        user = getattr(request, "user", None)
+        if user is not None and user.is_authenticated and user.is_staff:
+            return True
+        return course_id in self.get_entitled_course_ids(request)
+
+    def has_topic_access(self, request, topic):
+        """
+        요청한 사용자가 주제를 수강할 수 있는지 여부를 반환합니다.
+        - 프리미엄이 아닌 주제는 누구나 수강할 수 있습니다.
+        """
+        if not topic.is_premium:
+            return True
+        return self.has_course_access(request, topic.lecture.course_id)
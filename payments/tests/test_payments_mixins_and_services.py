@@ -10,9 +10,21 @@ from payments.mixins import (
     UserBillingAddressMixin,
     PaymentMixin,
 )
-from payments.services import KakaoPayService
+from payments.services import (
+    EntitlementService,
+    KakaoPayService,
+    OrderItemExpiryService,
+)
 from courses.models import Course
-from payments.models import Order, UserBillingAddress
+from payments.analytics import SalesRollupService
+from payments.models import (
+    DailySalesRollup,
+    Entitlement,
+    Order,
+    OrderItem,
+    Payment,
+    UserBillingAddress,
+)
 
 
 class TestGetObjectMixin:
@@ -155,6 +167,16 @@ class TestPaymentMixin:
         assert payment.payment_status == "completed"
         assert order.order_status == "completed"
 
+    @pytest.mark.django_db
+    def test_process_payment_주문상품_만료일_일괄설정(
+        self, mixin, order, payment, course, curriculum, mock_kakao_pay_service
+    ):
+        mixin.kakao_pay_service = mock_kakao_pay_service
+        OrderItem.objects.create(order=order, course=course)
+        OrderItem.objects.create(order=order, curriculum=curriculum)
+        mixin.process_payment(order, payment, "test_pg_token")
+        assert not order.order_items.filter(expiry_date__isnull=True).exists()
+
     @pytest.mark.django_db
     def test_cancel_payment_성공(self, mixin, order, payment):
         mixin.cancel_payment(order, payment)
@@ -171,6 +193,22 @@ class TestPaymentMixin:
         assert completed_payment.payment_status == "refunded"
         assert completed_order.order_status == "refunded"
 
+    @pytest.mark.django_db
+    def test_refund_payment_주문상품_만료일_해제(
+        self, mixin, completed_order, completed_payment, course, mock_kakao_pay_service
+    ):
+        mixin.kakao_pay_service = mock_kakao_pay_service
+        completed_payment.paid_at = timezone.now()
+        OrderItem.objects.create(
+            order=completed_order,
+            course=course,
+            expiry_date=timezone.now() + timezone.timedelta(days=730),
+        )
+        mixin.refund_payment(completed_order, completed_payment)
+        assert not completed_order.order_items.filter(
+            expiry_date__isnull=False
+        ).exists()
+
 
 class TestKakaoPayService:
     @pytest.fixture
@@ -200,3 +238,190 @@ class TestKakaoPayService:
             mock_post.return_value.json.return_value = {"amount": {"total": 10000}}
             response = service.refund_payment(payment)
         assert response["amount"]["total"] == 10000
+
+
+class TestOrderItemExpiryService:
+    @pytest.fixture
+    def service(self):
+        return OrderItemExpiryService()
+
+    @pytest.mark.django_db
+    def test_activate_쿼리_한번(
+        self, service, completed_order, course, curriculum, django_assert_num_queries
+    ):
+        for _ in range(5):
+            OrderItem.objects.create(order=completed_order, course=course)
+        OrderItem.objects.create(order=completed_order, curriculum=curriculum)
+        with django_assert_num_queries(1):
+            updated = service.activate(completed_order)
+        assert updated == 6
+
+    @pytest.mark.django_db
+    def test_activate_유효한_만료일_유지(self, service, completed_order, course):
+        expiry_date = timezone.now() + timezone.timedelta(days=10)
+        order_item = OrderItem.objects.create(
+            order=completed_order, course=course, expiry_date=expiry_date
+        )
+        assert service.activate(completed_order) == 0
+        order_item.refresh_from_db()
+        assert order_item.expiry_date == expiry_date
+
+    @pytest.mark.django_db
+    def test_deactivate_쿼리_한번(
+        self, service, completed_order, course, django_assert_num_queries
+    ):
+        for _ in range(3):
+            OrderItem.objects.create(
+                order=completed_order, course=course, expiry_date=timezone.now()
+            )
+        with django_assert_num_queries(1):
+            updated = service.deactivate(completed_order)
+        assert updated == 3
+        assert not completed_order.order_items.filter(
+            expiry_date__isnull=False
+        ).exists()
+
+
+class TestEntitlementService:
+    @pytest.fixture
+    def service(self):
+        return EntitlementService()
+
+    @pytest.fixture
+    def expiry_date(self):
+        return timezone.now() + timezone.timedelta(days=730)
+
+    @pytest.mark.django_db
+    def test_refresh_for_users_코스_구매(
+        self, service, user, completed_order, course, expiry_date
+    ):
+        OrderItem.objects.create(
+            order=completed_order, course=course, expiry_date=expiry_date
+        )
+        assert service.refresh_for_users([user.id]) == 1
+        entitlement = Entitlement.objects.get(user=user)
+        assert entitlement.course == course
+        assert entitlement.expires_at == expiry_date
+
+    @pytest.mark.django_db
+    def test_refresh_for_users_커리큘럼_구매(
+        self, service, user, completed_order, course, curriculum, expiry_date
+    ):
+        course.curriculum = curriculum
+        course.save()
+        OrderItem.objects.create(
+            order=completed_order, curriculum=curriculum, expiry_date=expiry_date
+        )
+        service.refresh_for_users([user.id])
+        assert list(
+            Entitlement.objects.filter(user=user).values_list("course_id", flat=True)
+        ) == [course.id]
+
+    @pytest.mark.django_db
+    def test_refresh_for_users_환불_주문_제외(
+        self, service, user, completed_order, course, expiry_date
+    ):
+        OrderItem.objects.create(
+            order=completed_order, course=course, expiry_date=expiry_date
+        )
+        service.refresh_for_users([user.id])
+        completed_order.order_status = "refunded"
+        completed_order.save()
+        service.refresh_for_users([user.id])
+        assert not Entitlement.objects.filter(user=user).exists()
+
+    @pytest.mark.django_db
+    def test_has_course_access_요청단위_캐시(
+        self,
+        service,
+        user,
+        completed_order,
+        course,
+        expiry_date,
+        django_assert_num_queries,
+    ):
+        OrderItem.objects.create(
+            order=completed_order, course=course, expiry_date=expiry_date
+        )
+        service.refresh_for_users([user.id])
+        request = MagicMock(spec=["user"], user=user)
+        with django_assert_num_queries(1):
+            assert service.has_course_access(request, course.id)
+            assert service.has_course_access(request, course.id)
+            assert not service.has_course_access(request, course.id + 1)
+
+    @pytest.mark.django_db
+    def test_process_payment_수강권한_생성(
+        self, user, order, payment, course, mock_kakao_pay_service
+    ):
+        mixin = PaymentMixin()
+        mixin.kakao_pay_service = mock_kakao_pay_service
+        OrderItem.objects.create(order=order, course=course)
+        mixin.process_payment(order, payment, "test_pg_token")
+        assert Entitlement.objects.filter(user=user, course=course).exists()
+
+
+class TestSalesRollupService:
+    @pytest.fixture
+    def service(self):
+        return SalesRollupService()
+
+    @pytest.fixture
+    def paid_order_item(self, completed_order, completed_payment_with_time, course):
+        course.category = "Python"
+        course.save()
+        return OrderItem.objects.create(
+            order=completed_order, course=course, quantity=2
+        )
+
+    @pytest.mark.django_db
+    def test_build_코스_카테고리_집계(self, service, paid_order_item, course):
+        dates = service.build()
+        assert dates == {timezone.localdate()}
+        course_rollup = DailySalesRollup.objects.get(
+            dimension=DailySalesRollup.Dimension.COURSE
+        )
+        assert course_rollup.dimension_key == str(course.id)
+        assert course_rollup.revenue == course.price * 2
+        assert course_rollup.units == 2
+        assert (
+            DailySalesRollup.objects.get(
+                dimension=DailySalesRollup.Dimension.CATEGORY
+            ).dimension_key
+            == "Python"
+        )
+
+    @pytest.mark.django_db
+    def test_build_주문_시점_카테고리로_집계(self, service, paid_order_item, course):
+        course.category = "Java"
+        course.save()
+        service.build()
+        assert (
+            DailySalesRollup.objects.get(
+                dimension=DailySalesRollup.Dimension.CATEGORY
+            ).dimension_key
+            == "Python"
+        )
+
+    @pytest.mark.django_db
+    def test_build_환불_집계(
+        self, service, paid_order_item, completed_payment_with_time, course
+    ):
+        completed_payment_with_time.payment_status = "refunded"
+        completed_payment_with_time.cancelled_at = timezone.now()
+        completed_payment_with_time.save()
+        service.build()
+        course_rollup = DailySalesRollup.objects.get(
+            dimension=DailySalesRollup.Dimension.COURSE
+        )
+        assert course_rollup.revenue == course.price * 2
+        assert course_rollup.refund_amount == course.price * 2
+        assert course_rollup.refund_units == 2
+
+    @pytest.mark.django_db
+    def test_build_워터마크_이후_변경분만_집계(self, service, paid_order_item):
+        service.build()
+        assert service.get_watermark() is not None
+        Payment.objects.update(updated_at=timezone.now() - timezone.timedelta(days=1))
+        assert service.build() == set()
+        assert service.build(full=True) == {timezone.localdate()}
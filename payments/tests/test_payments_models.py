@@ -39,6 +39,26 @@ class TestOrder:
         assert order.get_total_items() == 2
         assert order.get_total_price() == course.price + curriculum.price
 
+    def test_order_가격_스냅샷(self, order, course):
+        order_item = OrderItem.objects.create(order=order, course=course, quantity=2)
+        original_price = course.price
+        course.price = original_price + 5000
+        original_category = course.category
+        course.title = "Renamed Course"
+        course.category = "Java" if original_category != "Java" else "Python"
+        course.save()
+        order_item.refresh_from_db()
+        assert order_item.item_name == "Test Course"
+        assert order_item.unit_price == original_price
+        assert order_item.category == original_category
+        assert order_item.get_price() == original_price * 2
+        assert order.get_total_price() == original_price * 2
+
+    def test_order_item_summary(self, order, course, curriculum):
+        OrderItem.objects.create(order=order, course=course, quantity=1)
+        OrderItem.objects.create(order=order, curriculum=curriculum, quantity=1)
+        assert order.get_item_summary() == ("Test Course 외 1건", 2)
+
 
 @pytest.mark.django_db
 class TestUserBillingAddress:
@@ -4,6 +4,9 @@ from django.urls import reverse
 from rest_framework import status
 from unittest.mock import patch
 
+from payments.analytics import SalesRollupService
+from payments.models import Order, OrderItem, Payment
+
 
 @pytest.mark.django_db
 class Test장바구니뷰:
@@ -107,7 +110,24 @@ class Test영수증뷰:
         url = reverse("payments:receipt-list")
         response = api_client.get(url)
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 1
+        assert response.data["count"] == 1
+        assert len(response.data["results"]) == 1
+
+    def test_영수증_목록_쿼리수_고정(
+        self, api_client, user, completed_payment, django_assert_max_num_queries
+    ):
+        for _ in range(5):
+            Payment.objects.create(
+                user=user,
+                order=Order.objects.create(user=user, order_status="completed"),
+                payment_status="completed",
+                amount=10000,
+            )
+        api_client.force_authenticate(user=user)
+        url = reverse("payments:receipt-list")
+        with django_assert_max_num_queries(2):
+            response = api_client.get(url)
+        assert response.data["count"] == 6
 
     def test_영수증_상세_조회_성공(self, api_client, user, completed_payment):
         api_client.force_authenticate(user=user)
@@ -115,3 +135,60 @@ class Test영수증뷰:
         response = api_client.get(url)
         assert response.status_code == status.HTTP_200_OK
         assert response.data["id"] == completed_payment.id
+
+    def test_영수증_상세_조회_캐시(
+        self,
+        api_client,
+        user,
+        completed_payment,
+        course,
+        curriculum,
+        django_assert_num_queries,
+    ):
+        OrderItem.objects.create(order=completed_payment.order, course=course)
+        OrderItem.objects.create(order=completed_payment.order, curriculum=curriculum)
+        api_client.force_authenticate(user=user)
+        url = reverse("payments:receipt-detail", args=[completed_payment.id])
+        first_response = api_client.get(url)
+        with django_assert_num_queries(1):
+            second_response = api_client.get(url)
+        assert first_response.data["order_info"] == second_response.data["order_info"]
+        assert second_response.data["order_info"]["total_items"] == 2
+        assert (
+            second_response.data["order_info"]["total_price"]
+            == course.price + curriculum.price
+        )
+
+
+@pytest.mark.django_db
+class Test매출집계뷰:
+    def test_매출집계_조회_성공(
+        self,
+        api_client,
+        staff_user,
+        completed_order,
+        completed_payment_with_time,
+        course,
+    ):
+        OrderItem.objects.create(order=completed_order, course=course)
+        SalesRollupService().build()
+        api_client.force_authenticate(user=staff_user)
+        url = reverse("payments:sales-analytics")
+        response = api_client.get(url, {"dimension": "course"})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["count"] == 1
+        assert response.data["results"][0]["revenue"] == course.price
+
+    @pytest.mark.parametrize("start_date", ["2024-13-45", "2024/01/01"])
+    def test_매출집계_조회_실패_잘못된_날짜(self, api_client, staff_user, start_date):
+        api_client.force_authenticate(user=staff_user)
+        url = reverse("payments:sales-analytics")
+        response = api_client.get(url, {"start_date": start_date})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "start_date" in response.data
+
+    def test_매출집계_조회_실패_일반사용자(self, api_client, user):
+        api_client.force_authenticate(user=user)
+        url = reverse("payments:sales-analytics")
+        response = api_client.get(url)
+        assert response.status_code == status.HTTP_403_FORBIDDEN
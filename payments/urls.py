@@ -5,6 +5,7 @@ from .views import (
     UserBillingAddressView,
     PaymentView,
     ReceiptView,
+    SalesAnalyticsView,
 )
 
 app_name = "payments"
@@ -44,4 +45,6 @@ urlpatterns = [
         ReceiptView.as_view(),
         name="receipt-detail",
     ),
+    # 매출 집계 관련 URLs
+    path("analytics/sales/", SalesAnalyticsView.as_view(), name="sales-analytics"),
 ]
@@ -1,10 +1,13 @@
 from django.core.exceptions import ValidationError
 from django.db import transaction
-from drf_spectacular.utils import extend_schema, extend_schema_view
-from rest_framework import generics, status
-from rest_framework.permissions import IsAuthenticated
+from django.utils.dateparse import parse_date
+from drf_spectacular.utils import OpenApiParameter, extend_schema, extend_schema_view
+from rest_framework import exceptions, generics, status
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 
+from weaverse.fieldsets import SparseFieldsetViewMixin
+
 from .mixins import (
     CartMixin,
     OrderMixin,
@@ -12,11 +15,12 @@ from .mixins import (
     ReceiptMixin,
     UserBillingAddressMixin,
 )
-from .models import CartItem, Order, Payment, UserBillingAddress
+from .models import CartItem, DailySalesRollup, Order, Payment, UserBillingAddress
 from .permissions import IsOwnerPermission
 from .serializers import (
     CartItemSerializer,
     CartSerializer,
+    DailySalesRollupSerializer,
     OrderItemSerializer,
     OrderSerializer,
     PaymentSerializer,
@@ -65,7 +69,7 @@ class CartView(CartMixin, generics.GenericAPIView):
             serializer = self.get_serializer(cart_item)
             return Response(serializer.data)
         else:
-            cart = self.get_cart(request.user)
+            cart = self.get_cart_with_items(request.user)
             serializer = CartSerializer(cart)
             return Response(serializer.data)
 
@@ -92,22 +96,30 @@ class CartView(CartMixin, generics.GenericAPIView):
         responses={201: OrderSerializer},
     ),
 )
-class OrderView(OrderMixin, CartMixin, generics.GenericAPIView):
+class OrderView(
+    SparseFieldsetViewMixin, OrderMixin, CartMixin, generics.GenericAPIView
+):
     """
     주문 관련 기능을 처리합니다.
 
     [GET /orders/]: 사용자의 현재 진행 중인 (pending 상태의) 주문을 조회합니다.
+        - ?fields=, ?exclude=로 응답 필드를 선택할 수 있습니다.
     [POST /orders/]: 새로운 주문을 생성합니다.
         - from_cart=False: 직접 주문을 생성합니다.
         - from_cart=True: 장바구니를 통해 주문을 생성합니다.
         주의: 새 주문 생성 시 기존의 진행 중인 주문은 자동으로 취소됩니다.
     """
 
+    queryset = Order.objects.all()
     serializer_class = OrderSerializer
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
-        return Order.objects.filter(user=self.request.user, order_status="pending")
+        return (
+            super()
+            .get_queryset()
+            .filter(user=self.request.user, order_status="pending")
+        )
 
     def get(self, request):
         pending_order = self.get_queryset().first()
@@ -393,7 +405,7 @@ class ReceiptView(ReceiptMixin, PaymentMixin, generics.GenericAPIView):
     """
     영수증 관련 기능을 처리합니다.
 
-    [GET /receipts/]: 사용자의 모든 영수증 목록을 조회합니다.
+    [GET /receipts/]: 사용자의 모든 영수증 목록을 페이지 단위로 조회합니다.
     [GET /receipts/{payment_id}/]: 특정 결제에 대한 상세 영수증 정보를 조회합니다.
     """
 
@@ -405,10 +417,65 @@ class ReceiptView(ReceiptMixin, PaymentMixin, generics.GenericAPIView):
 
     def get(self, request, payment_id=None):
         if payment_id is None:
-            receipt_list = self.get_receipt_list(request.user)
-            return Response(receipt_list)
+            page = self.paginate_queryset(self.get_receipt_queryset(request.user))
+            receipt_list = self.get_receipt_list(page)
+            return self.get_paginated_response(receipt_list)
         else:
             payment = self.get_payment(request.user, id=payment_id)
             receipt_detail = self.get_receipt_detail(payment, request.user)
             receipt_detail["id"] = payment.id
             return Response(receipt_detail)
+
+
+@extend_schema_view(
+    get=extend_schema(
+        summary="일별 매출 집계 조회 API",
+        description="코스, 커리큘럼, 카테고리별 일별 매출 집계를 조회합니다. staff만 조회할 수 있습니다.",
+        parameters=[
+            OpenApiParameter("start_date", str, description="조회 시작일 (YYYY-MM-DD)"),
+            OpenApiParameter("end_date", str, description="조회 종료일 (YYYY-MM-DD)"),
+        ],
+        responses={200: DailySalesRollupSerializer(many=True)},
+    ),
+)
+class SalesAnalyticsView(generics.ListAPIView):
+    """
+    일별 매출 집계를 조회합니다.
+    원본 결제 테이블 대신 build_sales_rollups 명령이 구성한 집계 테이블을 읽습니다.
+
+    [GET /analytics/sales/]: 일별 매출 집계 목록을 조회합니다.
+        - dimension: course, curriculum, category 중 하나로 필터링합니다.
+        - dimension_key: 코스 ID, 커리큘럼 ID 또는 카테고리 이름으로 필터링합니다.
+        - start_date, end_date: 집계일 범위로 필터링합니다.
+    """
+
+    serializer_class = DailySalesRollupSerializer
+    permission_classes = [IsAdminUser]
+    filterset_fields = ["dimension", "dimension_key"]
+
+    def get_queryset(self):
+        queryset = DailySalesRollup.objects.all()
+        start_date = self.get_date_param("start_date")
+        end_date = self.get_date_param("end_date")
+        if start_date:
+            queryset = queryset.filter(date__gte=start_date)
+        if end_date:
+            queryset = queryset.filter(date__lte=end_date)
+        return queryset
+
+    def get_date_param(self, name):
+        """
+        쿼리 파라미터의 날짜를 반환합니다. 형식이 틀리거나 존재하지 않는 날짜면 400 응답을 반환합니다.
+        """
+        value = self.request.query_params.get(name)
+        if not value:
+            return None
+        try:
+            date = parse_date(value)
+        except ValueError:
+            date = None
+        if date is None:
+            raise exceptions.ValidationError(
+                {name: "날짜는 YYYY-MM-DD 형식의 올바른 날짜여야 합니다."}
+            )
+        return date
@@ -0,0 +1,121 @@
+import hashlib
+
+from django.conf import settings
+from django.db.models import Count, Max
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    patch_vary_headers,
+)
+from django.utils.http import http_date
+
+
+class CatalogCachePolicyViewMixin:
+    """
+    공개 카탈로그 조회(GET) 응답에 HTTP 캐시 정책을 적용하는 뷰 Mixin입니다.
+    - 조회 대상 행의 max(updated_at)과 행 개수를 집계 쿼리 한 번으로 구해
+      ETag, Last-Modified를 만듭니다.
+    - If-None-Match, If-Modified-Since가 일치하면 직렬화 전에 304를 반환합니다.
+    - 익명 요청은 Cache-Control: public, s-maxage로 CDN 등 공유 캐시가 응답을 저장할 수 있게 하고,
+      Vary: Authorization으로 로그인한 사용자의 응답과 구분합니다.
+    - cache_varies_on_user가 True인 뷰(예: 수강 권한이 포함된 응답)는 로그인한 사용자에게
+      검증자 없이 private, no-cache로 응답합니다.
+
+        cache_validator_fields = ("updated_at", "lectures__updated_at")
+        cache_count_fields = ("pk", "lectures")
+
+    목록 뷰는 filter_queryset을 적용한 전체 행(페이지와 무관), 상세 뷰는 lookup 대상 행을
+    기준으로 검증자를 계산합니다. 관계 필드의 개수는 삭제된 하위 행을 반영하기 위해 사용합니다.
+    """
+
+    cache_validator_fields = ("updated_at",)
+    cache_count_fields = ("pk",)
+    cache_varies_on_user = False
+
+    def get(self, request, *args, **kwargs):
+        if self.cache_varies_on_user and request.user.is_authenticated:
+            response = super().get(request, *args, **kwargs)
+            patch_cache_control(response, private=True, no_cache=True)
+            patch_vary_headers(response, ("Authorization",))
+            return response
+
+        etag, last_modified = self.get_cache_validators()
+        response = None
+        if etag is not None:
+            response = get_conditional_response(
+                request, etag=etag, last_modified=last_modified
+            )
+        if response is None:
+            response = super().get(request, *args, **kwargs)
+        if etag is not None and response.status_code in (200, 304):
+            response["ETag"] = etag
+            if last_modified is not None:
+                response["Last-Modified"] = http_date(last_modified)
+        self.patch_cache_headers(request, response)
+        return response
+
+    def is_detail_request(self):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        return lookup_url_kwarg in self.kwargs
+
+    def get_validator_queryset(self):
+        """
+        검증자를 계산할 쿼리셋을 반환합니다.
+        직렬화용 select_related, 집계(annotate)가 붙지 않도록 self.queryset을 기준으로 합니다.
+        """
+        queryset = self.queryset.all()
+        if self.is_detail_request():
+            lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+            return queryset.filter(**{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+        return self.filter_queryset(queryset)
+
+    def get_cache_validators(self):
+        """
+        (ETag, Last-Modified 타임스탬프)를 반환합니다.
+        빈 목록은 Last-Modified 없이 ETag만 반환합니다.
+        상세 조회 대상이 없으면 (None, None)을 반환하여 404 응답이 그대로 처리되도록 합니다.
+        """
+        aggregates = {
+            f"max_{index}": Max(field)
+            for index, field in enumerate(self.cache_validator_fields)
+        }
+        aggregates.update(
+            {
+                f"count_{index}": Count(field, distinct=True)
+                for index, field in enumerate(self.cache_count_fields)
+            }
+        )
+        values = self.get_validator_queryset().aggregate(**aggregates)
+        timestamps = [
+            values[f"max_{index}"]
+            for index in range(len(self.cache_validator_fields))
+            if values[f"max_{index}"] is not None
+        ]
+        if not timestamps and self.is_detail_request():
+            return None, None
+
+        version = getattr(settings, "CATALOG_CACHE_VERSION", "1")
+        source = "|".join(
+            [version, *(str(values[key]) for key in sorted(values))]
+        ).encode()
+        etag = 'W/"%s"' % hashlib.blake2b(source, digest_size=16).hexdigest()
+        last_modified = int(max(timestamps).timestamp()) if timestamps else None
+        return etag, last_modified
+
+    def patch_cache_headers(self, request, response):
+        patch_vary_headers(response, ("Authorization",))
+        if response.status_code not in (200, 304):
+            return
+        if request.user.is_authenticated:
+            # 로그인한 사용자의 요청은 공유 캐시에 저장하지 않고, 브라우저는 검증 후 재사용합니다.
+            patch_cache_control(response, private=True, no_cache=True)
+            return
+        patch_cache_control(
+            response,
+            public=True,
+            max_age=getattr(settings, "CATALOG_CACHE_MAX_AGE", 60),
+            s_maxage=getattr(settings, "CATALOG_CACHE_S_MAXAGE", 300),
+            stale_while_revalidate=getattr(
+                settings, "CATALOG_CACHE_STALE_WHILE_REVALIDATE", 30
+            ),
+        )
@@ -0,0 +1,244 @@
+import hashlib
+import re
+import zlib
+
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from django.utils.cache import patch_vary_headers
+
+try:
+    import brotli
+except ImportError:  # brotli가 없는 환경에서는 gzip만 사용합니다.
+    brotli = None
+
+COMPRESSIBLE_CONTENT_TYPES = (
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "application/vnd.oai.openapi",
+    "image/svg+xml",
+    "text/",
+)
+
+# HTML 응답에는 CSRF 토큰 등 비밀 값과 요청에서 온 값이 함께 담길 수 있어,
+# 압축된 길이로 비밀 값을 추측하는 BREACH 공격을 막기 위해 압축하지 않습니다.
+EXCLUDED_CONTENT_TYPES = ("text/html",)
+
+strong_etag_re = re.compile(r'^(?!W/)"')
+
+
+class GzipEncoder:
+    """
+    gzip 인코더입니다. 같은 입력에 항상 같은 출력을 만들도록 mtime을 기록하지 않습니다.
+    """
+
+    name = "gzip"
+
+    def __init__(self, level=6):
+        self.level = level
+
+    def compressobj(self):
+        # wbits=31: gzip 헤더와 체크섬을 포함합니다.
+        return zlib.compressobj(self.level, zlib.DEFLATED, 31)
+
+    def compress(self, content):
+        compressor = self.compressobj()
+        return compressor.compress(content) + compressor.flush()
+
+    def compress_stream(self, chunks):
+        compressor = self.compressobj()
+        for chunk in chunks:
+            # 청크마다 flush하여 스트리밍 응답이 지연 없이 클라이언트에 전달되도록 합니다.
+            yield compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        yield compressor.flush()
+
+    async def acompress_stream(self, chunks):
+        compressor = self.compressobj()
+        async for chunk in chunks:
+            yield compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        yield compressor.flush()
+
+
+class BrotliEncoder:
+    """
+    brotli 인코더입니다. brotli 패키지가 설치된 경우에만 사용합니다.
+    """
+
+    name = "br"
+
+    def __init__(self, quality=5):
+        self.quality = quality
+
+    def compress(self, content):
+        return brotli.compress(content, quality=self.quality)
+
+    def compress_stream(self, chunks):
+        compressor = brotli.Compressor(quality=self.quality)
+        for chunk in chunks:
+            yield compressor.process(chunk) + compressor.flush()
+        yield compressor.finish()
+
+    async def acompress_stream(self, chunks):
+        compressor = brotli.Compressor(quality=self.quality)
+        async for chunk in chunks:
+            yield compressor.process(chunk) + compressor.flush()
+        yield compressor.finish()
+
+
+def parse_accept_encoding(header):
+    """
+    Accept-Encoding 헤더를 {인코딩: q 값} dict로 변환합니다.
+    """
+    encodings = {}
+    for item in header.split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        encodings[name] = quality
+    return encodings
+
+
+class CompressedPayloadCache:
+    """
+    응답 본문의 해시를 키로 압축된 결과를 캐시하는 클래스입니다.
+    - 같은 본문(예: 캐시된 렌더링 결과, 변경되지 않은 코스 상세)은 인코딩별로 한 번만 압축하고
+      이후 요청에서는 저장된 바이트를 그대로 반환합니다.
+    - 해시 계산은 압축보다 훨씬 빠르므로 큰 본문에만 적용합니다.
+    - 다른 캐시 항목을 밀어내지 않도록 COMPRESSION_CACHE_ALIAS 캐시를 사용합니다.
+    """
+
+    key_prefix = "compressed"
+
+    def __init__(self, alias=None):
+        self.alias = alias
+
+    @property
+    def backend(self):
+        alias = self.alias or getattr(
+            settings, "COMPRESSION_CACHE_ALIAS", DEFAULT_CACHE_ALIAS
+        )
+        return caches[alias]
+
+    def get_key(self, encoder, content):
+        digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+        return f"{self.key_prefix}:{encoder.name}:{digest}"
+
+    def get_or_compress(self, encoder, content, timeout):
+        key = self.get_key(encoder, content)
+        compressed = self.backend.get(key)
+        if compressed is None:
+            compressed = encoder.compress(content)
+            self.backend.set(key, compressed, timeout=timeout)
+        return compressed
+
+
+compressed_payload_cache = CompressedPayloadCache()
+
+
+class CompressionMiddleware:
+    """
+    응답을 brotli(설치된 경우) 또는 gzip으로 압축합니다.
+    - COMPRESSION_MIN_SIZE보다 작은 응답, 압축 효과가 없는 콘텐츠 타입,
+      이미 인코딩된 응답, Cache-Control: no-transform 응답은 압축하지 않습니다.
+    - 스트리밍 응답은 청크 단위로 압축합니다.
+    - HTML 응답은 BREACH 공격을 막기 위해 압축하지 않습니다.
+    - COMPRESSION_CACHE_MIN_SIZE 이상의 공개 응답은 CompressedPayloadCache에 압축 결과를 저장합니다.
+      인증 요청, 쿠키를 설정하는 응답, Cache-Control: private/no-store 응답은 사용자마다 본문이
+      달라 재사용되지 않으므로 저장하지 않습니다.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.min_size = getattr(settings, "COMPRESSION_MIN_SIZE", 1024)
+        self.cache_min_size = getattr(settings, "COMPRESSION_CACHE_MIN_SIZE", 16384)
+        self.cache_timeout = getattr(settings, "COMPRESSION_CACHE_TIMEOUT", 600)
+        self.encoders = [GzipEncoder(getattr(settings, "COMPRESSION_GZIP_LEVEL", 6))]
+        if brotli is not None:
+            self.encoders.insert(
+                0, BrotliEncoder(getattr(settings, "COMPRESSION_BROTLI_QUALITY", 5))
+            )
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if not self.is_compressible(response):
+            return response
+
+        # 압축 여부와 관계없이 Accept-Encoding에 따라 응답이 달라짐을 캐시에 알립니다.
+        patch_vary_headers(response, ("Accept-Encoding",))
+        encoder = self.get_encoder(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+        if encoder is None:
+            return response
+
+        if response.streaming:
+            if response.is_async:
+                response.streaming_content = encoder.acompress_stream(
+                    response.streaming_content
+                )
+            else:
+                response.streaming_content = encoder.compress_stream(
+                    response.streaming_content
+                )
+            del response.headers["Content-Length"]
+        else:
+            compressed = self.compress(
+                encoder, response.content, self.is_shared(request, response)
+            )
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response.headers["Content-Length"] = str(len(compressed))
+
+        # 압축된 본문은 원본과 바이트가 다르므로 강한 ETag를 약한 ETag로 바꿉니다.
+        etag = response.get("ETag")
+        if etag and strong_etag_re.match(etag):
+            response.headers["ETag"] = "W/" + etag
+        response.headers["Content-Encoding"] = encoder.name
+        return response
+
+    def is_compressible(self, response):
+        if response.has_header("Content-Encoding"):
+            return False
+        if response.status_code in (204, 304):
+            return False
+        if not response.streaming and len(response.content) < self.min_size:
+            return False
+        if "no-transform" in response.get("Cache-Control", ""):
+            return False
+        content_type = response.get("Content-Type", "").split(";")[0].strip().lower()
+        if content_type.startswith(EXCLUDED_CONTENT_TYPES):
+            return False
+        return content_type.startswith(COMPRESSIBLE_CONTENT_TYPES) or (
+            content_type.endswith("+json")
+        )
+
+    def get_encoder(self, accept_encoding):
+        accepted = parse_accept_encoding(accept_encoding)
+        for encoder in self.encoders:
+            if accepted.get(encoder.name, accepted.get("*", 0)) > 0:
+                return encoder
+        return None
+
+    def is_shared(self, request, response):
+        """
+        여러 요청이 같은 본문을 받는 공개 응답인지 확인합니다.
+        """
+        if request.META.get("HTTP_AUTHORIZATION") or response.cookies:
+            return False
+        cache_control = response.get("Cache-Control", "")
+        return "private" not in cache_control and "no-store" not in cache_control
+
+    def compress(self, encoder, content, cacheable=True):
+        if cacheable and len(content) >= self.cache_min_size:
+            return compressed_payload_cache.get_or_compress(
+                encoder, content, self.cache_timeout
+            )
+        return encoder.compress(content)
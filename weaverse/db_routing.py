@@ -0,0 +1,157 @@
+import contextvars
+import hashlib
+import random
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from django.db import DEFAULT_DB_ALIAS, connections
+from rest_framework.permissions import SAFE_METHODS
+
+primary_pinned = contextvars.ContextVar("primary_pinned", default=False)
+
+
+def get_replica_aliases():
+    """
+    설정된 읽기 전용 복제본(replica) DB 별칭 목록을 반환합니다.
+    """
+    return [
+        alias
+        for alias in getattr(settings, "DATABASE_REPLICAS", [])
+        if alias != DEFAULT_DB_ALIAS
+    ]
+
+
+@contextmanager
+def use_primary():
+    """
+    블록 안의 모든 읽기 쿼리를 primary(default) DB로 보냅니다.
+
+        with use_primary():
+            order = Order.objects.get(pk=order_id)
+    """
+    token = primary_pinned.set(True)
+    try:
+        yield
+    finally:
+        primary_pinned.reset(token)
+
+
+class ReplicaRouter:
+    """
+    읽기 쿼리를 복제본으로, 쓰기 쿼리를 primary로 보내는 DB 라우터입니다.
+    - 다음 경우에는 읽기 쿼리도 primary로 보냅니다.
+      - use_primary() 블록 안이거나 ReplicaRoutingMiddleware가 요청을 primary에 고정한 경우
+      - primary에서 트랜잭션(transaction.atomic)이 진행 중인 경우(select_for_update 등)
+      - DATABASE_PRIMARY_APPS에 속한 앱(기본값: payments)의 모델인 경우
+    - 복제본은 primary를 그대로 복제하므로 마이그레이션은 primary에만 적용합니다.
+    """
+
+    def db_for_read(self, model, **hints):
+        replicas = get_replica_aliases()
+        if not replicas or self.requires_primary(model):
+            return DEFAULT_DB_ALIAS
+        return random.choice(replicas)
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        aliases = {DEFAULT_DB_ALIAS, *get_replica_aliases()}
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db in get_replica_aliases():
+            return False
+        return None
+
+    def requires_primary(self, model):
+        if primary_pinned.get():
+            return True
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return True
+        return model._meta.app_label in getattr(
+            settings, "DATABASE_PRIMARY_APPS", ["payments"]
+        )
+
+
+class ReplicaRoutingMiddleware:
+    """
+    요청 단위로 읽기 쿼리를 primary에 고정할지 결정하는 미들웨어입니다.
+    - 쓰기 요청(POST, PUT, PATCH, DELETE)은 요청 전체를 primary에서 처리합니다.
+    - 쓰기 요청이 성공하면 DATABASE_REPLICA_STICKY_SECONDS 동안 같은 클라이언트의 요청을
+      primary에 고정하여 복제 지연 중에도 자신이 쓴 데이터를 읽을 수 있게 합니다(read-your-writes).
+      브라우저는 쿠키로, 쿠키를 보내지 않는 API 클라이언트는 Authorization 헤더 해시를 키로
+      DATABASE_STICKY_CACHE_ALIAS 캐시에 저장한 표시로 판단합니다.
+      이 표시는 모든 worker가 볼 수 있어야 하므로 프로세스 간에 공유되는 캐시를 사용해야 합니다.
+    - DATABASE_PRIMARY_APPS에 속한 앱의 URL(예: 결제)은 항상 primary에서 처리합니다.
+    - 복제본이 설정되지 않은 경우 아무 동작도 하지 않습니다.
+    """
+
+    cache_key_prefix = "db:primary"
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.cookie_name = getattr(
+            settings, "DATABASE_STICKY_COOKIE_NAME", "db_primary"
+        )
+        self.sticky_seconds = getattr(settings, "DATABASE_REPLICA_STICKY_SECONDS", 5)
+        self.primary_apps = getattr(settings, "DATABASE_PRIMARY_APPS", ["payments"])
+        self.cache_alias = getattr(
+            settings, "DATABASE_STICKY_CACHE_ALIAS", DEFAULT_CACHE_ALIAS
+        )
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias]
+
+    def __call__(self, request):
+        if not get_replica_aliases():
+            return self.get_response(request)
+
+        token = primary_pinned.set(self.should_use_primary(request))
+        try:
+            response = self.get_response(request)
+        finally:
+            primary_pinned.reset(token)
+
+        if request.method not in SAFE_METHODS and response.status_code < 400:
+            self.mark_sticky(request, response)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        # __call__에서 요청이 끝날 때 복원하므로, 복제본이 있을 때만 값을 바꿉니다.
+        if not get_replica_aliases():
+            return
+        resolver_match = getattr(request, "resolver_match", None)
+        if resolver_match and resolver_match.app_name in self.primary_apps:
+            primary_pinned.set(True)
+
+    def should_use_primary(self, request):
+        if request.method not in SAFE_METHODS:
+            return True
+        if request.COOKIES.get(self.cookie_name):
+            return True
+        key = self.get_cache_key(request)
+        return key is not None and self.cache.get(key) is not None
+
+    def mark_sticky(self, request, response):
+        response.set_cookie(
+            self.cookie_name,
+            "1",
+            max_age=self.sticky_seconds,
+            httponly=True,
+            samesite="Lax",
+        )
+        key = self.get_cache_key(request)
+        if key is not None:
+            self.cache.set(key, True, timeout=self.sticky_seconds)
+
+    def get_cache_key(self, request):
+        authorization = request.META.get("HTTP_AUTHORIZATION")
+        if not authorization:
+            return None
+        digest = hashlib.blake2b(authorization.encode(), digest_size=16).hexdigest()
+        return f"{self.cache_key_prefix}:{digest}"
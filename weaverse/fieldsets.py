@@ -0,0 +1,117 @@
+from rest_framework.permissions import SAFE_METHODS
+
+
+class QueryPlan:
+    """
+    필드를 직렬화하는 데 필요한 select_related, prefetch_related, annotate 목록입니다.
+    - 여러 필드의 계획을 합쳐(merge) 쿼리셋 하나에 적용합니다.
+    """
+
+    def __init__(self, select_related=(), prefetch_related=(), annotate=None):
+        self.select_related = list(select_related)
+        self.prefetch_related = list(prefetch_related)
+        self.annotate = dict(annotate or {})
+
+    def merge(self, other):
+        return QueryPlan(
+            select_related=self.select_related
+            + [
+                name for name in other.select_related if name not in self.select_related
+            ],
+            prefetch_related=self.prefetch_related
+            + [
+                lookup
+                for lookup in other.prefetch_related
+                if lookup not in self.prefetch_related
+            ],
+            annotate={**self.annotate, **other.annotate},
+        )
+
+    def apply(self, queryset):
+        if self.select_related:
+            queryset = queryset.select_related(*self.select_related)
+        if self.prefetch_related:
+            queryset = queryset.prefetch_related(*self.prefetch_related)
+        if self.annotate:
+            # 집계(GROUP BY) 쿼리에는 Meta.ordering이 적용되지 않으므로 정렬을 명시합니다.
+            ordering = queryset.query.order_by or queryset.model._meta.ordering
+            queryset = queryset.annotate(**self.annotate).order_by(*ordering)
+        return queryset
+
+
+def parse_field_names(value):
+    """
+    "id,title, price" 형태의 쿼리 파라미터를 필드 이름 집합으로 변환합니다.
+    """
+    if not value:
+        return set()
+    return {name.strip() for name in value.split(",") if name.strip()}
+
+
+class SparseFieldsetSerializerMixin:
+    """
+    ?fields=, ?exclude= 쿼리 파라미터로 응답 필드를 선택하는 시리얼라이저 Mixin입니다.
+    - 조회(GET) 요청에서만 적용하며, 수정 요청의 입력 필드는 줄이지 않습니다.
+    - Meta.field_query_plans에 필드별 QueryPlan을 선언하면, 선택된 필드의 계획만 합쳐
+      뷰의 쿼리셋에 적용합니다(SparseFieldsetViewMixin). 제외한 필드의 조인, 프리페치,
+      집계 쿼리는 실행되지 않습니다.
+
+        class Meta:
+            field_query_plans = {
+                "author_name": QueryPlan(select_related=["author"]),
+            }
+    """
+
+    fields_param = "fields"
+    exclude_param = "exclude"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        request = self.context.get("request")
+        for name in list(self.fields):
+            if not self.is_field_selected(request, name):
+                self.fields.pop(name)
+
+    @classmethod
+    def get_requested_field_names(cls, request):
+        """
+        요청한 (fields, exclude) 필드 이름 집합을 반환합니다.
+        """
+        if request is None or request.method not in SAFE_METHODS:
+            return set(), set()
+        params = getattr(request, "query_params", request.GET)
+        return (
+            parse_field_names(params.get(cls.fields_param)),
+            parse_field_names(params.get(cls.exclude_param)),
+        )
+
+    @classmethod
+    def is_field_selected(cls, request, name):
+        fields, exclude = cls.get_requested_field_names(request)
+        return (not fields or name in fields) and name not in exclude
+
+    @classmethod
+    def get_query_plan(cls, request):
+        """
+        요청에서 선택된 필드에 필요한 QueryPlan을 합쳐서 반환합니다.
+        """
+        plan = QueryPlan()
+        field_query_plans = getattr(cls.Meta, "field_query_plans", {})
+        for name, field_plan in field_query_plans.items():
+            if cls.is_field_selected(request, name):
+                plan = plan.merge(field_plan)
+        return plan
+
+
+class SparseFieldsetViewMixin:
+    """
+    시리얼라이저가 선언한 QueryPlan 중 요청한 필드의 계획만 쿼리셋에 적용하는 뷰 Mixin입니다.
+    GenericAPIView보다 앞에 상속합니다.
+    """
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        serializer_class = self.get_serializer_class()
+        if issubclass(serializer_class, SparseFieldsetSerializerMixin):
+            queryset = serializer_class.get_query_plan(self.request).apply(queryset)
+        return queryset
@@ -0,0 +1,359 @@
+import contextvars
+import logging
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.http import HttpResponse
+from rest_framework import serializers
+from rest_framework.permissions import IsAdminUser
+from rest_framework.views import APIView
+
+logger = logging.getLogger("weaverse.instrumentation")
+
+current_metrics = contextvars.ContextVar("current_metrics", default=None)
+
+
+class RequestMetrics:
+    """
+    한 요청 동안 수집한 DB 쿼리, 시리얼라이저, 응답 크기 지표입니다.
+    - response_size는 압축(Content-Encoding)을 적용한 뒤의 본문 크기입니다.
+    """
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.duration = 0.0
+        self.query_count = 0
+        self.db_time = 0.0
+        self.serializer_time = 0.0
+        self.serializer_depth = 0
+        self.response_size = 0
+        self.fingerprints = Counter()
+
+    @property
+    def duplicate_queries(self):
+        """
+        같은 형태로 두 번 이상 실행된 쿼리의 (지문, 실행 횟수) 목록을 반환합니다.
+        """
+        return [
+            (fingerprint, count)
+            for fingerprint, count in self.fingerprints.most_common()
+            if count > 1
+        ]
+
+    @property
+    def duplicate_query_count(self):
+        return sum(count - 1 for _, count in self.duplicate_queries)
+
+
+def fingerprint_sql(sql):
+    """
+    파라미터 값과 IN 목록 길이를 제거하여 같은 형태의 쿼리를 같은 지문으로 만듭니다.
+    """
+    sql = re.sub(r"'(?:[^']|'')*'", "?", sql)
+    sql = re.sub(r"\b\d+\b", "?", sql)
+    sql = re.sub(r"%s", "?", sql)
+    sql = re.sub(r"IN \((?:\?,\s*)*\?\)", "IN (...)", sql)
+    return re.sub(r"\s+", " ", sql).strip()
+
+
+class QueryRecorder:
+    """
+    connection.execute_wrapper로 등록되어 쿼리 수, 실행 시간, 지문을 기록합니다.
+    """
+
+    def __init__(self, metrics):
+        self.metrics = metrics
+
+    def __call__(self, execute, sql, params, many, context):
+        started_at = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.metrics.db_time += time.perf_counter() - started_at
+            self.metrics.query_count += 1
+            self.metrics.fingerprints[fingerprint_sql(sql)] += 1
+
+
+def _timed_data(fget):
+    """
+    시리얼라이저 data 속성의 계산 시간을 현재 요청 지표의 시리얼라이저 시간에 더합니다.
+    - 요청 지표가 없으면(테스트, 관리 명령 등) 측정하지 않고 그대로 계산합니다.
+    - data 안에서 다른 시리얼라이저의 data를 계산하면 가장 바깥 호출에서 한 번만 집계합니다.
+    """
+
+    def data(self):
+        metrics = current_metrics.get()
+        if metrics is None:
+            return fget(self)
+        metrics.serializer_depth += 1
+        started_at = time.perf_counter()
+        try:
+            return fget(self)
+        finally:
+            metrics.serializer_depth -= 1
+            if metrics.serializer_depth == 0:
+                metrics.serializer_time += time.perf_counter() - started_at
+
+    data._instrumented = True
+    return property(data)
+
+
+def instrument_serializers():
+    """
+    DRF BaseSerializer의 data 속성에 시간 측정을 추가합니다. (프로세스당 한 번)
+    - Serializer, ListSerializer의 data는 모두 BaseSerializer.data를 거치므로,
+      앱의 시리얼라이저를 수정하지 않고 한 곳에서 모든 응답 직렬화를 측정합니다.
+    - InstrumentationMiddleware가 초기화될 때 호출합니다.
+    """
+    fget = serializers.BaseSerializer.data.fget
+    if not getattr(fget, "_instrumented", False):
+        serializers.BaseSerializer.data = _timed_data(fget)
+
+
+class Histogram:
+    """
+    Prometheus 형식의 누적 히스토그램입니다.
+    """
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.total = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.total += 1
+        self.sum += value
+        for index, bucket in enumerate(self.buckets):
+            if value <= bucket:
+                self.counts[index] += 1
+
+
+class MetricsRegistry:
+    """
+    프로세스 안에서 엔드포인트별 지표를 집계하고 Prometheus 텍스트 형식으로 출력합니다.
+    - 외부 서비스 없이 동작하며, 워커 프로세스마다 독립적으로 집계됩니다.
+    """
+
+    duration_buckets = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+    query_buckets = (1, 2, 5, 10, 20, 50, 100, 200)
+    size_buckets = (256, 1024, 4096, 16384, 65536, 262144, 1048576)
+
+    histograms = {
+        "weaverse_request_duration_seconds": ("요청 처리 시간", duration_buckets),
+        "weaverse_request_db_seconds": ("요청당 DB 시간", duration_buckets),
+        "weaverse_request_serializer_seconds": (
+            "요청당 시리얼라이저 시간",
+            duration_buckets,
+        ),
+        "weaverse_request_queries": ("요청당 쿼리 수", query_buckets),
+        "weaverse_response_size_bytes": (
+            "응답 크기(압축 후 전송 바이트)",
+            size_buckets,
+        ),
+    }
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._histograms = defaultdict(dict)
+            self._duplicate_queries = Counter()
+            self._connections_opened = Counter()
+
+    def observe(self, labels, metrics):
+        values = {
+            "weaverse_request_duration_seconds": metrics.duration,
+            "weaverse_request_db_seconds": metrics.db_time,
+            "weaverse_request_serializer_seconds": metrics.serializer_time,
+            "weaverse_request_queries": metrics.query_count,
+            "weaverse_response_size_bytes": metrics.response_size,
+        }
+        with self._lock:
+            for name, value in values.items():
+                histogram = self._histograms[name].get(labels)
+                if histogram is None:
+                    histogram = Histogram(self.histograms[name][1])
+                    self._histograms[name][labels] = histogram
+                histogram.observe(value)
+            self._duplicate_queries[labels] += metrics.duplicate_query_count
+
+    def observe_connection(self, alias):
+        with self._lock:
+            self._connections_opened[alias] += 1
+
+    def render(self):
+        """
+        집계된 지표를 Prometheus 텍스트 형식(0.0.4)으로 반환합니다.
+        """
+        lines = []
+        with self._lock:
+            for name, (description, _) in self.histograms.items():
+                lines.append(f"# HELP {name} {description}")
+                lines.append(f"# TYPE {name} histogram")
+                for labels, histogram in sorted(self._histograms[name].items()):
+                    label_text = self._format_labels(labels)
+                    for bucket, count in zip(histogram.buckets, histogram.counts):
+                        lines.append(
+                            f'{name}_bucket{{{label_text},le="{bucket}"}} {count}'
+                        )
+                    lines.append(
+                        f'{name}_bucket{{{label_text},le="+Inf"}} {histogram.total}'
+                    )
+                    lines.append(f"{name}_sum{{{label_text}}} {histogram.sum}")
+                    lines.append(f"{name}_count{{{label_text}}} {histogram.total}")
+
+            name = "weaverse_duplicate_queries_total"
+            lines.append(f"# HELP {name} 같은 형태로 반복 실행된 쿼리 수")
+            lines.append(f"# TYPE {name} counter")
+            for labels, count in sorted(self._duplicate_queries.items()):
+                lines.append(f"{name}{{{self._format_labels(labels)}}} {count}")
+
+            name = "weaverse_db_connections_opened_total"
+            lines.append(f"# HELP {name} 새로 연결하거나 풀에서 꺼낸 DB 연결 수")
+            lines.append(f"# TYPE {name} counter")
+            for alias, count in sorted(self._connections_opened.items()):
+                lines.append(f'{name}{{alias="{alias}"}} {count}')
+        lines.extend(self.render_pool_stats())
+        return "\n".join(lines) + "\n"
+
+    def render_pool_stats(self):
+        """
+        커넥션 풀을 사용하는 DB 별칭의 풀 상태(psycopg_pool get_stats)를 gauge로 반환합니다.
+        - 예: pool_size(열린 연결 수), pool_available(대기 중인 연결 수), requests_waiting(연결을 기다리는 요청 수)
+        """
+        stats = {}
+        for alias in connections:
+            pool = getattr(connections[alias], "pool", None)
+            if pool is not None:
+                stats[alias] = pool.get_stats()
+
+        lines = []
+        for key in sorted({key for values in stats.values() for key in values}):
+            name = f"weaverse_db_pool_{key}"
+            lines.append(f"# HELP {name} psycopg 커넥션 풀 {key}")
+            lines.append(f"# TYPE {name} gauge")
+            for alias, values in sorted(stats.items()):
+                if key in values:
+                    lines.append(f'{name}{{alias="{alias}"}} {values[key]}')
+        return lines
+
+    def _format_labels(self, labels):
+        method, route, status = labels
+        route = route.replace("\\", "\\\\").replace('"', '\\"')
+        return f'method="{method}",route="{route}",status="{status}"'
+
+
+metrics_registry = MetricsRegistry()
+
+
+def record_connection_created(sender, connection, **kwargs):
+    metrics_registry.observe_connection(connection.alias)
+
+
+connection_created.connect(record_connection_created)
+
+
+class InstrumentationMiddleware:
+    """
+    요청별 쿼리 수, DB 시간, 중복 쿼리 지문, 시리얼라이저 시간, 응답 크기를 측정합니다.
+    - 시리얼라이저 시간은 instrument_serializers()가 BaseSerializer.data에서 측정합니다.
+    - 가장 바깥 미들웨어이므로 응답 크기는 CompressionMiddleware가 압축한 뒤의 전송 바이트입니다.
+    - Server-Timing 헤더와 구조화된 로그로 내보내고, 엔드포인트별로 집계합니다.
+    - 집계 결과는 staff 전용 /metrics/ 엔드포인트에서 Prometheus 형식으로 조회합니다.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if getattr(settings, "INSTRUMENTATION_ENABLED", True):
+            instrument_serializers()
+
+    def __call__(self, request):
+        if not getattr(settings, "INSTRUMENTATION_ENABLED", True):
+            return self.get_response(request)
+
+        metrics = RequestMetrics()
+        token = current_metrics.set(metrics)
+        try:
+            with ExitStack() as stack:
+                recorder = QueryRecorder(metrics)
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(recorder))
+                response = self.get_response(request)
+        finally:
+            current_metrics.reset(token)
+
+        metrics.duration = time.perf_counter() - metrics.started_at
+        if not response.streaming:
+            metrics.response_size = len(response.content)
+
+        route = self.get_route(request)
+        metrics_registry.observe(
+            (request.method, route, str(response.status_code)), metrics
+        )
+        if getattr(settings, "SERVER_TIMING_ENABLED", True):
+            response["Server-Timing"] = self.get_server_timing(metrics)
+        self.log(request, response, route, metrics)
+        return response
+
+    def get_route(self, request):
+        """
+        경로 변수 대신 URL 패턴을 라벨로 사용하여 지표의 카디널리티를 제한합니다.
+        """
+        resolver_match = getattr(request, "resolver_match", None)
+        if resolver_match is None:
+            return "unmatched"
+        return "/" + resolver_match.route.lstrip("^")
+
+    def get_server_timing(self, metrics):
+        return ", ".join(
+            [
+                f'db;dur={metrics.db_time * 1000:.1f};desc="{metrics.query_count} queries"',
+                f"serializer;dur={metrics.serializer_time * 1000:.1f}",
+                f"total;dur={metrics.duration * 1000:.1f}",
+            ]
+        )
+
+    def log(self, request, response, route, metrics):
+        auth_context = getattr(request, "_jwt_auth_context", None)
+        extra = {
+            "method": request.method,
+            "route": route,
+            "status": response.status_code,
+            "duration_ms": round(metrics.duration * 1000, 1),
+            "queries": metrics.query_count,
+            "db_ms": round(metrics.db_time * 1000, 1),
+            "duplicate_queries": metrics.duplicate_query_count,
+            "serializer_ms": round(metrics.serializer_time * 1000, 1),
+            "response_bytes": metrics.response_size,
+            "user_id": auth_context.user_id if auth_context else None,
+        }
+        message = " ".join(f"{key}={value}" for key, value in extra.items())
+        duplicates = metrics.duplicate_queries[:3]
+        if duplicates:
+            message += " top_duplicates=" + "; ".join(
+                f"{count}x {fingerprint[:120]}" for fingerprint, count in duplicates
+            )
+        logger.info(message, extra=extra)
+
+
+class MetricsView(APIView):
+    """
+    집계된 요청 지표를 Prometheus 텍스트 형식으로 반환합니다. (staff 전용)
+    """
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return HttpResponse(
+            metrics_registry.render(),
+            content_type="text/plain; version=0.0.4; charset=utf-8",
+        )
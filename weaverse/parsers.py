@@ -0,0 +1,25 @@
+from rest_framework import parsers
+from rest_framework.exceptions import ParseError
+
+from .renderers import OrJSONRenderer, orjson
+
+
+class OrJSONParser(parsers.JSONParser):
+    """
+    orjson으로 JSON 요청 본문을 파싱하는 파서입니다.
+    - UTF-8이 아닌 인코딩이거나 orjson이 설치되지 않은 경우 표준 JSONParser로 동작합니다.
+    - NaN, Infinity 같은 JSON 표준이 아닌 값은 허용하지 않습니다.
+    """
+
+    renderer_class = OrJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", "utf-8")
+        if orjson is None or encoding.lower().replace("-", "") != "utf8":
+            return super().parse(stream, media_type, parser_context)
+
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
@@ -0,0 +1,154 @@
+from collections import Counter
+from contextlib import ContextDecorator
+
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, URLResolver, get_resolver
+
+from .instrumentation import fingerprint_sql
+
+
+class QueryBudgetExceeded(AssertionError):
+    """
+    쿼리 예산을 초과했을 때 발생하는 예외입니다.
+    """
+
+
+class QueryBudget(ContextDecorator):
+    """
+    블록(또는 테스트 함수) 안에서 실행된 쿼리 수가 예산을 넘으면 실패시킵니다.
+    - 컨텍스트 매니저와 데코레이터로 모두 사용할 수 있습니다.
+        with QueryBudget(5): ...
+        @query_budget(5)
+    - 실패 메시지에 반복 실행된 쿼리 지문을 포함하여 N+1 위치를 찾기 쉽게 합니다.
+    """
+
+    def __init__(self, max_queries, using=DEFAULT_DB_ALIAS, label=None):
+        self.max_queries = max_queries
+        self.using = using
+        self.label = label
+        self.context = None
+
+    def __enter__(self):
+        self.context = CaptureQueriesContext(connections[self.using])
+        self.context.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.context.__exit__(exc_type, exc_value, traceback)
+        if exc_type is None and self.count > self.max_queries:
+            raise QueryBudgetExceeded(self.get_report())
+        return False
+
+    @property
+    def count(self):
+        return len(self.context.captured_queries)
+
+    @property
+    def queries(self):
+        return [query["sql"] for query in self.context.captured_queries]
+
+    def get_report(self):
+        label = f"{self.label}: " if self.label else ""
+        lines = [f"{label}쿼리 {self.count}개 실행 (예산 {self.max_queries}개)"]
+        fingerprints = Counter(fingerprint_sql(sql) for sql in self.queries)
+        duplicates = [
+            (sql, count) for sql, count in fingerprints.most_common() if count > 1
+        ]
+        if duplicates:
+            lines.append("반복 실행된 쿼리:")
+            lines.extend(f"  {count}x {sql}" for sql, count in duplicates)
+        lines.append("실행된 쿼리:")
+        lines.extend(
+            f"  {index}. {sql}" for index, sql in enumerate(self.queries, start=1)
+        )
+        return "\n".join(lines)
+
+
+query_budget = QueryBudget
+
+
+class EndpointBudget:
+    """
+    엔드포인트(URL 이름, HTTP 메서드) 하나의 쿼리 예산입니다.
+    - factory(size)는 size개 규모의 데이터를 만들고 EndpointCall을 반환합니다.
+    - 데이터 규모와 관계없이 쿼리 수가 같아야 합니다.
+    - known_issue에 아직 고치지 않은 N+1의 설명을 적으면 테스트를 xfail(strict)로 표시합니다.
+      고쳐서 예산을 통과하면 테스트가 실패하므로 known_issue를 지워야 합니다.
+    """
+
+    def __init__(self, url_name, method, max_queries, factory, known_issue=None):
+        self.url_name = url_name
+        self.method = method
+        self.max_queries = max_queries
+        self.factory = factory
+        self.known_issue = known_issue
+
+    def __str__(self):
+        return f"{self.method.upper()} {self.url_name}"
+
+
+class EndpointCall:
+    """
+    쿼리 예산을 확인할 요청 하나입니다.
+    """
+
+    def __init__(self, args=None, user=None, data=None):
+        self.args = args or []
+        self.user = user
+        self.data = data
+
+
+class QueryBudgetRegistry:
+    """
+    엔드포인트별 쿼리 예산을 등록하는 레지스트리입니다.
+
+        @registry.register("courses:course-list", max_queries=5)
+        def course_list(size):
+            ...
+            return EndpointCall()
+    """
+
+    def __init__(self):
+        self.budgets = {}
+
+    def register(self, url_name, max_queries, method="get", known_issue=None):
+        def decorator(factory):
+            self.budgets[(url_name, method)] = EndpointBudget(
+                url_name, method, max_queries, factory, known_issue
+            )
+            return factory
+
+        return decorator
+
+    def __iter__(self):
+        return iter(self.budgets.values())
+
+    def __contains__(self, key):
+        return key in self.budgets
+
+
+def iter_url_names(patterns=None, namespace=None, exclude_namespaces=("admin",)):
+    """
+    프로젝트의 URL 패턴을 순회하며 (URL 이름, 뷰가 처리하는 HTTP 메서드 목록)을 반환합니다.
+    """
+    if patterns is None:
+        patterns = get_resolver().url_patterns
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            pattern_namespace = pattern.namespace or namespace
+            if pattern_namespace in exclude_namespaces:
+                continue
+            yield from iter_url_names(
+                pattern.url_patterns, pattern_namespace, exclude_namespaces
+            )
+        elif isinstance(pattern, URLPattern) and pattern.name:
+            view_class = getattr(pattern.callback, "view_class", None)
+            methods = [
+                method
+                for method in getattr(view_class, "http_method_names", [])
+                if method not in ("head", "options", "trace")
+                and hasattr(view_class, method)
+            ]
+            name = f"{namespace}:{pattern.name}" if namespace else pattern.name
+            yield name, methods
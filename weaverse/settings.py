@@ -1,6 +1,9 @@
+import json
 import os
+from importlib.util import find_spec
 from pathlib import Path
 
+from django.core.exceptions import ImproperlyConfigured
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -52,6 +55,9 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "weaverse.instrumentation.InstrumentationMiddleware",
+    "weaverse.compression.CompressionMiddleware",
+    "weaverse.db_routing.ReplicaRoutingMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -83,9 +89,16 @@ TEMPLATES = [
 
 REST_FRAMEWORK = {
     "DEFAULT_FILTER_BACKENDS": ["django_filters.rest_framework.DjangoFilterBackend"],
+    # orjson 기반 렌더러/파서를 사용합니다. (orjson이 없으면 표준 json으로 동작합니다.)
+    # Browsable API는 HTML 폼 페이지 전체를 렌더링하므로 DEBUG 환경에서만 사용합니다.
     "DEFAULT_RENDERER_CLASSES": [
-        "rest_framework.renderers.JSONRenderer",
-        "rest_framework.renderers.BrowsableAPIRenderer",
+        "weaverse.renderers.OrJSONRenderer",
+        *(["rest_framework.renderers.BrowsableAPIRenderer"] if DEBUG else []),
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "weaverse.parsers.OrJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
     ],
     "DEFAULT_AUTHENTICATION_CLASSES": [
         "jwtauth.authentication.JWTAuthentication",
@@ -95,6 +108,72 @@ REST_FRAMEWORK = {
     "PAGE_SIZE": 10,
 }
 
+# 요청 지표(쿼리 수, DB 시간, 시리얼라이저 시간, 응답 크기) 수집 설정
+INSTRUMENTATION_ENABLED = os.getenv("INSTRUMENTATION_ENABLED", "True").lower() == "true"
+SERVER_TIMING_ENABLED = os.getenv("SERVER_TIMING_ENABLED", "True").lower() == "true"
+
+# 캐시 설정
+# - default: 인증 사용자, 필터별 개수, 영수증 등 애플리케이션 캐시입니다.
+# - compression: 압축된 응답 본문 캐시입니다(CompressedPayloadCache).
+# 여러 프로세스(gunicorn worker 등)가 함께 봐야 하는 항목은 shared 캐시에 저장합니다.
+# - SHARED_CACHE_URL(예: redis://localhost:6379/0)을 지정하면 Redis 캐시를 사용합니다(redis 패키지 필요).
+# - 지정하지 않으면 프로세스별 LocMemCache를 사용하므로 단일 프로세스(개발 서버, 테스트)에서만 공유됩니다.
+SHARED_CACHE_URL = os.getenv("SHARED_CACHE_URL")
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "compression": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "compression",
+    },
+    "shared": (
+        {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": SHARED_CACHE_URL,
+        }
+        if SHARED_CACHE_URL
+        else {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "shared",
+        }
+    ),
+}
+
+# 응답 압축 설정
+# - brotli 패키지가 설치되어 있으면 br을 우선 사용하고, 없으면 gzip만 사용합니다.
+# - COMPRESSION_CACHE_MIN_SIZE 이상의 공개 응답은 본문 해시를 키로 압축 결과를 COMPRESSION_CACHE_ALIAS 캐시에 저장합니다.
+#   압축 결과가 다른 캐시 항목(인증 사용자, 필터별 개수 등)을 밀어내지 않도록 별도 캐시를 사용합니다.
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+COMPRESSION_CACHE_MIN_SIZE = int(os.getenv("COMPRESSION_CACHE_MIN_SIZE", "16384"))
+COMPRESSION_CACHE_TIMEOUT = int(os.getenv("COMPRESSION_CACHE_TIMEOUT", "600"))
+COMPRESSION_CACHE_ALIAS = "compression"
+COMPRESSION_GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+COMPRESSION_BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "5"))
+
+# 카탈로그(코스, 커리큘럼) 조회 응답의 HTTP 캐시 설정
+# - 익명 요청은 브라우저에서 CATALOG_CACHE_MAX_AGE초, CDN 등 공유 캐시에서 CATALOG_CACHE_S_MAXAGE초 동안 재사용합니다.
+# - 응답 형식이 바뀌는 배포에서는 CATALOG_CACHE_VERSION을 올려 기존 ETag를 무효화합니다.
+CATALOG_CACHE_MAX_AGE = int(os.getenv("CATALOG_CACHE_MAX_AGE", "60"))
+CATALOG_CACHE_S_MAXAGE = int(os.getenv("CATALOG_CACHE_S_MAXAGE", "300"))
+CATALOG_CACHE_STALE_WHILE_REVALIDATE = int(
+    os.getenv("CATALOG_CACHE_STALE_WHILE_REVALIDATE", "30")
+)
+CATALOG_CACHE_VERSION = os.getenv("CATALOG_CACHE_VERSION", "1")
+# 코스 필터별 개수(courses/facets/)의 집계 결과를 검색어별로 캐시하는 시간(초)입니다.
+CATALOG_FACETS_CACHE_TIMEOUT = int(os.getenv("CATALOG_FACETS_CACHE_TIMEOUT", "60"))
+
+# JWT 서명 설정
+# - HS256은 SECRET_KEY로 서명하며, RS256/EdDSA는 JWT_PRIVATE_KEY(PEM)로 서명하고 kid 헤더를 추가합니다.
+# - 키 교체 시 이전 공개키를 JWT_PREVIOUS_PUBLIC_KEYS에 남겨 두면
+#   기존 토큰이 만료될 때까지 검증되며 JWKS(/api/.well-known/jwks.json)로도 제공됩니다.
+#   {"kid": {"algorithm": "RS256", "key": "PEM"}} 형식으로 키마다 알고리즘을 기록하므로 알고리즘도 바꿀 수 있으며,
+#   {"kid": "PEM"}처럼 PEM만 지정하면 현재 JWT_ALGORITHM으로 검증합니다.
+JWT_ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
+JWT_KEY_ID = os.getenv("JWT_KEY_ID", "")
+JWT_PRIVATE_KEY = os.getenv("JWT_PRIVATE_KEY", "").replace("\\n", "\n")
+JWT_PREVIOUS_PUBLIC_KEYS = json.loads(os.getenv("JWT_PREVIOUS_PUBLIC_KEYS", "{}"))
+
 WSGI_APPLICATION = "weaverse.wsgi.application"
 
 DATABASES = {
@@ -105,9 +184,55 @@ DATABASES = {
         "PASSWORD": os.getenv("DATABASE_PASSWORD", ""),
         "HOST": os.getenv("DATABASE_HOST", ""),
         "PORT": os.getenv("DATABASE_PORT", ""),
+        "CONN_MAX_AGE": int(os.getenv("DATABASE_CONN_MAX_AGE", "60")),
+        "CONN_HEALTH_CHECKS": True,
     }
 }
 
+# DB 연결 재사용 설정
+# - 기본값은 지속 연결(persistent connection)로, 워커가 DATABASE_CONN_MAX_AGE초 동안 연결을 재사용하며
+#   CONN_HEALTH_CHECKS로 재사용 전에 끊어진 연결인지 확인합니다.
+# - DATABASE_POOL=True이고 PostgreSQL을 사용하면 psycopg3 커넥션 풀(Django "pool" 옵션)을 사용합니다.
+#   풀은 워커 프로세스마다 생성되므로 DATABASE_POOL_MAX_SIZE × 워커 수가 max_connections를 넘지 않도록 설정합니다.
+#   CONN_HEALTH_CHECKS가 True이므로 Django가 풀에서 꺼낸 연결을 check_connection으로 확인합니다.
+DATABASE_POOL = os.getenv("DATABASE_POOL", "False").lower() == "true"
+if DATABASE_POOL and DATABASES["default"]["ENGINE"] == "django.db.backends.postgresql":
+    DATABASES["default"]["CONN_MAX_AGE"] = 0
+    DATABASES["default"]["OPTIONS"] = {
+        "pool": {
+            "min_size": int(os.getenv("DATABASE_POOL_MIN_SIZE", "2")),
+            "max_size": int(os.getenv("DATABASE_POOL_MAX_SIZE", "10")),
+            "timeout": float(os.getenv("DATABASE_POOL_TIMEOUT", "10")),
+            "max_idle": float(os.getenv("DATABASE_POOL_MAX_IDLE", "300")),
+            "max_lifetime": float(os.getenv("DATABASE_POOL_MAX_LIFETIME", "3600")),
+        }
+    }
+
+# 읽기 전용 복제본(replica) 설정
+# - DATABASE_REPLICA_HOSTS에 쉼표로 구분한 복제본 호스트를 지정하면 replica_1, replica_2, ... 별칭으로 추가됩니다.
+#   sqlite를 사용하는 경우에는 복제본 DB 파일 경로로 사용합니다.
+# - 조회(GET) 요청의 읽기 쿼리는 복제본으로 보내고, 쓰기 요청과 결제(payments) 요청은 primary에서 처리합니다.
+# - 쓰기 요청 후 DATABASE_REPLICA_STICKY_SECONDS 동안은 같은 클라이언트의 요청을 primary에서 처리합니다.
+#   브라우저는 쿠키로 판단하고, 쿠키를 보내지 않는 API 클라이언트는 Authorization 헤더 해시 표시를
+#   DATABASE_STICKY_CACHE_ALIAS 캐시에 저장합니다. 여러 worker로 운영할 때는 SHARED_CACHE_URL을 지정해야
+#   다른 worker로 간 요청도 primary에서 처리됩니다.
+# - 테스트에서는 복제본이 primary 테스트 DB를 그대로 사용합니다(TEST MIRROR).
+for index, host in enumerate(
+    filter(None, os.getenv("DATABASE_REPLICA_HOSTS", "").split(",")), start=1
+):
+    replica = {**DATABASES["default"], "TEST": {"MIRROR": "default"}}
+    if replica["ENGINE"].endswith("sqlite3"):
+        replica["NAME"] = host.strip()
+    else:
+        replica["HOST"] = host.strip()
+    DATABASES[f"replica_{index}"] = replica
+DATABASE_REPLICAS = [alias for alias in DATABASES if alias != "default"]
+DATABASE_ROUTERS = ["weaverse.db_routing.ReplicaRouter"]
+DATABASE_PRIMARY_APPS = ["payments"]
+DATABASE_REPLICA_STICKY_SECONDS = int(os.getenv("DATABASE_REPLICA_STICKY_SECONDS", "5"))
+DATABASE_STICKY_COOKIE_NAME = "db_primary"
+DATABASE_STICKY_CACHE_ALIAS = "shared"
+
 
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -124,6 +249,51 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# 비밀번호 해시 설정
+# - PASSWORD_HASHER_PROFILE로 새 비밀번호에 사용할 해시 알고리즘을 선택합니다.
+# - 모든 프로필에 나머지 알고리즘을 포함하여 기존 해시도 검증되며, 로그인 시 선택한 알고리즘으로 재해시됩니다.
+# - argon2 프로필은 argon2-cffi 패키지가 설치된 경우에만 선택할 수 있습니다.
+PASSWORD_HASHER_PROFILES = {
+    "pbkdf2": [
+        "accounts.hashers.PBKDF2PasswordHasher",
+        "accounts.hashers.ScryptPasswordHasher",
+        "accounts.hashers.Argon2PasswordHasher",
+    ],
+    "scrypt": [
+        "accounts.hashers.ScryptPasswordHasher",
+        "accounts.hashers.PBKDF2PasswordHasher",
+        "accounts.hashers.Argon2PasswordHasher",
+    ],
+}
+if find_spec("argon2"):
+    PASSWORD_HASHER_PROFILES["argon2"] = [
+        "accounts.hashers.Argon2PasswordHasher",
+        "accounts.hashers.ScryptPasswordHasher",
+        "accounts.hashers.PBKDF2PasswordHasher",
+    ]
+PASSWORD_HASHER_PROFILE = os.getenv("PASSWORD_HASHER_PROFILE", "pbkdf2")
+if PASSWORD_HASHER_PROFILE not in PASSWORD_HASHER_PROFILES:
+    raise ImproperlyConfigured(
+        f"알 수 없는 PASSWORD_HASHER_PROFILE입니다: {PASSWORD_HASHER_PROFILE!r} "
+        f"(사용 가능: {', '.join(PASSWORD_HASHER_PROFILES)})"
+    )
+PASSWORD_HASHERS = PASSWORD_HASHER_PROFILES[PASSWORD_HASHER_PROFILE]
+# 알고리즘별 파라미터(설정하지 않은 값은 Django 기본값을 사용합니다.)
+PASSWORD_HASHER_OPTIONS = {
+    "scrypt": {"work_factor": int(os.getenv("SCRYPT_WORK_FACTOR", 2**14))},
+    "argon2": {
+        "time_cost": int(os.getenv("ARGON2_TIME_COST", 2)),
+        "memory_cost": int(os.getenv("ARGON2_MEMORY_COST", 102400)),
+        "parallelism": int(os.getenv("ARGON2_PARALLELISM", 8)),
+    },
+}
+if os.getenv("PBKDF2_ITERATIONS"):
+    PASSWORD_HASHER_OPTIONS["pbkdf2_sha256"] = {
+        "iterations": int(os.getenv("PBKDF2_ITERATIONS"))
+    }
+# 0보다 크면 해당 개수의 프로세스 풀에서 해시를 계산합니다.
+PASSWORD_HASHING_PROCESSES = int(os.getenv("PASSWORD_HASHING_PROCESSES", 0))
+
 LANGUAGE_CODE = "ko-kr"
 
 TIME_ZONE = "Asia/Seoul"
@@ -0,0 +1,143 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.urls import reverse
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from courses.models import Course, Curriculum, Lecture, Topic
+from jwtauth.services import token_service
+
+User = get_user_model()
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def tutor(db):
+    return baker.make(User, is_staff=True)
+
+
+@pytest.fixture
+def course(tutor):
+    course = baker.make(Course, author=tutor, description={})
+    lecture = baker.make(Lecture, course=course, order=1)
+    baker.make(Topic, lecture=lecture, order=1, _quantity=2)
+    return course
+
+
+def get_client(user=None):
+    client = APIClient()
+    if user is not None:
+        client.credentials(
+            HTTP_AUTHORIZATION=f"Bearer {token_service.generate_access_token(user)}"
+        )
+    return client
+
+
+# Given: 코스 목록이 있을 때
+# When: 익명 사용자가 조회하면
+# Then: 공유 캐시가 저장할 수 있는 Cache-Control과 검증자(ETag, Last-Modified)를 반환해야 합니다.
+def test_코스_목록_익명_캐시_헤더(course):
+    response = get_client().get(reverse("courses:course-list"))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response["ETag"].startswith('W/"')
+    assert response.has_header("Last-Modified")
+    cache_control = {value.strip() for value in response["Cache-Control"].split(",")}
+    assert {"public", "max-age=60", "s-maxage=300"} <= cache_control
+    assert "Authorization" in response["Vary"]
+
+
+# Given: 코스 목록의 ETag를 받은 클라이언트가 있을 때
+# When: If-None-Match 또는 If-Modified-Since로 다시 조회하면
+# Then: 직렬화 없이 검증자 집계 쿼리 한 번으로 304를 반환해야 합니다.
+def test_코스_목록_조건부_요청(course, query_budget):
+    url = reverse("courses:course-list")
+    first = get_client().get(url)
+
+    with query_budget(1):
+        response = get_client().get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.content == b""
+    assert response["ETag"] == first["ETag"]
+
+    response = get_client().get(url, HTTP_IF_MODIFIED_SINCE=first["Last-Modified"])
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+# Given: 코스 상세의 ETag를 받은 클라이언트가 있을 때
+# When: 코스가 수정되거나 주제가 삭제된 뒤 다시 조회하면
+# Then: 새 ETag와 함께 200을 반환해야 합니다.
+def test_코스_상세_변경시_etag_갱신(course):
+    url = reverse("courses:course-detail", args=[course.id])
+    etag = get_client().get(url)["ETag"]
+
+    course.title = "수정된 코스"
+    course.save()
+    response = get_client().get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_200_OK
+    assert response["ETag"] != etag
+    etag = response["ETag"]
+
+    Topic.objects.filter(lecture__course=course).first().delete()
+    response = get_client().get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_200_OK
+    assert response["ETag"] != etag
+
+
+# Given: 수강 권한이 응답에 포함되는 코스 상세가 있을 때
+# When: 로그인한 사용자가 조회하면
+# Then: 공유 캐시에 저장되지 않도록 private, no-cache로 응답해야 합니다.
+def test_코스_상세_로그인_사용자(course):
+    student = baker.make(User, is_staff=False)
+    response = get_client(student).get(
+        reverse("courses:course-detail", args=[course.id])
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert not response.has_header("ETag")
+    assert "private" in response["Cache-Control"]
+    assert "no-cache" in response["Cache-Control"]
+    assert "public" not in response["Cache-Control"]
+
+
+# Given: 커리큘럼이 있을 때
+# When: 포함된 코스가 수정된 뒤 이전 ETag로 커리큘럼 상세를 조회하면
+# Then: 200을 반환하고, 없는 커리큘럼은 404를 반환해야 합니다.
+def test_커리큘럼_상세_조건부_요청(course, tutor):
+    curriculum = baker.make(Curriculum, author=tutor)
+    Course.objects.filter(pk=course.pk).update(curriculum=curriculum)
+    url = reverse("courses:curriculum-detail", args=[curriculum.id])
+    etag = get_client().get(url)["ETag"]
+
+    assert (
+        get_client().get(url, HTTP_IF_NONE_MATCH=etag).status_code
+        == status.HTTP_304_NOT_MODIFIED
+    )
+    course.save()
+    assert get_client().get(url, HTTP_IF_NONE_MATCH=etag).status_code == (
+        status.HTTP_200_OK
+    )
+    assert (
+        get_client()
+        .get(reverse("courses:curriculum-detail", args=[curriculum.id + 1]))
+        .status_code
+        == status.HTTP_404_NOT_FOUND
+    )
+
+
+# Given: 코스 목록을 조회할 때
+# When: POST 요청을 보내면
+# Then: 캐시 헤더를 추가하지 않아야 합니다.
+def test_조회_외_요청은_캐시하지_않음(tutor):
+    response = get_client(tutor).post(reverse("courses:course-list"), {}, format="json")
+
+    assert not response.has_header("ETag")
+    assert "public" not in response.get("Cache-Control", "")
@@ -0,0 +1,197 @@
+import gzip
+import json
+
+import pytest
+from django.core.cache import caches
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from accounts.models import CustomUser
+from courses.models import Course, Lecture, Topic
+from weaverse.compression import (
+    CompressedPayloadCache,
+    CompressionMiddleware,
+    GzipEncoder,
+    brotli,
+    parse_accept_encoding,
+)
+
+LARGE_JSON = json.dumps([{"title": "강의", "order": i} for i in range(500)]).encode()
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    for cache in caches.all():
+        cache.clear()
+    yield
+    for cache in caches.all():
+        cache.clear()
+
+
+def get_middleware(response):
+    return CompressionMiddleware(lambda request: response)
+
+
+def get_request(accept_encoding="gzip, deflate, br"):
+    return RequestFactory().get("/", HTTP_ACCEPT_ENCODING=accept_encoding)
+
+
+def json_response(content=LARGE_JSON, **kwargs):
+    return HttpResponse(content, content_type="application/json", **kwargs)
+
+
+# Given: Accept-Encoding 헤더가 있을 때
+# When: 파싱하면
+# Then: 인코딩별 q 값을 반환해야 합니다.
+def test_parse_accept_encoding():
+    assert parse_accept_encoding("gzip;q=0.5, br, identity;q=0, *;q=x") == {
+        "gzip": 0.5,
+        "br": 1.0,
+        "identity": 0.0,
+        "*": 0.0,
+    }
+
+
+# Given: 크기가 큰 JSON 응답이 있을 때
+# When: gzip을 허용하는 요청에 응답하면
+# Then: 압축된 본문과 Content-Encoding, Vary 헤더를 반환해야 합니다.
+@pytest.mark.skipif(
+    brotli is not None, reason="brotli가 설치된 환경에서는 br을 우선합니다."
+)
+def test_gzip_압축():
+    response = get_middleware(json_response())(get_request())
+
+    assert response["Content-Encoding"] == "gzip"
+    assert response["Vary"] == "Accept-Encoding"
+    assert int(response["Content-Length"]) == len(response.content)
+    assert len(response.content) * 5 < len(LARGE_JSON)
+    assert gzip.decompress(response.content) == LARGE_JSON
+
+
+# Given: brotli가 설치되어 있을 때
+# When: br을 허용하는 요청에 응답하면
+# Then: brotli로 압축해야 합니다.
+@pytest.mark.skipif(brotli is None, reason="brotli가 설치되지 않았습니다.")
+def test_brotli_압축():
+    response = get_middleware(json_response())(get_request())
+
+    assert response["Content-Encoding"] == "br"
+    assert brotli.decompress(response.content) == LARGE_JSON
+
+
+# Given: 압축하지 않아야 하는 응답이나 요청이 있을 때
+# When: 응답하면
+# Then: 본문을 그대로 반환해야 합니다.
+@pytest.mark.parametrize(
+    "response, accept_encoding",
+    [
+        (json_response(b'{"id": 1}'), "gzip"),
+        (json_response(), ""),
+        (json_response(), "gzip;q=0, br;q=0"),
+        (HttpResponse(LARGE_JSON, content_type="image/png"), "gzip"),
+        (json_response(headers={"Cache-Control": "no-transform"}), "gzip"),
+        (HttpResponse(LARGE_JSON, content_type="text/html"), "gzip"),
+    ],
+    ids=["작은 응답", "Accept-Encoding 없음", "q=0", "이미지", "no-transform", "HTML"],
+)
+def test_압축하지_않는_경우(response, accept_encoding):
+    original = response.content
+    response = get_middleware(response)(get_request(accept_encoding))
+
+    assert not response.has_header("Content-Encoding")
+    assert response.content == original
+
+
+# Given: 강한 ETag가 있는 응답이 있을 때
+# When: 압축하면
+# Then: 약한 ETag로 바뀌어야 합니다.
+def test_etag_약화():
+    response = get_middleware(json_response(headers={"ETag": '"abc"'}))(
+        get_request("gzip")
+    )
+    assert response["ETag"] == 'W/"abc"'
+
+
+# Given: 스트리밍 응답이 있을 때
+# When: gzip을 허용하는 요청에 응답하면
+# Then: 청크 단위로 압축하고 Content-Length 없이 반환해야 합니다.
+def test_스트리밍_응답_압축():
+    chunks = [LARGE_JSON[i : i + 1000] for i in range(0, len(LARGE_JSON), 1000)]
+    response = StreamingHttpResponse(iter(chunks), content_type="application/json")
+    response = get_middleware(response)(get_request("gzip"))
+
+    assert response["Content-Encoding"] == "gzip"
+    assert not response.has_header("Content-Length")
+    assert gzip.decompress(b"".join(response.streaming_content)) == LARGE_JSON
+
+
+# Given: 같은 본문의 큰 응답이 반복될 때
+# When: 압축 결과 캐시를 사용하면
+# Then: 인코딩별로 한 번만 압축해야 합니다.
+def test_압축_결과_캐시():
+    class CountingGzipEncoder(GzipEncoder):
+        calls = 0
+
+        def compress(self, content):
+            CountingGzipEncoder.calls += 1
+            return super().compress(content)
+
+    payload_cache = CompressedPayloadCache()
+    encoder = CountingGzipEncoder()
+    first = payload_cache.get_or_compress(encoder, LARGE_JSON, timeout=60)
+    second = payload_cache.get_or_compress(encoder, LARGE_JSON, timeout=60)
+    payload_cache.get_or_compress(encoder, LARGE_JSON + b" ", timeout=60)
+
+    assert first == second
+    assert CountingGzipEncoder.calls == 2
+
+
+# Given: 압축 결과 캐시 크기 이상의 응답이 있을 때
+# When: 공개 응답과 사용자별 응답을 압축하면
+# Then: 공개 응답만 압축 결과 캐시에 저장해야 합니다.
+@pytest.mark.parametrize(
+    "request_kwargs, response_kwargs, cached",
+    [
+        ({}, {}, True),
+        ({"HTTP_AUTHORIZATION": "Bearer token"}, {}, False),
+        ({}, {"headers": {"Cache-Control": "private, no-cache"}}, False),
+        ({}, {"headers": {"Cache-Control": "no-store"}}, False),
+    ],
+    ids=["공개 응답", "인증 요청", "private", "no-store"],
+)
+def test_공개_응답만_압축_결과_캐시(request_kwargs, response_kwargs, cached):
+    request = RequestFactory().get("/", HTTP_ACCEPT_ENCODING="gzip", **request_kwargs)
+    response = get_middleware(json_response(**response_kwargs))(request)
+
+    key = CompressedPayloadCache().get_key(GzipEncoder(), LARGE_JSON)
+    assert response["Content-Encoding"] == "gzip"
+    assert (caches["compression"].get(key) is not None) is cached
+    assert caches["default"].get(key) is None
+
+
+# Given: 주제가 많은 코스가 있을 때
+# When: 압축을 허용하는 클라이언트가 코스 상세를 조회하면
+# Then: 압축된 응답을 반환해야 합니다.
+@pytest.mark.django_db
+def test_코스_상세_압축():
+    author = CustomUser.objects.create_staff(
+        email="staff@example.com", password="Pass1!", nickname="staff"
+    )
+    course = Course.objects.create(
+        title="코스", author=author, price=1000, description={}
+    )
+    for order in range(1, 11):
+        lecture = Lecture.objects.create(course=course, title="강의", order=order)
+        for topic_order in range(1, 6):
+            Topic.objects.create(lecture=lecture, title="주제", order=topic_order)
+
+    url = reverse("courses:course-detail", args=[course.id])
+    plain = APIClient().get(url)
+    response = APIClient().get(url, HTTP_ACCEPT_ENCODING="gzip")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response["Content-Encoding"] in ("gzip", "br")
+    assert len(response.content) < len(plain.content)
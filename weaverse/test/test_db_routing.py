@@ -0,0 +1,180 @@
+import pytest
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connections
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import resolve, reverse
+from model_bakery import baker
+from rest_framework.test import APIClient
+
+from accounts.models import CustomUser
+from courses.models import Course
+from jwtauth.services import token_service
+from payments.models import Order
+from weaverse.db_routing import (
+    ReplicaRouter,
+    ReplicaRoutingMiddleware,
+    primary_pinned,
+    use_primary,
+)
+
+replicas = override_settings(DATABASE_REPLICAS=["replica"])
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    caches["shared"].clear()
+    yield
+    caches["shared"].clear()
+
+
+def run_middleware(request):
+    """
+    미들웨어를 통과시키고 (응답, 뷰 실행 중 primary 고정 여부)를 반환합니다.
+    """
+    pinned = []
+
+    def get_response(request):
+        middleware.process_view(request, None, (), {})
+        pinned.append(primary_pinned.get())
+        return HttpResponse()
+
+    middleware = ReplicaRoutingMiddleware(get_response)
+    response = middleware(request)
+    return response, pinned[0]
+
+
+# Given: 복제본이 설정되어 있을 때
+# When: 모델별로 읽기/쓰기 DB를 결정하면
+# Then: 읽기는 복제본, 쓰기와 결제 모델, use_primary 블록의 읽기는 primary로 보내야 합니다.
+@replicas
+def test_router_읽기_쓰기_분리():
+    router = ReplicaRouter()
+
+    assert router.db_for_read(Course) == "replica"
+    assert router.db_for_write(Course) == "default"
+    assert router.db_for_read(Order) == "default"
+    with use_primary():
+        assert router.db_for_read(Course) == "default"
+    assert router.db_for_read(Course) == "replica"
+    assert router.allow_migrate("replica", "courses") is False
+    assert router.allow_migrate("default", "courses") is None
+
+
+# Given: 복제본이 설정되지 않았을 때
+# When: 읽기 DB를 결정하면
+# Then: primary를 사용해야 합니다.
+@override_settings(DATABASE_REPLICAS=[])
+def test_router_복제본_없음():
+    assert ReplicaRouter().db_for_read(Course) == "default"
+
+
+# Given: 복제본이 설정되어 있을 때
+# When: primary에서 트랜잭션이 진행 중이면
+# Then: 읽기도 primary로 보내야 합니다(select_for_update 등과 같은 데이터를 읽도록).
+@replicas
+def test_router_트랜잭션_중_primary():
+    connection = connections["default"]
+    connection.in_atomic_block = True
+    try:
+        assert ReplicaRouter().db_for_read(Course) == "default"
+    finally:
+        connection.in_atomic_block = False
+
+
+# Given: 복제본이 설정되어 있을 때
+# When: 쓰기 요청 후 같은 클라이언트가 조회하면
+# Then: 쿠키나 Authorization 헤더 표시로 primary에 고정되어야 합니다.
+@replicas
+def test_middleware_쓰기_후_primary_고정():
+    factory = RequestFactory()
+
+    response, pinned = run_middleware(factory.get("/api/courses/"))
+    assert pinned is False
+
+    response, pinned = run_middleware(
+        factory.post("/api/courses/", HTTP_AUTHORIZATION="Bearer token")
+    )
+    assert pinned is True
+    assert response.cookies["db_primary"]["max-age"] == 5
+
+    request = factory.get("/api/courses/")
+    request.COOKIES["db_primary"] = "1"
+    assert run_middleware(request)[1] is True
+
+    request = factory.get("/api/courses/", HTTP_AUTHORIZATION="Bearer token")
+    assert run_middleware(request)[1] is True
+
+    request = factory.get("/api/courses/", HTTP_AUTHORIZATION="Bearer other")
+    assert run_middleware(request)[1] is False
+    assert primary_pinned.get() is False
+
+
+# Given: 복제본이 설정되어 있을 때
+# When: Authorization 헤더로 쓰기 요청을 보내면
+# Then: 표시는 worker 간에 공유되는 DATABASE_STICKY_CACHE_ALIAS 캐시에 저장되어야 합니다.
+@replicas
+def test_middleware_공유_캐시에_표시_저장():
+    factory = RequestFactory()
+    run_middleware(factory.post("/api/courses/", HTTP_AUTHORIZATION="Bearer token"))
+
+    key = ReplicaRoutingMiddleware(None).get_cache_key(
+        factory.get("/api/courses/", HTTP_AUTHORIZATION="Bearer token")
+    )
+    assert settings.DATABASE_STICKY_CACHE_ALIAS == "shared"
+    assert caches["shared"].get(key) is True
+    assert caches["default"].get(key) is None
+
+
+# Given: 복제본이 설정되어 있을 때
+# When: 결제 앱의 조회 요청을 처리하면
+# Then: primary에 고정되어야 합니다.
+@replicas
+def test_middleware_결제_요청_primary():
+    request = RequestFactory().get(reverse("payments:order"))
+    request.resolver_match = resolve(request.path)
+
+    assert run_middleware(request)[1] is True
+
+
+# Given: DATABASE_REPLICA_HOSTS로 복제본 별칭이 추가되어 있을 때
+# When: 코스 목록을 조회하고, 코스를 생성한 뒤 다시 조회하면
+# Then: 처음에는 복제본에서 읽고, 생성 후에는 primary에서 읽어야 합니다.
+@pytest.mark.skipif(
+    not settings.DATABASE_REPLICAS,
+    reason="DATABASE_REPLICA_HOSTS가 설정되지 않았습니다.",
+)
+@pytest.mark.django_db(transaction=True, databases="__all__")
+def test_복제본_조회와_쓰기_후_primary_조회():
+    replica = connections[settings.DATABASE_REPLICAS[0]]
+    staff = baker.make(CustomUser, is_staff=True)
+    baker.make(Course, author=staff, description={})
+    client = APIClient()
+    client.credentials(
+        HTTP_AUTHORIZATION=f"Bearer {token_service.generate_access_token(staff)}"
+    )
+
+    with CaptureQueriesContext(replica) as queries:
+        client.get(reverse("courses:course-list"))
+    assert len(queries) > 0
+
+    response = client.post(
+        reverse("courses:course-list"),
+        {
+            "title": "새 코스",
+            "short_description": "새 코스",
+            "description": {},
+            "category": "Python",
+            "skill_level": "beginner",
+            "price": 10000,
+            "video_id": 0,
+            "thumbnail_id": 0,
+        },
+        format="json",
+    )
+    assert response.status_code == 201
+    with CaptureQueriesContext(replica) as queries:
+        client.get(reverse("courses:course-list"))
+    assert len(queries) == 0
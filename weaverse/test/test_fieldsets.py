@@ -0,0 +1,153 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.test import APIClient
+
+from courses.counters import CatalogCounter
+from courses.models import Course, Lecture, Topic
+from courses.serializers import CourseSummarySerializer
+from jwtauth.services import token_service
+from materials.models import Image
+from payments.models import Order, OrderItem
+from weaverse.fieldsets import QueryPlan, parse_field_names
+
+User = get_user_model()
+
+
+@pytest.fixture
+def staff_user(db):
+    user = User.objects.create_staff(
+        email="staff@example.com", password="Pass1!", nickname="staff"
+    )
+    Image.objects.create(user=user, url="https://example.com/staff.jpg")
+    return user
+
+
+@pytest.fixture
+def courses(staff_user):
+    courses = []
+    for i in range(3):
+        course = Course.objects.create(
+            title=f"Course {i}", author=staff_user, price=1000, description={}
+        )
+        lecture = Lecture.objects.create(course=course, title="Lecture", order=1)
+        Topic.objects.create(lecture=lecture, title="Topic", order=1)
+        courses.append(course)
+    CatalogCounter().refresh_courses([course.id for course in courses])
+    return courses
+
+
+def get_request(path):
+    return Request(RequestFactory().get(path))
+
+
+def count_queries(client, url):
+    cache.clear()
+    with CaptureQueriesContext(connection) as context:
+        response = client.get(url)
+    assert response.status_code == status.HTTP_200_OK
+    return response, len(context.captured_queries)
+
+
+# Given: 쉼표로 구분된 필드 이름이 있을 때
+# When: 파싱하면
+# Then: 공백과 빈 이름을 제외한 필드 이름 집합을 반환해야 합니다.
+def test_parse_field_names():
+    assert parse_field_names("id, title,,price ") == {"id", "title", "price"}
+    assert parse_field_names(None) == set()
+
+
+# Given: 필드별 QueryPlan이 있을 때
+# When: 합치면
+# Then: 중복 없이 관계와 집계가 모두 포함되어야 합니다.
+def test_query_plan_merge():
+    plan = QueryPlan(select_related=["author"]).merge(
+        QueryPlan(select_related=["author", "image"], annotate={"n": None})
+    )
+    assert plan.select_related == ["author", "image"]
+    assert plan.annotate == {"n": None}
+
+
+# Given: ?fields=, ?exclude=가 포함된 조회 요청이 있을 때
+# When: 시리얼라이저의 QueryPlan을 구하면
+# Then: 선택한 필드에 필요한 관계와 집계만 포함되어야 합니다.
+def test_query_plan_선택한_필드만_포함():
+    plan = CourseSummarySerializer.get_query_plan(
+        get_request("/?fields=id,title,author_name")
+    )
+    assert plan.select_related == ["author"]
+    assert plan.annotate == {}
+
+    plan = CourseSummarySerializer.get_query_plan(
+        get_request("/?exclude=lectures_count")
+    )
+    assert "num_lectures" not in plan.annotate
+    assert "image" in plan.select_related
+
+
+# Given: 코스가 여러 개 있을 때
+# When: 일부 필드만 선택하여 코스 목록을 조회하면
+# Then: 선택한 필드만 응답하고, 정렬 순서는 유지되어야 합니다.
+@pytest.mark.django_db
+def test_course_list_sparse_fields(courses):
+    client = APIClient()
+    response, _ = count_queries(
+        client, reverse("courses:course-list") + "?fields=id,title,lectures_count"
+    )
+    results = response.data["results"]
+    assert results[0] == {
+        "id": courses[-1].id,
+        "title": "Course 2",
+        "lectures_count": 1,
+    }
+    assert [course["id"] for course in results] == [c.id for c in reversed(courses)]
+
+
+# Given: 강의와 주제가 있는 코스가 있을 때
+# When: lectures 필드를 제외하고 코스를 조회하면
+# Then: 강의와 주제를 조회하는 프리페치 쿼리가 실행되지 않아야 합니다.
+@pytest.mark.django_db
+def test_course_detail_exclude_removes_queries(courses):
+    client = APIClient()
+    url = reverse("courses:course-detail", args=[courses[0].id])
+    full_response, full_count = count_queries(client, url)
+    response, count = count_queries(client, url + "?exclude=lectures,has_access")
+
+    assert "lectures" in full_response.data
+    assert "lectures" not in response.data
+    assert "has_access" not in response.data
+    assert count < full_count
+
+
+# Given: 진행 중인 주문이 있을 때
+# When: 합계 필드만 선택하여 주문을 조회하면
+# Then: 주문 상품 쿼리 없이 집계된 합계를 응답해야 합니다.
+@pytest.mark.django_db
+def test_order_sparse_fields(courses, staff_user):
+    order = baker.make(Order, user=staff_user, order_status=Order.Status.PENDING)
+    for course in courses:
+        baker.make(OrderItem, order=order, course=course, quantity=1)
+    client = APIClient()
+    client.credentials(
+        HTTP_AUTHORIZATION=f"Bearer {token_service.generate_access_token(staff_user)}"
+    )
+    url = reverse("payments:order")
+    full_response, full_count = count_queries(client, url)
+    response, count = count_queries(
+        client, url + "?fields=id,get_total_items,get_total_price"
+    )
+
+    assert response.data == {
+        "id": order.id,
+        "get_total_items": 3,
+        "get_total_price": full_response.data["get_total_price"],
+    }
+    assert full_response.data["get_total_price"] == 3000
+    assert count < full_count
@@ -0,0 +1,63 @@
+import os
+import re
+import subprocess
+import sys
+
+from django.conf import settings
+
+# 워커 부팅 시(django.setup + URL 로딩) import되면 안 되는 무거운 미디어 코덱/클라우드 SDK입니다.
+HEAVY_MODULES = ("cv2", "numpy", "PIL", "ffmpeg", "boto3", "botocore")
+
+# 부팅 import 시간 예산(ms)입니다. 느린 환경에서는 IMPORT_TIME_BUDGET_MS로 조정합니다.
+IMPORT_TIME_BUDGET_MS = int(os.getenv("IMPORT_TIME_BUDGET_MS", "1500"))
+
+IMPORT_TIME_PATTERN = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def measure_boot_imports():
+    """
+    새 인터프리터에서 python -X importtime으로 django.setup()과 URL 로딩을 실행하고,
+    (import된 모듈 이름 집합, 최상위 import 누적 시간(ms))를 반환합니다.
+    """
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            "import django; django.setup(); import weaverse.urls",
+        ],
+        cwd=settings.BASE_DIR,
+        env={**os.environ, "DJANGO_SETTINGS_MODULE": "weaverse.settings"},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = set()
+    total_us = 0
+    for line in result.stderr.splitlines():
+        match = IMPORT_TIME_PATTERN.match(line)
+        if not match:
+            continue
+        _, cumulative, indent, name = match.groups()
+        modules.add(name)
+        if len(indent) == 1:
+            total_us += int(cumulative)
+    return modules, total_us / 1000
+
+
+# Given: 미디어 코덱과 클라우드 SDK를 사용하는 materials 앱이 있을 때
+# When: 워커처럼 django.setup()과 URL 로딩만 수행하면
+# Then: 무거운 모듈은 import되지 않고, import 시간이 예산 이내여야 합니다.
+def test_부팅_import_시간_예산():
+    modules, total_ms = measure_boot_imports()
+
+    loaded = sorted(
+        name
+        for name in modules
+        if any(name == heavy or name.startswith(f"{heavy}.") for heavy in HEAVY_MODULES)
+    )
+    assert not loaded, f"부팅 시 무거운 모듈이 import되었습니다: {loaded}"
+    assert (
+        total_ms <= IMPORT_TIME_BUDGET_MS
+    ), f"부팅 import 시간 {total_ms:.0f}ms가 예산 {IMPORT_TIME_BUDGET_MS}ms를 넘었습니다."
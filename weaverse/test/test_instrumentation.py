@@ -0,0 +1,171 @@
+import logging
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.urls import reverse
+from rest_framework import serializers, status
+from rest_framework.test import APIClient
+
+from courses.models import Course
+from weaverse.instrumentation import (
+    RequestMetrics,
+    current_metrics,
+    fingerprint_sql,
+    instrument_serializers,
+    metrics_registry,
+)
+
+User = get_user_model()
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    metrics_registry.reset()
+    yield
+    metrics_registry.reset()
+
+
+@pytest.fixture
+def staff_user(db):
+    return User.objects.create_staff(
+        email="staff@example.com", password="Pass1!", nickname="staff"
+    )
+
+
+@pytest.fixture
+def courses(staff_user):
+    return [
+        Course.objects.create(
+            title=f"Course {i}", author=staff_user, price=1000, description={}
+        )
+        for i in range(3)
+    ]
+
+
+# Given: 값만 다른 쿼리들이 있을 때
+# When: 쿼리 지문을 생성하면
+# Then: 같은 지문이 생성되어야 합니다.
+def test_fingerprint_sql():
+    assert fingerprint_sql(
+        "SELECT * FROM t WHERE id = 1 AND name = 'a'"
+    ) == fingerprint_sql("SELECT * FROM t WHERE id = 22 AND name = 'b''c'")
+    assert fingerprint_sql("SELECT * FROM t WHERE id IN (%s, %s)") == fingerprint_sql(
+        "SELECT * FROM t WHERE id IN (%s)"
+    )
+
+
+class ItemSerializer(serializers.Serializer):
+    name = serializers.CharField()
+
+
+class NestedItemSerializer(ItemSerializer):
+    items = ItemSerializer(many=True)
+
+
+# Given: 시리얼라이저 측정을 적용하고 요청 지표가 수집 중일 때
+# When: 중첩 시리얼라이저를 many=True로 직렬화하면
+# Then: 앱의 시리얼라이저를 수정하지 않아도 가장 바깥 호출의 시간만 한 번 집계해야 합니다.
+def test_시리얼라이저_시간_측정(monkeypatch):
+    instrument_serializers()
+    instrument_serializers()
+    assert serializers.BaseSerializer.data.fget._instrumented
+
+    items = [{"name": "a", "items": [{"name": "b"}]}] * 3
+    metrics = RequestMetrics()
+    token = current_metrics.set(metrics)
+    try:
+        ticks = iter([1.0, 1.5])
+        monkeypatch.setattr(
+            "weaverse.instrumentation.time.perf_counter", lambda: next(ticks)
+        )
+        data = NestedItemSerializer(items, many=True).data
+    finally:
+        current_metrics.reset(token)
+
+    assert data[0]["items"] == [{"name": "b"}]
+    assert metrics.serializer_time == 0.5
+    assert metrics.serializer_depth == 0
+
+
+# Given: 요청 지표가 수집 중이지 않을 때
+# When: 시리얼라이저를 직렬화하면
+# Then: 측정 없이 그대로 직렬화해야 합니다.
+def test_시리얼라이저_요청_밖에서는_측정하지_않음():
+    instrument_serializers()
+    assert ItemSerializer({"name": "a"}).data == {"name": "a"}
+
+
+# Given: 코스가 있을 때
+# When: 코스 목록을 조회하면
+# Then: Server-Timing 헤더와 구조화된 로그에 요청 지표가 포함되어야 합니다.
+@pytest.mark.django_db
+def test_server_timing_and_log(courses, caplog):
+    with caplog.at_level(logging.INFO, logger="weaverse.instrumentation"):
+        response = APIClient().get(reverse("courses:course-list"))
+    assert response.status_code == status.HTTP_200_OK
+
+    server_timing = response["Server-Timing"]
+    assert "db;dur=" in server_timing
+    assert "serializer;dur=" in server_timing
+    assert "total;dur=" in server_timing
+
+    record = caplog.records[-1]
+    assert record.route == "/api/courses/"
+    assert record.queries > 0
+    assert record.serializer_ms >= 0
+    # 가장 바깥 미들웨어이므로 압축 후 전송한 본문 크기를 기록합니다.
+    assert record.response_bytes == len(response.content)
+
+
+# Given: 요청 지표가 집계되었을 때
+# When: staff 사용자가 metrics 엔드포인트를 조회하면
+# Then: Prometheus 텍스트 형식의 히스토그램을 반환해야 합니다.
+@pytest.mark.django_db
+def test_metrics_endpoint_staff(courses, staff_user):
+    client = APIClient()
+    client.get(reverse("courses:course-list"))
+    client.force_authenticate(user=staff_user)
+    response = client.get(reverse("metrics"))
+    assert response.status_code == status.HTTP_200_OK
+    assert response["Content-Type"].startswith("text/plain; version=0.0.4")
+    body = response.content.decode()
+    assert "# TYPE weaverse_request_queries histogram" in body
+    assert (
+        'weaverse_request_duration_seconds_count{method="GET",route="/api/courses/",status="200"} 1'
+        in body
+    )
+
+
+# Given: 일반 사용자일 때
+# When: metrics 엔드포인트를 조회하면
+# Then: 권한 오류가 발생해야 합니다.
+@pytest.mark.django_db
+def test_metrics_endpoint_forbidden():
+    user = User.objects.create_user(
+        email="user@example.com", password="Pass1!", nickname="user"
+    )
+    client = APIClient()
+    client.force_authenticate(user=user)
+    response = client.get(reverse("metrics"))
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+# Given: DB 연결이 생성되고 커넥션 풀이 설정되어 있을 때
+# When: 지표를 출력하면
+# Then: 별칭별 연결 생성 수와 풀 상태 gauge가 포함되어야 합니다.
+def test_db_connection_and_pool_metrics(monkeypatch):
+    class StubPool:
+        def get_stats(self):
+            return {"pool_size": 4, "pool_available": 3, "requests_waiting": 0}
+
+    connection = connections["default"]
+    monkeypatch.setattr(connection, "pool", StubPool(), raising=False)
+    connection_created.send(sender=connection.__class__, connection=connection)
+
+    body = metrics_registry.render()
+    assert 'weaverse_db_connections_opened_total{alias="default"} 1' in body
+    assert "# TYPE weaverse_db_pool_pool_size gauge" in body
+    assert 'weaverse_db_pool_pool_size{alias="default"} 4' in body
+    assert 'weaverse_db_pool_requests_waiting{alias="default"} 0' in body
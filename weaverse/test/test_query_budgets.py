@@ -0,0 +1,794 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.urls import reverse
+from django.utils import timezone
+from model_bakery import baker
+from rest_framework.test import APIClient
+
+from courses.models import (
+    Assignment,
+    Course,
+    Curriculum,
+    Lecture,
+    MultipleChoiceQuestion,
+    MultipleChoiceQuestionChoice,
+    Topic,
+)
+from jwtauth.services import token_service
+from materials.models import Image, Video, VideoEventData
+from payments.models import (
+    Cart,
+    CartItem,
+    DailySalesRollup,
+    Order,
+    OrderItem,
+    Payment,
+    UserBillingAddress,
+)
+from weaverse.query_budget import (
+    EndpointCall,
+    QueryBudget,
+    QueryBudgetExceeded,
+    QueryBudgetRegistry,
+    iter_url_names,
+    query_budget,
+)
+
+User = get_user_model()
+
+# 데이터가 1건일 때와 한 페이지를 넘는 50건일 때의 쿼리 수를 비교합니다.
+DATA_SIZES = (1, 50)
+
+# 쿼리 예산을 확인하지 않는 엔드포인트와 그 이유입니다.
+EXEMPT_ENDPOINTS = {
+    ("payments:payment", "get"): "카카오페이 결제 승인 콜백 (외부 API 호출)",
+    ("payments:payment", "post"): "카카오페이 결제 준비 (외부 API 호출)",
+    ("payments:payment", "delete"): "카카오페이 결제 취소 (외부 API 호출)",
+    ("payments:payment-cancel", "get"): "카카오페이 결제 승인 콜백 (외부 API 호출)",
+    ("payments:payment-cancel", "post"): "카카오페이 결제 준비 (외부 API 호출)",
+    ("payments:payment-cancel", "delete"): "카카오페이 결제 취소 (외부 API 호출)",
+    ("google_login", "post"): "구글 OAuth 로그인 (외부 API 호출)",
+    ("materials:image-upload", "post"): "S3 업로드 (외부 API 호출)",
+    ("materials:image-detail", "put"): "S3 업로드 (외부 API 호출)",
+    ("materials:video-upload", "post"): "ffmpeg 처리와 S3 업로드 (외부 API 호출)",
+    ("materials:video-detail", "put"): "ffmpeg 처리와 S3 업로드 (외부 API 호출)",
+    ("payments:cart-list-create", "delete"): "상품 ID가 없는 URL (cart-item-delete)",
+    ("payments:cart-item-delete", "post"): "상품 ID가 있는 URL에서 처리하지 않음",
+    ("payments:billing-address-list-create", "put"): "주소 ID가 없는 URL",
+    ("payments:billing-address-list-create", "delete"): "주소 ID가 없는 URL",
+    ("payments:billing-address-detail", "post"): "주소 ID가 있는 URL에서 처리하지 않음",
+    ("schema", "get"): "API 문서 (DB 조회 없음)",
+    ("swagger-ui", "get"): "API 문서 (DB 조회 없음)",
+    ("redoc", "get"): "API 문서 (DB 조회 없음)",
+}
+
+budgets = QueryBudgetRegistry()
+
+
+def make_student():
+    return baker.make(User, is_staff=False, is_superuser=False)
+
+
+def make_tutor():
+    return baker.make(User, is_staff=True, is_superuser=False)
+
+
+def make_superuser():
+    return baker.make(User, is_staff=True, is_superuser=True)
+
+
+def make_course(author=None, **kwargs):
+    return baker.make(Course, author=author or make_tutor(), description={}, **kwargs)
+
+
+def make_course_tree(course, size):
+    """
+    size개의 강의와, 강의마다 과제/퀴즈/동영상 주제를 생성합니다.
+    """
+    for order in range(1, size + 1):
+        lecture = baker.make(Lecture, course=course, order=order)
+        assignment_topic = baker.make(
+            Topic, lecture=lecture, order=1, type="assignment"
+        )
+        baker.make(Assignment, topic=assignment_topic)
+        quiz_topic = baker.make(Topic, lecture=lecture, order=2, type="quiz")
+        question = baker.make(MultipleChoiceQuestion, topic=quiz_topic)
+        baker.make(MultipleChoiceQuestionChoice, question=question, _quantity=2)
+        video_topic = baker.make(Topic, lecture=lecture, order=3, type="video")
+        baker.make(Video, topic=video_topic)
+
+
+def make_video_lectures(course, size):
+    """
+    size개의 강의와, 강의마다 동영상 주제 1개를 생성합니다.
+    Django는 삭제 쿼리를 100행 단위로 나누어 실행하므로 주제가 100개를 넘지 않게 합니다.
+    """
+    for order in range(1, size + 1):
+        lecture = baker.make(Lecture, course=course, order=order)
+        baker.make(Video, topic=baker.make(Topic, lecture=lecture, order=1))
+
+
+def make_completed_payment(user, items=1):
+    order = baker.make(Order, user=user, order_status=Order.Status.COMPLETED)
+    for _ in range(items):
+        course = make_course()
+        baker.make(
+            OrderItem,
+            order=order,
+            course=course,
+            item_name=course.title,
+            unit_price=course.price,
+            total_price=course.price,
+        )
+    return baker.make(
+        Payment,
+        user=user,
+        order=order,
+        payment_status=Payment.Status.COMPLETED,
+        amount=1000,
+        paid_at=timezone.now(),
+    )
+
+
+@budgets.register("metrics", max_queries=1)
+def metrics(size):
+    return EndpointCall(user=make_superuser())
+
+
+@budgets.register("accounts:student-list", max_queries=3)
+def student_list(size):
+    baker.make(User, is_staff=False, _quantity=size)
+    return EndpointCall(user=make_student())
+
+
+@budgets.register("accounts:student-detail", max_queries=3)
+def student_detail(size):
+    student = make_student()
+    for _ in range(size):
+        make_tutor().students.add(student)
+    return EndpointCall(args=[student.id], user=student)
+
+
+@budgets.register("accounts:tutor-list", max_queries=3)
+def tutor_list(size):
+    baker.make(User, is_staff=True, _quantity=size)
+    return EndpointCall(user=make_superuser())
+
+
+@budgets.register("accounts:tutor-detail", max_queries=4)
+def tutor_detail(size):
+    tutor = make_tutor()
+    tutor.students.add(*baker.make(User, is_staff=False, _quantity=size))
+    return EndpointCall(args=[tutor.id], user=tutor)
+
+
+@budgets.register("jwks", max_queries=0)
+def jwks(size):
+    return EndpointCall()
+
+
+# 캐시 검증자(ETag, Last-Modified) 집계 쿼리 1개를 포함합니다.
+@budgets.register("courses:course-list", max_queries=3)
+def course_list(size):
+    tutor = make_tutor()
+    for _ in range(size):
+        make_course(author=tutor)
+    return EndpointCall()
+
+
+# 검색 결과를 카테고리, 난이도, 가격대로 묶는 집계 쿼리 1개입니다.
+@budgets.register("courses:course-facets", max_queries=1)
+def course_facets(size):
+    tutor = make_tutor()
+    for _ in range(size):
+        make_course(author=tutor)
+    return EndpointCall()
+
+
+@budgets.register("courses:course-detail", max_queries=9)
+def course_detail(size):
+    course = make_course()
+    make_course_tree(course, size)
+    return EndpointCall(args=[course.id], user=make_student())
+
+
+@budgets.register("courses:course-outline", max_queries=3)
+def course_outline(size):
+    course = make_course()
+    make_course_tree(course, size)
+    return EndpointCall(args=[course.id], user=make_student())
+
+
+@budgets.register("courses:topic-content", max_queries=3)
+def topic_content(size):
+    lecture = baker.make(Lecture, course=make_course(), order=1)
+    topic = baker.make(Topic, lecture=lecture, order=1, type="quiz")
+    question = baker.make(MultipleChoiceQuestion, topic=topic)
+    baker.make(MultipleChoiceQuestionChoice, question=question, _quantity=size)
+    return EndpointCall(args=[topic.id], user=make_student())
+
+
+@budgets.register("courses:curriculum-list", max_queries=3)
+def curriculum_list(size):
+    tutor = make_tutor()
+    for curriculum in baker.make(Curriculum, author=tutor, _quantity=size):
+        make_course(author=tutor, curriculum=curriculum)
+    return EndpointCall()
+
+
+@budgets.register("courses:curriculum-detail", max_queries=3)
+def curriculum_detail(size):
+    tutor = make_tutor()
+    curriculum = baker.make(Curriculum, author=tutor)
+    for _ in range(size):
+        make_course(author=tutor, curriculum=curriculum)
+    return EndpointCall(args=[curriculum.id])
+
+
+@budgets.register("materials:image-list-create", max_queries=3)
+def image_list(size):
+    user = make_student()
+    baker.make(Image, author=user, _quantity=size)
+    return EndpointCall(user=user)
+
+
+@budgets.register("materials:image-detail", max_queries=2)
+def image_detail(size):
+    user = make_student()
+    image = baker.make(Image, author=user, user=user)
+    return EndpointCall(args=[image.id], user=user)
+
+
+@budgets.register("materials:video-list", max_queries=3)
+def video_list(size):
+    course = make_course()
+    make_course_tree(course, size)
+    return EndpointCall(user=course.author)
+
+
+@budgets.register("materials:video-detail", max_queries=2)
+def video_detail(size):
+    video = baker.make(Video, course=make_course())
+    return EndpointCall(args=[video.id], user=make_superuser())
+
+
+@budgets.register("materials:video-event-list", max_queries=3)
+def video_event_list(size):
+    student = make_student()
+    video = baker.make(Video, course=make_course())
+    baker.make(
+        VideoEventData,
+        user=student,
+        video=video,
+        event_type="pause",
+        duration=100,
+        current_time=10,
+        _quantity=size,
+    )
+    return EndpointCall(args=[student.id, video.id], user=make_superuser())
+
+
+@budgets.register("materials:video-event-detail", max_queries=3)
+def video_event_detail(size):
+    student = make_student()
+    video = baker.make(Video, course=make_course())
+    event = baker.make(
+        VideoEventData,
+        user=student,
+        video=video,
+        event_type="pause",
+        duration=100,
+        current_time=10,
+    )
+    return EndpointCall(args=[student.id, video.id, event.id], user=make_superuser())
+
+
+# 장바구니 총 수량과 총액 집계 쿼리 2개를 포함합니다.
+@budgets.register("payments:cart-list-create", max_queries=5)
+def cart_detail(size):
+    student = make_student()
+    cart = baker.make(Cart, user=student)
+    for _ in range(size):
+        baker.make(CartItem, cart=cart, course=make_course())
+    return EndpointCall(user=student)
+
+
+@budgets.register("payments:cart-item-delete", max_queries=5)
+def cart_item_detail(size):
+    student = make_student()
+    cart = baker.make(Cart, user=student)
+    items = [baker.make(CartItem, cart=cart, course=make_course()) for _ in range(size)]
+    return EndpointCall(args=[items[0].id], user=student)
+
+
+@budgets.register("payments:order", max_queries=3)
+def pending_order(size):
+    student = make_student()
+    order = baker.make(Order, user=student, order_status=Order.Status.PENDING)
+    for _ in range(size):
+        course = make_course()
+        baker.make(
+            OrderItem,
+            order=order,
+            course=course,
+            item_name=course.title,
+            unit_price=course.price,
+            total_price=course.price,
+        )
+    return EndpointCall(user=student)
+
+
+@budgets.register("payments:billing-address-list-create", max_queries=2)
+def billing_address_list(size):
+    student = make_student()
+    baker.make(UserBillingAddress, user=student, _quantity=size)
+    return EndpointCall(user=student)
+
+
+@budgets.register("payments:billing-address-detail", max_queries=2)
+def billing_address_detail(size):
+    student = make_student()
+    address = baker.make(UserBillingAddress, user=student)
+    return EndpointCall(args=[address.id], user=student)
+
+
+@budgets.register("payments:receipt-list", max_queries=3)
+def receipt_list(size):
+    student = make_student()
+    for _ in range(size):
+        make_completed_payment(student)
+    return EndpointCall(user=student)
+
+
+@budgets.register("payments:receipt-detail", max_queries=4)
+def receipt_detail(size):
+    student = make_student()
+    payment = make_completed_payment(student, items=size)
+    return EndpointCall(args=[payment.id], user=student)
+
+
+@budgets.register("payments:sales-analytics", max_queries=3)
+def sales_analytics(size):
+    today = timezone.localdate()
+    for days in range(size):
+        baker.make(
+            DailySalesRollup,
+            date=today - timezone.timedelta(days=days),
+            dimension=DailySalesRollup.Dimension.CATEGORY,
+            dimension_key=f"category-{size}",
+        )
+    return EndpointCall(user=make_superuser())
+
+
+PASSWORD = "Password1!"
+
+
+def make_password_user():
+    number = User.objects.count()
+    return User.objects.create_user(
+        email=f"user-{number}@example.com",
+        password=PASSWORD,
+        nickname=f"user-{number}",
+    )
+
+
+def get_course_data():
+    return {
+        "title": "course",
+        "short_description": "course",
+        "description": {},
+        "category": "Python",
+        "skill_level": "beginner",
+        "price": 1000,
+        "video_id": 0,
+        "thumbnail_id": 0,
+        "lectures": [
+            {
+                "title": "lecture",
+                "order": 1,
+                "topics": [
+                    {
+                        "title": "quiz",
+                        "type": "quiz",
+                        "order": 1,
+                        "is_premium": False,
+                        "multiple_choice_question": {
+                            "question": "question",
+                            "multiple_choice_question_choices": [
+                                {"choice": "choice 1", "is_correct": True},
+                                {"choice": "choice 2", "is_correct": False},
+                            ],
+                        },
+                    },
+                    {
+                        "title": "assignment",
+                        "type": "assignment",
+                        "order": 2,
+                        "is_premium": False,
+                        "assignment": {"question": "question"},
+                    },
+                ],
+            }
+        ],
+    }
+
+
+def get_user_data(user):
+    return {
+        "email": user.email,
+        "nickname": f"new-{user.id}",
+        "password": PASSWORD,
+        "confirm_password": PASSWORD,
+    }
+
+
+@budgets.register("accounts:student-register", max_queries=4, method="post")
+def student_register(size):
+    baker.make(User, _quantity=size)
+    number = User.objects.count()
+    return EndpointCall(
+        data={
+            "email": f"new-{number}@example.com",
+            "nickname": f"new-{number}",
+            "password": PASSWORD,
+            "confirm_password": PASSWORD,
+        }
+    )
+
+
+@budgets.register("accounts:password-reset", max_queries=4, method="post")
+def password_reset(size):
+    return EndpointCall(
+        user=make_password_user(),
+        data={
+            "current_password": PASSWORD,
+            "new_password": "NewPassword1!",
+            "confirm_new_password": "NewPassword1!",
+        },
+    )
+
+
+@budgets.register("accounts:student-detail", max_queries=10, method="put")
+@budgets.register("accounts:student-detail", max_queries=10, method="patch")
+def student_update(size):
+    student = make_student()
+    for _ in range(size):
+        make_tutor().students.add(student)
+    return EndpointCall(args=[student.id], user=student, data=get_user_data(student))
+
+
+@budgets.register("accounts:student-detail", max_queries=7, method="delete")
+def student_delete(size):
+    student = make_student()
+    for _ in range(size):
+        make_tutor().students.add(student)
+    return EndpointCall(args=[student.id], user=student)
+
+
+@budgets.register("accounts:tutor-detail", max_queries=11, method="put")
+@budgets.register("accounts:tutor-detail", max_queries=11, method="patch")
+def tutor_update(size):
+    tutor = make_tutor()
+    tutor.students.add(*baker.make(User, is_staff=False, _quantity=size))
+    return EndpointCall(args=[tutor.id], user=tutor, data=get_user_data(tutor))
+
+
+@budgets.register("accounts:tutor-detail", max_queries=7, method="delete")
+def tutor_delete(size):
+    tutor = make_tutor()
+    tutor.students.add(*baker.make(User, is_staff=False, _quantity=size))
+    return EndpointCall(args=[tutor.id], user=tutor)
+
+
+# 사용자 역할 조회, 기존 관계 조회, 일괄 삽입 쿼리는 쌍의 수와 관계없이 1개씩입니다.
+@budgets.register("accounts:student-bulk-enrollment", max_queries=7, method="post")
+def student_bulk_enrollment(size):
+    tutor = make_tutor()
+    students = baker.make(User, is_staff=False, _quantity=size)
+    return EndpointCall(
+        user=tutor,
+        data={
+            "pairs": [
+                {"tutor_id": tutor.id, "student_id": student.id} for student in students
+            ]
+        },
+    )
+
+
+@budgets.register("login", max_queries=1, method="post")
+def login(size):
+    user = make_password_user()
+    return EndpointCall(data={"email": user.email, "password": PASSWORD})
+
+
+@budgets.register("logout", max_queries=5, method="post")
+def logout(size):
+    user = make_student()
+    return EndpointCall(
+        user=user, data={"refresh_token": token_service.generate_refresh_token(user)}
+    )
+
+
+@budgets.register("refresh", max_queries=4, method="post")
+def refresh(size):
+    user = make_student()
+    return EndpointCall(
+        data={"refresh_token": token_service.generate_refresh_token(user)}
+    )
+
+
+@budgets.register("courses:course-list", max_queries=31, method="post")
+def course_create(size):
+    tutor = make_tutor()
+    for _ in range(size):
+        make_course(author=tutor)
+    return EndpointCall(user=tutor, data=get_course_data())
+
+
+@budgets.register("courses:course-detail", max_queries=42, method="put")
+@budgets.register("courses:course-detail", max_queries=42, method="patch")
+def course_update(size):
+    course = make_course()
+    make_video_lectures(course, size)
+    return EndpointCall(args=[course.id], user=course.author, data=get_course_data())
+
+
+@budgets.register("courses:course-detail", max_queries=26, method="delete")
+def course_delete(size):
+    course = make_course(curriculum=baker.make(Curriculum))
+    make_video_lectures(course, size)
+    return EndpointCall(args=[course.id], user=course.author)
+
+
+def get_curriculum_data(size):
+    tutor = make_tutor()
+    courses = [make_course(author=tutor) for _ in range(size)]
+    return tutor, {
+        "name": "curriculum",
+        "description": "curriculum",
+        "price": 1000,
+        "courses_ids": [course.id for course in courses],
+    }
+
+
+@budgets.register("courses:curriculum-list", max_queries=11, method="post")
+def curriculum_create(size):
+    tutor, data = get_curriculum_data(size)
+    return EndpointCall(user=tutor, data=data)
+
+
+@budgets.register("courses:curriculum-detail", max_queries=16, method="put")
+@budgets.register("courses:curriculum-detail", max_queries=16, method="patch")
+def curriculum_update(size):
+    tutor, data = get_curriculum_data(size)
+    curriculum = baker.make(Curriculum, author=tutor)
+    return EndpointCall(args=[curriculum.id], user=tutor, data=data)
+
+
+@budgets.register("courses:curriculum-detail", max_queries=13, method="delete")
+def curriculum_delete(size):
+    tutor = make_tutor()
+    curriculum = baker.make(Curriculum, author=tutor)
+    for _ in range(size):
+        make_course(author=tutor, curriculum=curriculum)
+    return EndpointCall(args=[curriculum.id], user=tutor)
+
+
+@budgets.register("materials:image-detail", max_queries=4, method="patch")
+@budgets.register("materials:image-detail", max_queries=4, method="delete")
+def image_update(size):
+    user = make_student()
+    baker.make(Image, author=user, _quantity=size)
+    image = baker.make(Image, author=user, user=user)
+    return EndpointCall(args=[image.id], user=user, data={})
+
+
+@budgets.register("materials:video-detail", max_queries=4, method="patch")
+def video_update(size):
+    course = make_course()
+    make_course_tree(course, size)
+    video = Video.objects.filter(topic__lecture__course=course).first()
+    return EndpointCall(args=[video.id], user=make_superuser(), data={})
+
+
+@budgets.register("materials:video-detail", max_queries=6, method="delete")
+def video_delete(size):
+    course = make_course()
+    make_course_tree(course, size)
+    video = Video.objects.filter(topic__lecture__course=course).first()
+    return EndpointCall(args=[video.id], user=make_superuser())
+
+
+@budgets.register("materials:video-event-data", max_queries=6, method="post")
+def video_event_create(size):
+    student = make_student()
+    video = baker.make(Video, course=make_course())
+    baker.make(
+        VideoEventData,
+        user=student,
+        video=video,
+        event_type="pause",
+        duration=100,
+        current_time=10,
+        _quantity=size,
+    )
+    return EndpointCall(
+        args=[student.id, video.id],
+        user=student,
+        data={
+            "video": video.id,
+            "video_id": video.id,
+            "video_url": video.url,
+            "duration": 100,
+            "current_time": 10,
+            "event_type": "pause",
+        },
+    )
+
+
+@budgets.register("payments:cart-list-create", max_queries=9, method="post")
+def cart_add(size):
+    student = make_student()
+    cart = baker.make(Cart, user=student)
+    for _ in range(size):
+        baker.make(CartItem, cart=cart, course=make_course())
+    return EndpointCall(user=student, data={"course": make_course().id})
+
+
+@budgets.register("payments:cart-item-delete", max_queries=5, method="delete")
+def cart_item_delete(size):
+    student = make_student()
+    cart = baker.make(Cart, user=student)
+    items = [baker.make(CartItem, cart=cart, course=make_course()) for _ in range(size)]
+    return EndpointCall(args=[items[0].id], user=student)
+
+
+# 장바구니 총액 50,000원 제한을 넘지 않도록 코스 가격을 낮게 둡니다.
+@budgets.register(
+    "payments:order",
+    max_queries=22,
+    method="post",
+    known_issue="알려진 N+1: 장바구니 상품마다 주문 상품을 시리얼라이저로 검증하고 저장합니다.",
+)
+def checkout(size):
+    student = make_student()
+    cart = baker.make(Cart, user=student)
+    for _ in range(size):
+        baker.make(CartItem, cart=cart, course=make_course(price=100))
+    return EndpointCall(user=student, data={"from_cart": True})
+
+
+def get_billing_address_data():
+    return {
+        "country": "KR",
+        "main_address": "main",
+        "detail_address": "detail",
+        "postal_code": "12345",
+    }
+
+
+@budgets.register("payments:billing-address-list-create", max_queries=5, method="post")
+def billing_address_create(size):
+    student = make_student()
+    baker.make(UserBillingAddress, user=student, _quantity=size)
+    return EndpointCall(user=student, data=get_billing_address_data())
+
+
+@budgets.register("payments:billing-address-detail", max_queries=4, method="put")
+@budgets.register("payments:billing-address-detail", max_queries=5, method="delete")
+def billing_address_update(size):
+    student = make_student()
+    addresses = baker.make(UserBillingAddress, user=student, _quantity=size)
+    return EndpointCall(
+        args=[addresses[0].id], user=student, data=get_billing_address_data()
+    )
+
+
+def request(call, url_name, method):
+    """
+    EndpointCall의 사용자로 인증하여 엔드포인트를 요청합니다.
+    """
+    # 인증 사용자 캐시 적중 여부에 따라 쿼리 수가 달라지지 않도록 캐시를 비웁니다.
+    cache.clear()
+    client = APIClient()
+    if call.user is not None:
+        token = token_service.generate_access_token(call.user)
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+    url = reverse(url_name, args=call.args)
+    if method == "get":
+        return client.get(url, data=call.data)
+    return getattr(client, method)(url, data=call.data, format="json")
+
+
+def get_budget_params():
+    """
+    known_issue가 있는 예산은 고쳐질 때까지 xfail(strict)로 표시합니다.
+    """
+    return [
+        pytest.param(
+            budget,
+            id=str(budget),
+            marks=(
+                [pytest.mark.xfail(reason=budget.known_issue, strict=True)]
+                if budget.known_issue
+                else []
+            ),
+        )
+        for budget in budgets
+    ]
+
+
+# Given: 프로젝트의 모든 URL 패턴이 있을 때
+# When: 엔드포인트가 처리하는 HTTP 메서드를 확인하면
+# Then: 모두 쿼리 예산이 등록되어 있거나 예외 목록에 있어야 합니다.
+def test_모든_엔드포인트에_쿼리_예산_등록():
+    unbudgeted = [
+        f"{method.upper()} {url_name}"
+        for url_name, methods in iter_url_names()
+        for method in methods
+        if (url_name, method) not in budgets
+        and (url_name, method) not in EXEMPT_ENDPOINTS
+    ]
+    assert not unbudgeted, f"쿼리 예산이 없는 엔드포인트: {unbudgeted}"
+
+
+# Given: 엔드포인트별 쿼리 예산과 데이터 생성 함수가 있을 때
+# When: 데이터가 1건일 때와 50건일 때 각각 요청하면
+# Then: 쿼리 수가 예산 이내이고, 데이터 규모에 따라 늘어나지 않아야 합니다.
+@pytest.mark.django_db
+@pytest.mark.parametrize("budget", get_budget_params())
+def test_엔드포인트_쿼리_예산(budget):
+    counts = []
+    for size in DATA_SIZES:
+        call = budget.factory(size)
+        # 최초 요청에서만 실행되는 쿼리(카운터 보정 등)를 제외하기 위해 한 번 먼저 요청합니다.
+        # 수정 요청은 데이터를 바꾸므로 새로 만든 데이터로 먼저 요청합니다.
+        request(call, budget.url_name, budget.method)
+        if budget.method != "get":
+            call = budget.factory(size)
+        with QueryBudget(budget.max_queries, label=f"{budget} (데이터 {size}건)") as q:
+            response = request(call, budget.url_name, budget.method)
+        assert response.status_code < 400, response.content
+        counts.append(q.count)
+
+    assert counts[0] == counts[-1], (
+        f"{budget}: 데이터 규모에 따라 쿼리 수가 늘어났습니다. "
+        f"({DATA_SIZES[0]}건: {counts[0]}개, {DATA_SIZES[-1]}건: {counts[-1]}개)"
+    )
+
+
+# Given: 같은 형태의 쿼리를 반복 실행하는 코드가 있을 때
+# When: 예산보다 많은 쿼리를 실행하면
+# Then: 반복 실행된 쿼리 지문을 포함한 QueryBudgetExceeded가 발생해야 합니다.
+@pytest.mark.django_db
+def test_쿼리_예산_초과(query_budget):
+    users = baker.make(User, _quantity=3)
+
+    with pytest.raises(QueryBudgetExceeded) as exc_info:
+        with query_budget(2):
+            for user in users:
+                User.objects.get(id=user.id)
+
+    message = str(exc_info.value)
+    assert "쿼리 3개 실행 (예산 2개)" in message
+    assert "3x SELECT" in message
+
+
+# Given: 쿼리 예산 데코레이터를 적용한 함수가 있을 때
+# When: 예산 이내로 쿼리를 실행하면
+# Then: 함수의 반환값을 그대로 반환해야 합니다.
+@pytest.mark.django_db
+def test_쿼리_예산_데코레이터():
+    @query_budget(1)
+    def count_users():
+        return User.objects.count()
+
+    assert count_users() == 0
+
+    @query_budget(0)
+    def count_users_over_budget():
+        return User.objects.count()
+
+    with pytest.raises(QueryBudgetExceeded):
+        count_users_over_budget()
@@ -0,0 +1,94 @@
+import datetime
+import io
+import uuid
+from decimal import Decimal
+
+import pytest
+from django.conf import settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.settings import api_settings
+from rest_framework.test import APIClient
+
+from weaverse.parsers import OrJSONParser
+from weaverse.renderers import OrJSONRenderer
+
+
+@pytest.fixture
+def payload():
+    return {
+        "id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+        "price": Decimal("12000.50"),
+        "created_at": datetime.datetime(
+            2024, 10, 1, 9, 30, 15, 123456, tzinfo=datetime.timezone.utc
+        ),
+        "local_time": timezone.make_aware(datetime.datetime(2024, 10, 1, 18, 30)),
+        "date": datetime.date(2024, 10, 1),
+        "duration": datetime.timedelta(minutes=3),
+        "title": "코스 제목\u2028줄바꿈",
+        "tags": ("python", "django"),
+        1: "숫자 키",
+        "nested": [{"is_correct": True, "score": None}],
+    }
+
+
+# Given: datetime, Decimal, UUID 등이 포함된 응답 데이터가 있을 때
+# When: OrJSONRenderer로 렌더링하면
+# Then: 표준 JSONRenderer와 같은 결과를 반환해야 합니다.
+def test_render_표준_렌더러와_같은_결과(payload):
+    assert OrJSONRenderer().render(payload) == JSONRenderer().render(payload)
+
+
+# Given: 들여쓰기를 요청한 Accept 헤더가 있을 때
+# When: 렌더링하면
+# Then: 표준 JSONRenderer와 같은 들여쓰기 결과를 반환해야 합니다.
+def test_render_indent(payload):
+    media_type = "application/json; indent=4"
+    assert OrJSONRenderer().render(payload, media_type) == JSONRenderer().render(
+        payload, media_type
+    )
+
+
+# Given: 빈 응답(None)이 있을 때
+# When: 렌더링하면
+# Then: 빈 바이트열을 반환해야 합니다.
+def test_render_none():
+    assert OrJSONRenderer().render(None) == b""
+
+
+# Given: JSON 요청 본문이 있을 때
+# When: OrJSONParser로 파싱하면
+# Then: 파이썬 객체로 변환되고, 잘못된 JSON은 ParseError가 발생해야 합니다.
+def test_parse():
+    parser = OrJSONParser()
+    body = '{"title": "코스", "price": 1000, "ids": [1, 2]}'.encode()
+    assert parser.parse(io.BytesIO(body)) == {
+        "title": "코스",
+        "price": 1000,
+        "ids": [1, 2],
+    }
+    with pytest.raises(ParseError):
+        parser.parse(io.BytesIO(b'{"title": '))
+    with pytest.raises(ParseError):
+        parser.parse(io.BytesIO(b'{"price": NaN}'))
+
+
+# Given: DEBUG가 아닌 환경일 때
+# When: 브라우저의 Accept 헤더로 API를 요청하면
+# Then: Browsable API 대신 JSON을 응답해야 합니다.
+@pytest.mark.django_db
+def test_browsable_api_비활성화():
+    assert settings.DEBUG is False
+    assert [
+        renderer.__name__ for renderer in api_settings.DEFAULT_RENDERER_CLASSES
+    ] == ["OrJSONRenderer"]
+
+    response = APIClient().get(
+        reverse("courses:course-list"),
+        HTTP_ACCEPT="text/html,application/xhtml+xml,*/*;q=0.8",
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response["Content-Type"] == "application/json"
@@ -0,0 +1,86 @@
+import runpy
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.db.utils import ConnectionHandler
+
+import weaverse.settings
+
+
+def load_settings(monkeypatch, **environ):
+    """
+    환경 변수를 바꾼 상태로 settings 모듈을 다시 실행하고 설정 값을 반환합니다.
+    """
+    for key, value in environ.items():
+        monkeypatch.setenv(key, value)
+    return runpy.run_path(weaverse.settings.__file__)
+
+
+# Given: PostgreSQL에서 DATABASE_POOL=True로 설정했을 때
+# When: default 연결의 커넥션 풀을 생성하면
+# Then: 설정한 크기와 연결 상태 확인(check_connection)으로 풀이 만들어져야 합니다.
+def test_커넥션_풀_설정(monkeypatch):
+    psycopg_pool = pytest.importorskip("psycopg_pool")
+    settings = load_settings(
+        monkeypatch,
+        DATABASE_ENGINE="django.db.backends.postgresql",
+        DATABASE_NAME="weaverse",
+        DATABASE_POOL="True",
+        DATABASE_POOL_MIN_SIZE="1",
+        DATABASE_POOL_MAX_SIZE="4",
+    )
+    connection = ConnectionHandler(settings["DATABASES"])["default"]
+
+    try:
+        pool = connection.pool
+        assert isinstance(pool, psycopg_pool.ConnectionPool)
+        assert (pool.min_size, pool.max_size) == (1, 4)
+        assert pool._check == psycopg_pool.ConnectionPool.check_connection
+    finally:
+        connection.close_pool()
+
+
+# Given: 기본 설정일 때
+# When: settings를 불러오면
+# Then: 풀 없이 지속 연결과 연결 상태 확인을 사용해야 합니다.
+def test_지속_연결_설정(monkeypatch):
+    monkeypatch.delenv("DATABASE_POOL", raising=False)
+    settings = load_settings(monkeypatch, DATABASE_CONN_MAX_AGE="60")
+
+    database = settings["DATABASES"]["default"]
+    assert database["CONN_MAX_AGE"] == 60
+    assert database["CONN_HEALTH_CHECKS"] is True
+    assert "pool" not in database.get("OPTIONS", {})
+
+
+# Given: SHARED_CACHE_URL을 지정했을 때
+# When: settings를 불러오면
+# Then: worker 간에 공유되는 shared 캐시가 Redis로 설정되어야 합니다.
+def test_공유_캐시_설정(monkeypatch):
+    settings = load_settings(monkeypatch, SHARED_CACHE_URL="redis://cache:6379/0")
+
+    assert settings["CACHES"]["shared"] == {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": "redis://cache:6379/0",
+    }
+    assert settings["DATABASE_STICKY_CACHE_ALIAS"] == "shared"
+
+
+# Given: 존재하지 않는 비밀번호 해시 프로필을 지정했을 때
+# When: settings를 불러오면
+# Then: 사용 가능한 프로필을 안내하는 ImproperlyConfigured가 발생해야 합니다.
+def test_알_수_없는_해시_프로필(monkeypatch):
+    with pytest.raises(ImproperlyConfigured, match="pbkdf2, scrypt"):
+        load_settings(monkeypatch, PASSWORD_HASHER_PROFILE="bcrypt")
+
+
+# Given: argon2-cffi 패키지가 설치되지 않았을 때
+# When: settings를 불러오면
+# Then: argon2 프로필은 선택할 수 없어야 합니다.
+def test_argon2_프로필_선택_의존성(monkeypatch):
+    monkeypatch.setattr("importlib.util.find_spec", lambda name: None)
+    settings = load_settings(monkeypatch)
+
+    assert "argon2" not in settings["PASSWORD_HASHER_PROFILES"]
+    with pytest.raises(ImproperlyConfigured, match="argon2"):
+        load_settings(monkeypatch, PASSWORD_HASHER_PROFILE="argon2")
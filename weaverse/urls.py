@@ -7,8 +7,11 @@ from drf_spectacular.views import (
     SpectacularSwaggerView,
 )
 
+from .instrumentation import MetricsView
+
 urlpatterns = [
     path("admin/", admin.site.urls),
+    path("metrics/", MetricsView.as_view(), name="metrics"),
     path("api/", include("accounts.urls")),
     path("api/", include("jwtauth.urls")),
     path("api/", include("courses.urls")),